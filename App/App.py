@@ -6,7 +6,6 @@ import streamlit as st # core package used in this project
 import pandas as pd
 import base64, random
 import time,datetime
-import pymysql
 import os
 import socket
 import platform
@@ -17,60 +16,61 @@ import plotly.express as px # to create visualisations at the admin session
 import plotly.graph_objects as go
 from geopy.geocoders import Nominatim
 # libraries used to parse the pdf files
-from pyresparser import ResumeParser
-from pdfminer3.layout import LAParams, LTTextBox
-from pdfminer3.pdfpage import PDFPage
-from pdfminer3.pdfinterp import PDFResourceManager
-from pdfminer3.pdfinterp import PDFPageInterpreter
-from pdfminer3.converter import TextConverter
+from pyresparser import models as resparser_models
 from streamlit_tags import st_tags
 from PIL import Image
 # pre stored data for prediction purposes
 from Courses import ds_course,web_course,android_course,ios_course,uiux_course,resume_videos,interview_videos
 import nltk
 nltk.download('stopwords')
-import spacy
-import gc
-from spacy.matcher import Matcher
 # Import the improved resume scorer
 # from resume_scorer import ResumeScorer
 # Import the improved resume analysis
 # from improved_resume_analysis import display_improved_resume_analysis
 
-# Import job recommendation module
-from job_recommendation import get_global_jobs, get_nepal_jobs
+# Pooled MySQL connections and the schema, shared by every session
+import db
+# Resume analysis stages (parsing, scoring, level, field and jobs), cached on the uploaded bytes
+import analysis_pipeline
+# Admin dashboard counts grouped by MySQL, cached for a minute
+from analytics import default_analytics as analytics
+# Paginated user_data browser and chunked exports for the admin side
+import user_browser
 
 
 ###### Preprocessing functions ######
 
 
-# Generates a link allowing the data in a given panda dataframe to be downloaded in csv format 
-def get_csv_download_link(df,filename,text):
-    csv = df.to_csv(index=False)
-    ## bytes conversions
-    b64 = base64.b64encode(csv.encode()).decode()      
-    href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">{text}</a>'
-    return href
+# Stages of the upload pipeline with the message shown while each one runs
+UPLOAD_STAGES = analysis_pipeline.STAGES
 
 
-# Reads Pdf file and check_extractable
-def pdf_reader(file):
-    resource_manager = PDFResourceManager()
-    fake_file_handle = io.StringIO()
-    converter = TextConverter(resource_manager, fake_file_handle, laparams=LAParams())
-    page_interpreter = PDFPageInterpreter(resource_manager, converter)
-    with open(file, 'rb') as fh:
-        for page in PDFPage.get_pages(fh,
-                                      caching=True,
-                                      check_extractable=True):
-            page_interpreter.process_page(page)
-            print(page)
-        text = fake_file_handle.getvalue()
+# Returns a callback that moves a progress bar to the start of the named stage ('done' fills it)
+def stage_progress():
+    bar = st.progress(0)
+    status = st.empty()
+    stage_names = [name for name, _ in UPLOAD_STAGES]
 
-    ## close open handles
-    converter.close()
-    fake_file_handle.close()
-    return text
+    def on_stage(stage):
+        if stage == 'done':
+            bar.progress(100)
+            status.empty()
+            return
+        index = stage_names.index(stage)
+        bar.progress(int(100 * index / len(UPLOAD_STAGES)))
+        status.text(UPLOAD_STAGES[index][1])
+
+    return on_stage
+
+
+# Message, st_tags key and course list shown for each field predicted by analysis_pipeline
+FIELD_DISPLAY = {
+    'Data Science': ("** Our analysis says you are looking for Data Science Jobs.**", '2', ds_course),
+    'Web Development': ("** Our analysis says you are looking for Web Development Jobs **", '3', web_course),
+    'Android Development': ("** Our analysis says you are looking for Android App Development Jobs **", '4', android_course),
+    'IOS Development': ("** Our analysis says you are looking for IOS App Development Jobs **", '5', ios_course),
+    'UI-UX Development': ("** Our analysis says you are looking for UI-UX Development Jobs **", '6', uiux_course),
+}
 
 
 # show uploaded file path to view pdf_display
@@ -101,19 +101,16 @@ def course_recommender(course_list):
 ###### Database Stuffs ######
 
 
-# sql connector
-connection = pymysql.connect(host='localhost',user='root',password='',db='cv')
-cursor = connection.cursor()
+# connections are borrowed from the process-wide pool in db.py; creating it bootstraps
+# the database and tables once per process instead of on every rerun
+db.pool()
 
 
 # inserting miscellaneous data, fetched results, prediction and recommendation into user_data table
+# queued for the background writer, so rendering never waits on a commit; a repeated sec_token is skipped
 def insert_data(sec_token,ip_add,host_name,dev_user,os_name_ver,latlong,city,state,country,act_name,act_mail,act_mob,name,email,res_score,timestamp,no_of_pages,reco_field,cand_level,skills,recommended_skills,courses,pdf_name):
-    DB_table_name = 'user_data'
-    insert_sql = "insert into " + DB_table_name + """
-    values (0,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)"""
-    rec_values = (str(sec_token),str(ip_add),host_name,dev_user,os_name_ver,str(latlong),city,state,country,act_name,act_mail,act_mob,name,email,str(res_score),timestamp,str(no_of_pages),reco_field,cand_level,skills,recommended_skills,courses,pdf_name)
-    cursor.execute(insert_sql, rec_values)
-    connection.commit()
+    rec_values = (str(sec_token),str(ip_add),host_name,dev_user,os_name_ver,str(latlong),city,state,country,act_name,act_mail,act_mob,name,email,res_score,timestamp,no_of_pages,reco_field,cand_level,skills,recommended_skills,courses,pdf_name)
+    db.user_data_writer().submit(rec_values)
 
 
 # inserting feedback data into user_feedback table
@@ -122,8 +119,9 @@ def insertf_data(feed_name,feed_email,feed_score,comments,Timestamp):
     insertfeed_sql = "insert into " + DBf_table_name + """
     values (0,%s,%s,%s,%s,%s)"""
     rec_values = (feed_name, feed_email, feed_score, comments, Timestamp)
-    cursor.execute(insertfeed_sql, rec_values)
-    connection.commit()
+    db.execute(insertfeed_sql, rec_values)
+    # show the new rating right away instead of after the cache expires
+    analytics.clear()
 
 
 ###### Setting Page Configuration (favicon, Logo, Title) ######
@@ -135,6 +133,23 @@ st.set_page_config(
 )
 
 
+###### Loading NLP Models ######
+
+
+# spaCy pipelines live in the pyresparser model registry; the singleton makes the
+# load and warm-up run once per process instead of on every Streamlit rerun. Both the
+# spinner and the error draw elements, so this has to come after set_page_config
+@st.experimental_singleton(show_spinner=False)
+def load_nlp_models():
+    return resparser_models.preload()
+
+
+try:
+    load_nlp_models()
+except OSError:
+    st.error("spaCy model 'en_core_web_sm' not found. Please install it using: python -m spacy download en_core_web_sm")
+
+
 ###### Main function run() ######
 
 
@@ -147,61 +162,6 @@ def run():
     activities = ["User", "Feedback", "About", "Admin", "Job Recommendations"]
     choice = st.sidebar.selectbox("Choose among the given options:", activities)
 
-    ###### Creating Database and Table ######
-
-
-    # Create the DB
-    db_sql = """CREATE DATABASE IF NOT EXISTS CV;"""
-    cursor.execute(db_sql)
-
-
-    # Create table user_data and user_feedback
-    DB_table_name = 'user_data'
-    table_sql = "CREATE TABLE IF NOT EXISTS " + DB_table_name + """
-                    (ID INT NOT NULL AUTO_INCREMENT,
-                    sec_token varchar(20) NOT NULL,
-                    ip_add varchar(50) NULL,
-                    host_name varchar(50) NULL,
-                    dev_user varchar(50) NULL,
-                    os_name_ver varchar(50) NULL,
-                    latlong varchar(50) NULL,
-                    city varchar(50) NULL,
-                    state varchar(50) NULL,
-                    country varchar(50) NULL,
-                    act_name varchar(50) NOT NULL,
-                    act_mail varchar(50) NOT NULL,
-                    act_mob varchar(20) NOT NULL,
-                    Name varchar(500) NOT NULL,
-                    Email_ID VARCHAR(500) NOT NULL,
-                    resume_score VARCHAR(8) NOT NULL,
-                    Timestamp VARCHAR(50) NOT NULL,
-                    Page_no VARCHAR(5) NOT NULL,
-                    Predicted_Field BLOB NOT NULL,
-                    User_level BLOB NOT NULL,
-                    Actual_skills BLOB NOT NULL,
-                    Recommended_skills BLOB NOT NULL,
-                    Recommended_courses BLOB NOT NULL,
-                    pdf_name varchar(50) NOT NULL,
-                    PRIMARY KEY (ID)
-                    );
-                """
-    cursor.execute(table_sql)
-
-
-    DBf_table_name = 'user_feedback'
-    tablef_sql = "CREATE TABLE IF NOT EXISTS " + DBf_table_name + """
-                    (ID INT NOT NULL AUTO_INCREMENT,
-                        feed_name varchar(50) NOT NULL,
-                        feed_email VARCHAR(50) NOT NULL,
-                        feed_score VARCHAR(5) NOT NULL,
-                        comments VARCHAR(100) NULL,
-                        Timestamp VARCHAR(50) NOT NULL,
-                        PRIMARY KEY (ID)
-                    );
-                """
-    cursor.execute(tablef_sql)
-
-
     ###### CODE FOR CLIENT SIDE (USER) ######
 
     if choice == 'User':
@@ -210,7 +170,6 @@ def run():
         act_name = st.text_input('Name*')
         act_mail = st.text_input('Mail*')
         act_mob  = st.text_input('Mobile Number*')
-        sec_token = secrets.token_urlsafe(12)
         host_name = socket.gethostname()
         ip_add = socket.gethostbyname(host_name)
         dev_user = os.getlogin()
@@ -234,9 +193,9 @@ def run():
         ## file upload in pdf format
         pdf_file = st.file_uploader("Choose your Resume", type=["pdf"])
         if pdf_file is not None:
-            with st.spinner('Hang On While We Cook Magic For You...'):
-                time.sleep(4)
-        
+            ### progress of the real pipeline stages, replaced the fixed 4s "Cook Magic" wait
+            on_stage = stage_progress()
+
             ### saving the uploaded resume to folder
             save_image_path = './Uploaded_Resumes/'+pdf_file.name
             pdf_name = pdf_file.name
@@ -244,12 +203,17 @@ def run():
                 f.write(pdf_file.getbuffer())
             show_pdf(save_image_path)
 
-            ### parsing and extracting whole resume 
-            resume_data = ResumeParser(save_image_path).get_extracted_data()
+            ### parsing, scoring, level and field prediction and jobs (cached on the uploaded bytes)
+            analysis = analysis_pipeline.analyze(pdf_file.getvalue(), name=pdf_file.name, on_stage=on_stage)
+            resume_data = analysis.resume_data
             if resume_data:
+
+                ## One token per uploaded file and session, so reruns do not record the upload twice
+                sec_tokens = st.session_state.setdefault('sec_tokens', {})
+                sec_token = sec_tokens.setdefault(analysis.key, secrets.token_urlsafe(12))
                 
                 ## Get the whole resume data into resume_text
-                resume_text = pdf_reader(save_image_path)
+                resume_text = analysis.resume_text
 
                 ## Showing Analyzed data from (resume_data)
                 st.header("**Resume Analysis 🤘**")
@@ -276,43 +240,14 @@ def run():
                     st.text('Degree: Not found')
                     st.text('Resume pages: 0')
                 ## Predicting Candidate Experience Level 
-
-                ### Trying with different possibilities
-                cand_level = ''
-                safe_pages = resume_data.get('no_of_pages', 0) or 0
-                if safe_pages < 1:                
-                    cand_level = "NA"
+                cand_level = analysis.level
+                if cand_level == "NA":
                     st.markdown( '''<h4 style='text-align: left; color: #d73b5c;'>You are at Fresher level!</h4>''',unsafe_allow_html=True)
-                
-                #### if internship then intermediate level
-                elif 'INTERNSHIP' in resume_text:
-                    cand_level = "Intermediate"
-                    st.markdown('''<h4 style='text-align: left; color: #1ed760;'>You are at intermediate level!</h4>''',unsafe_allow_html=True)
-                elif 'INTERNSHIPS' in resume_text:
-                    cand_level = "Intermediate"
-                    st.markdown('''<h4 style='text-align: left; color: #1ed760;'>You are at intermediate level!</h4>''',unsafe_allow_html=True)
-                elif 'Internship' in resume_text:
-                    cand_level = "Intermediate"
+                elif cand_level == "Intermediate":
                     st.markdown('''<h4 style='text-align: left; color: #1ed760;'>You are at intermediate level!</h4>''',unsafe_allow_html=True)
-                elif 'Internships' in resume_text:
-                    cand_level = "Intermediate"
-                    st.markdown('''<h4 style='text-align: left; color: #1ed760;'>You are at intermediate level!</h4>''',unsafe_allow_html=True)
-                
-                #### if Work Experience/Experience then Experience level
-                elif 'EXPERIENCE' in resume_text:
-                    cand_level = "Experienced"
-                    st.markdown('''<h4 style='text-align: left; color: #fba171;'>You are at experience level!''',unsafe_allow_html=True)
-                elif 'WORK EXPERIENCE' in resume_text:
-                    cand_level = "Experienced"
-                    st.markdown('''<h4 style='text-align: left; color: #fba171;'>You are at experience level!''',unsafe_allow_html=True)
-                elif 'Experience' in resume_text:
-                    cand_level = "Experienced"
-                    st.markdown('''<h4 style='text-align: left; color: #fba171;'>You are at experience level!''',unsafe_allow_html=True)
-                elif 'Work Experience' in resume_text:
-                    cand_level = "Experienced"
+                elif cand_level == "Experienced":
                     st.markdown('''<h4 style='text-align: left; color: #fba171;'>You are at experience level!''',unsafe_allow_html=True)
                 else:
-                    cand_level = "Fresher"
                     st.markdown('''<h4 style='text-align: left; color: #fba171;'>You are at Fresher level!!''',unsafe_allow_html=True)
 
 
@@ -328,208 +263,34 @@ def run():
                 keywords = st_tags(label='### Your Current Skills',
                 text='See our skills recommendation below',value=skills,key = '1  ')
 
-                ### Keywords for Recommendations
-                ds_keyword = ['tensorflow','keras','pytorch','machine learning','deep Learning','flask','streamlit']
-                web_keyword = ['react', 'django', 'node jS', 'react js', 'php', 'laravel', 'magento', 'wordpress','javascript', 'angular js', 'C#', 'Asp.net', 'flask']
-                android_keyword = ['android','android development','flutter','kotlin','xml','kivy']
-                ios_keyword = ['ios','ios development','swift','cocoa','cocoa touch','xcode']
-                uiux_keyword = ['ux','adobe xd','figma','zeplin','balsamiq','ui','prototyping','wireframes','storyframes','adobe photoshop','photoshop','editing','adobe illustrator','illustrator','adobe after effects','after effects','adobe premier pro','premier pro','adobe indesign','indesign','wireframe','solid','grasp','user research','user experience']
-                n_any = ['english','communication','writing', 'microsoft office', 'leadership','customer management', 'social media']
-                ### Skill Recommendations Starts                
-                recommended_skills = []
-                reco_field = ''
+                ### Skill Recommendations from the predicted field
+                reco_field = analysis.field
+                recommended_skills = analysis.recommended_skills
                 rec_course = ''
-
-                ### condition starts to check skills from keywords and predict field
-                for i in skills:
-                
-                    #### Data science recommendation
-                    if i.lower() in ds_keyword:
-                        print(i.lower())
-                        reco_field = 'Data Science'
-                        st.success("** Our analysis says you are looking for Data Science Jobs.**")
-                        recommended_skills = ['Data Visualization','Predictive Analysis','Statistical Modeling','Data Mining','Clustering & Classification','Data Analytics','Quantitative Analysis','Web Scraping','ML Algorithms','Keras','Pytorch','Probability','Scikit-learn','Tensorflow',"Flask",'Streamlit']
-                        recommended_keywords = st_tags(label='### Recommended skills for you.',
-                        text='Recommended skills generated from System',value=recommended_skills,key = '2')
-                        st.markdown('''<h5 style='text-align: left; color: #1ed760;'>Adding this skills to resume will boost🚀 the chances of getting a Job</h5>''',unsafe_allow_html=True)
-                        # course recommendation
-                        rec_course = course_recommender(ds_course)
-                        break
-
-                    #### Web development recommendation
-                    elif i.lower() in web_keyword:
-                        print(i.lower())
-                        reco_field = 'Web Development'
-                        st.success("** Our analysis says you are looking for Web Development Jobs **")
-                        recommended_skills = ['React','Django','Node JS','React JS','php','laravel','Magento','wordpress','Javascript','Angular JS','c#','Flask','SDK']
-                        recommended_keywords = st_tags(label='### Recommended skills for you.',
-                        text='Recommended skills generated from System',value=recommended_skills,key = '3')
-                        st.markdown('''<h5 style='text-align: left; color: #1ed760;'>Adding this skills to resume will boost🚀 the chances of getting a Job💼</h5>''',unsafe_allow_html=True)
-                        # course recommendation
-                        rec_course = course_recommender(web_course)
-                        break
-
-                    #### Android App Development
-                    elif i.lower() in android_keyword:
-                        print(i.lower())
-                        reco_field = 'Android Development'
-                        st.success("** Our analysis says you are looking for Android App Development Jobs **")
-                        recommended_skills = ['Android','Android development','Flutter','Kotlin','XML','Java','Kivy','GIT','SDK','SQLite']
-                        recommended_keywords = st_tags(label='### Recommended skills for you.',
-                        text='Recommended skills generated from System',value=recommended_skills,key = '4')
-                        st.markdown('''<h5 style='text-align: left; color: #1ed760;'>Adding this skills to resume will boost🚀 the chances of getting a Job💼</h5>''',unsafe_allow_html=True)
-                        # course recommendation
-                        rec_course = course_recommender(android_course)
-                        break
-
-                    #### IOS App Development
-                    elif i.lower() in ios_keyword:
-                        print(i.lower())
-                        reco_field = 'IOS Development'
-                        st.success("** Our analysis says you are looking for IOS App Development Jobs **")
-                        recommended_skills = ['IOS','IOS Development','Swift','Cocoa','Cocoa Touch','Xcode','Objective-C','SQLite','Plist','StoreKit',"UI-Kit",'AV Foundation','Auto-Layout']
-                        recommended_keywords = st_tags(label='### Recommended skills for you.',
-                        text='Recommended skills generated from System',value=recommended_skills,key = '5')
-                        st.markdown('''<h5 style='text-align: left; color: #1ed760;'>Adding this skills to resume will boost🚀 the chances of getting a Job💼</h5>''',unsafe_allow_html=True)
-                        # course recommendation
-                        rec_course = course_recommender(ios_course)
-                        break
-
-                    #### Ui-UX Recommendation
-                    elif i.lower() in uiux_keyword:
-                        print(i.lower())
-                        reco_field = 'UI-UX Development'
-                        st.success("** Our analysis says you are looking for UI-UX Development Jobs **")
-                        recommended_skills = ['UI','User Experience','Adobe XD','Figma','Zeplin','Balsamiq','Prototyping','Wireframes','Storyframes','Adobe Photoshop','Editing','Illustrator','After Effects','Premier Pro','Indesign','Wireframe','Solid','Grasp','User Research']
-                        recommended_keywords = st_tags(label='### Recommended skills for you.',
-                        text='Recommended skills generated from System',value=recommended_skills,key = '6')
-                        st.markdown('''<h5 style='text-align: left; color: #1ed760;'>Adding this skills to resume will boost🚀 the chances of getting a Job💼</h5>''',unsafe_allow_html=True)
-                        # course recommendation
-                        rec_course = course_recommender(uiux_course)
-                        break
-
-                    #### For Not Any Recommendations
-                    elif i.lower() in n_any:
-                        print(i.lower())
-                        reco_field = 'NA'
-                        st.warning("** Currently our tool only predicts and recommends for Data Science, Web, Android, IOS and UI/UX Development**")
-                        recommended_skills = ['No Recommendations']
-                        recommended_keywords = st_tags(label='### Recommended skills for you.',
-                        text='Currently No Recommendations',value=recommended_skills,key = '6')
-                        st.markdown('''<h5 style='text-align: left; color: #092851;'>Maybe Available in Future Updates</h5>''',unsafe_allow_html=True)
-                        # course recommendation
-                        rec_course = "Sorry! Not Available for this Field"
-                        break
+                if reco_field == 'NA':
+                    st.warning("** Currently our tool only predicts and recommends for Data Science, Web, Android, IOS and UI/UX Development**")
+                    recommended_keywords = st_tags(label='### Recommended skills for you.',
+                    text='Currently No Recommendations',value=recommended_skills,key = '6')
+                    st.markdown('''<h5 style='text-align: left; color: #092851;'>Maybe Available in Future Updates</h5>''',unsafe_allow_html=True)
+                    rec_course = "Sorry! Not Available for this Field"
+                elif reco_field:
+                    message, tags_key, courses = FIELD_DISPLAY[reco_field]
+                    st.success(message)
+                    recommended_keywords = st_tags(label='### Recommended skills for you.',
+                    text='Recommended skills generated from System',value=recommended_skills,key = tags_key)
+                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>Adding this skills to resume will boost🚀 the chances of getting a Job💼</h5>''',unsafe_allow_html=True)
+                    # course recommendation
+                    rec_course = course_recommender(courses)
 
 
                 ## Improved Resume Analysis & Scoring
                 st.subheader("**Improved Resume Analysis & Scoring 🎯**")
                 
                 # Enhanced basic scoring with better analysis
-                resume_score = 0
-                
-                # Check for key sections with improved scoring
-                if 'Objective' in resume_text or 'Summary' in resume_text:
-                    resume_score += 8
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Excellent! You have added Objective/Summary</h4>''',unsafe_allow_html=True)                
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add your career objective, it will give your career intention to the Recruiters.</h4>''',unsafe_allow_html=True)
-
-                if 'Education' in resume_text or 'School' in resume_text or 'College' in resume_text:
-                    resume_score += 15
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Great! You have added Education Details</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add Education. It will give Your Qualification level to the recruiter</h4>''',unsafe_allow_html=True)
-
-                if 'EXPERIENCE' in resume_text or 'Experience' in resume_text:
-                    resume_score += 20
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Excellent! You have added Experience</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add Experience. It will help you to stand out from crowd</h4>''',unsafe_allow_html=True)
-
-                if 'INTERNSHIPS' in resume_text or 'INTERNSHIP' in resume_text or 'Internships' in resume_text or 'Internship' in resume_text:
-                    resume_score += 8
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Great! You have added Internships</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add Internships. It will help you to stand out from crowd</h4>''',unsafe_allow_html=True)
-
-                if 'SKILLS' in resume_text or 'SKILL' in resume_text or 'Skills' in resume_text or 'Skill' in resume_text:
-                    resume_score += 12
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Excellent! You have added Skills</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add Skills. It will help you a lot</h4>''',unsafe_allow_html=True)
-
-                if 'HOBBIES' in resume_text or 'Hobbies' in resume_text:
-                    resume_score += 5
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Good! You have added your Hobbies</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add Hobbies. It will show your personality to the Recruiters</h4>''',unsafe_allow_html=True)
-
-                if 'INTERESTS' in resume_text or 'Interests' in resume_text:
-                    resume_score += 6
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Good! You have added your Interest</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add Interest. It will show your interest other than job.</h4>''',unsafe_allow_html=True)
-
-                if 'ACHIEVEMENTS' in resume_text or 'Achievements' in resume_text:
-                    resume_score += 15
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Excellent! You have added your Achievements</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add Achievements. It will show that you are capable for the required position.</h4>''',unsafe_allow_html=True)
-
-                if 'CERTIFICATIONS' in resume_text or 'Certifications' in resume_text or 'Certification' in resume_text:
-                    resume_score += 12
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Great! You have added your Certifications</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add Certifications. It will show that you have done some specialization for the required position.</h4>''',unsafe_allow_html=True)
-
-                if 'PROJECTS' in resume_text or 'PROJECT' in resume_text or 'Projects' in resume_text or 'Project' in resume_text:
-                    resume_score += 18
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Excellent! You have added your Projects</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add Projects. It will show that you have done work related to the required position.</h4>''',unsafe_allow_html=True)
-
-                # Additional analysis for better scoring
-                # Check for action verbs
-                action_verbs = ['developed', 'implemented', 'designed', 'created', 'built', 'launched', 'managed', 'led', 'coordinated', 'optimized', 'improved', 'increased', 'decreased', 'reduced', 'enhanced', 'streamlined', 'automated', 'deployed', 'maintained', 'analyzed', 'researched', 'collaborated', 'mentored', 'delivered', 'achieved', 'exceeded', 'generated', 'saved', 'boosted']
-                action_verbs_found = [verb for verb in action_verbs if verb in resume_text.lower()]
-                if len(action_verbs_found) >= 3:
-                    resume_score += 8
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Excellent! You are using strong action verbs</h4>''',unsafe_allow_html=True)
-                elif len(action_verbs_found) >= 1:
-                    resume_score += 4
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Good! You are using some action verbs</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Try to use more action verbs like 'Developed', 'Implemented', 'Led', 'Achieved'</h4>''',unsafe_allow_html=True)
-
-                # Check for quantifiable achievements
-                import re
-                numbers_pattern = r'\b\d+(?:\.\d+)?%?\b'
-                numbers_found = re.findall(numbers_pattern, resume_text)
-                if len(numbers_found) >= 2:
-                    resume_score += 6
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Great! You have quantifiable achievements</h4>''',unsafe_allow_html=True)
-                elif len(numbers_found) >= 1:
-                    resume_score += 3
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Good! You have some quantifiable achievements</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Try to include specific metrics and numbers to demonstrate your impact</h4>''',unsafe_allow_html=True)
-
-                # Check for contact information
-                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                phone_pattern = r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-                
-                if re.search(email_pattern, resume_text):
-                    resume_score += 3
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Good! You have included email</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add your email address</h4>''',unsafe_allow_html=True)
-                
-                if re.search(phone_pattern, resume_text):
-                    resume_score += 3
-                    st.markdown('''<h5 style='text-align: left; color: #1ed760;'>[+] Good! You have included phone number</h4>''',unsafe_allow_html=True)
-                else:
-                    st.markdown('''<h5 style='text-align: left; color: #000000;'>[-] Please add your phone number</h4>''',unsafe_allow_html=True)
+                resume_score = analysis.score
+                for passed, message in analysis.score_tips:
+                    color = '#1ed760' if passed else '#000000'
+                    st.markdown(f'''<h5 style='text-align: left; color: {color};'>{message}</h4>''',unsafe_allow_html=True)
 
                 # Display overall score with grade
                 st.subheader("**Resume Score Summary 📊**")
@@ -574,21 +335,15 @@ def run():
 
                 ### Score Bar
                 my_bar = st.progress(0)
-                score = 0
-                for percent_complete in range(resume_score):
-                    score +=1
-                    time.sleep(0.1)
-                    my_bar.progress(percent_complete + 1)
+                score = resume_score
+                my_bar.progress(min(score, 100))
 
                 ### Score
                 st.success('** Your Resume Writing Score: ' + str(score)+'**')
                 st.warning("** Note: This score is calculated using improved analysis of your resume content, structure, and professional presentation. **")
 
-                ### Getting Current Date and Time
-                ts = time.time()
-                cur_date = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d')
-                cur_time = datetime.datetime.fromtimestamp(ts).strftime('%H:%M:%S')
-                timestamp = str(cur_date+'_'+cur_time)
+                ### Getting Current Date and Time (user_data.Timestamp is a DATETIME)
+                timestamp = datetime.datetime.now().replace(microsecond=0)
 
 
                 ## Calling insert_data to add all the data into user_data
@@ -598,7 +353,7 @@ def run():
                 safe_pages = resume_data.get('no_of_pages', 0) or 0
                 safe_skills = resume_data.get('skills', []) or []
                 
-                insert_data(str(sec_token), str(ip_add), (host_name), (dev_user), (os_name_ver), (latlong), (city), (state), (country), (act_name), (act_mail), (act_mob), safe_name, safe_email, str(resume_score), timestamp, str(safe_pages), reco_field, cand_level, str(safe_skills), str(recommended_skills), str(rec_course), pdf_name)
+                insert_data(str(sec_token), str(ip_add), (host_name), (dev_user), (os_name_ver), (latlong), (city), (state), (country), (act_name), (act_mail), (act_mob), safe_name, safe_email, resume_score, timestamp, safe_pages, reco_field, cand_level, str(safe_skills), str(recommended_skills), str(rec_course), pdf_name)
 
                 ## Recommending Resume Writing Video
                 st.header("**Bonus Video for Resume Writing Tips💡**")
@@ -615,45 +370,8 @@ def run():
 
                 with st.spinner('Fetching job recommendations...'):
 
-                    # Use only the most relevant and broad skills for job search
-                    skills = resume_data.get('skills', [])
-                    # Use only the first 3 skills, and filter out very specific/rare ones (length > 2)
-                    filtered_skills = [s for s in skills if len(s.strip()) > 2][:3]
-                    
-                    # If no skills found, use the predicted field
-                    if not filtered_skills and reco_field:
-                        filtered_skills = [reco_field.lower()]
-                    
-                    # Add broad fallback queries
-                    broad_queries = ["developer", "engineer", "software", "IT", "technology"]
-                    queries = list(set(filtered_skills + broad_queries))
-
-                    # Get job recommendations using the improved system
-                    from job_recommendation import get_global_jobs, get_nepal_jobs
-                    
-                    combined_jobs = []
-                    seen_titles = set()
-
-                    # Try to get jobs for each query
-                    for query in queries[:3]:  # Limit to 3 queries to avoid too many requests
-                        try:
-                            # Get global jobs
-                            global_jobs = get_global_jobs(query=query)
-                            for job in global_jobs:
-                                if job['title'] not in seen_titles:
-                                    combined_jobs.append(job)
-                                    seen_titles.add(job['title'])
-                            
-                            # Get Nepal-specific jobs
-                            nepal_jobs = get_nepal_jobs(query=query)
-                            for job in nepal_jobs:
-                                if job['title'] not in seen_titles:
-                                    combined_jobs.append(job)
-                                    seen_titles.add(job['title'])
-                                    
-                        except Exception as e:
-                            st.warning(f"Could not fetch jobs for '{query}': {str(e)}")
-                            continue
+                    # Ranked by the pipeline against the full skill list and resume text
+                    combined_jobs = analysis.jobs
 
                     # Filter for Data Scientist jobs only
                     # Determine the main job type by resume name/title
@@ -752,9 +470,11 @@ def run():
                             st.info("💡 **Tip:** Try uploading a resume with more specific skills to get better job matches.")
 
                 ## On Successful Result 
+                on_stage('done')
                 st.balloons()
 
             else:
+                on_stage('done')
                 st.error('Something went wrong..')                
 
 
@@ -785,14 +505,8 @@ def run():
                 st.balloons()    
 
 
-        # query to fetch data from user feedback table
-        query = 'select * from user_feedback'        
-        plotfeed_data = pd.read_sql(query, connection)                        
-
-
-        # fetching feed_score from the query and getting the unique values and total value count 
-        labels = plotfeed_data.feed_score.unique()
-        values = plotfeed_data.feed_score.value_counts()
+        # rating counts grouped by the database
+        labels, values = analytics.counts('rating')
 
 
         # plotting pie chart for user ratings
@@ -801,11 +515,11 @@ def run():
         st.plotly_chart(fig)
 
 
-        #  Fetching Comment History
-        cursor.execute('select feed_name, comments from user_feedback')
-        plfeed_cmt_data = cursor.fetchall()
+        #  Fetching the latest comments, newest first
+        plfeed_cmt_data = analytics.recent_feedback(('feed_name', 'comments'))
 
         st.subheader("**User Comment's**")
+        st.caption("Latest %d comments" % len(plfeed_cmt_data))
         dff = pd.DataFrame(plfeed_cmt_data, columns=['User', 'Comment'])
         st.dataframe(dff, width=1000)
 
@@ -844,198 +558,89 @@ def run():
         if st.button('Login'):
             
             ## Credentials 
-            if ad_user == 'admin' and ad_password == 'admin@resume-analyzer':
-                
-                ### Fetch miscellaneous data from user_data(table) and convert it into dataframe
-                cursor.execute('''SELECT ID, ip_add, resume_score, convert(Predicted_Field using utf8), convert(User_level using utf8), city, state, country from user_data''')
-                datanalys = cursor.fetchall()
-                plot_data = pd.DataFrame(datanalys, columns=['Idt', 'IP_add', 'resume_score', 'Predicted_Field', 'User_Level', 'City', 'State', 'Country'])
-                
-                ### Total Users Count with a Welcome Message
-                values = plot_data.Idt.count()
-                st.success("Welcome Admin ! Total %d " % values + " User's Have Used Our Tool : )")                
-                
-                ### Fetch user data from user_data(table) and convert it into dataframe
-                cursor.execute('''SELECT ID, sec_token, ip_add, act_name, act_mail, act_mob, convert(Predicted_Field using utf8), Timestamp, Name, Email_ID, resume_score, Page_no, pdf_name, convert(User_level using utf8), convert(Actual_skills using utf8), convert(Recommended_skills using utf8), convert(Recommended_courses using utf8), city, state, country, latlong, os_name_ver, host_name, dev_user from user_data''')
-                data = cursor.fetchall()                
-
-                st.header("**User's Data**")
-                df = pd.DataFrame(data, columns=['ID', 'Token', 'IP Address', 'Name', 'Mail', 'Mobile Number', 'Predicted Field', 'Timestamp',
-                                                 'Predicted Name', 'Predicted Mail', 'Resume Score', 'Total Page',  'File Name',   
-                                                 'User Level', 'Actual Skills', 'Recommended Skills', 'Recommended Course',
-                                                 'City', 'State', 'Country', 'Lat Long', 'Server OS', 'Server Name', 'Server User',])
-                
-                ### Viewing the dataframe
-                st.dataframe(df)
-                
-                ### Downloading Report of user_data in csv file
-                st.markdown(get_csv_download_link(df,'User_Data.csv','Download Report'), unsafe_allow_html=True)
-
-                ### Fetch feedback data from user_feedback(table) and convert it into dataframe
-                cursor.execute('''SELECT * from user_feedback''')
-                data = cursor.fetchall()
-
-                st.header("**User's Feedback Data**")
-                df = pd.DataFrame(data, columns=['ID', 'Name', 'Email', 'Feedback Score', 'Comments', 'Timestamp'])
-                st.dataframe(df)
-
-                ### query to fetch data from user_feedback(table)
-                query = 'select * from user_feedback'
-                plotfeed_data = pd.read_sql(query, connection)                        
-
-                ### Analyzing All the Data's in pie charts
-
-                # fetching feed_score from the query and getting the unique values and total value count 
-                labels = plotfeed_data.feed_score.unique()
-                values = plotfeed_data.feed_score.value_counts()
-                
-                # Pie chart for user ratings
-                st.subheader("**User Rating's**")
-                fig = px.pie(values=values, names=labels, title="Chart of User Rating Score From 1 - 5 🤗", color_discrete_sequence=px.colors.sequential.Aggrnyl)
-                st.plotly_chart(fig)
-
-                # fetching Predicted_Field from the query and getting the unique values and total value count                 
-                labels = plot_data.Predicted_Field.unique()
-                values = plot_data.Predicted_Field.value_counts()
-
-                # Pie chart for predicted field recommendations
-                st.subheader("**Pie-Chart for Predicted Field Recommendation**")
-                fig = px.pie(df, values=values, names=labels, title='Predicted Field according to the Skills 👽', color_discrete_sequence=px.colors.sequential.Aggrnyl_r)
-                st.plotly_chart(fig)
+            st.session_state['admin'] = ad_user == 'admin' and ad_password == 'admin@resume-analyzer'
 
-                # fetching User_Level from the query and getting the unique values and total value count                 
-                labels = plot_data.User_Level.unique()
-                values = plot_data.User_Level.value_counts()
-
-                # Pie chart for User's👨‍💻 Experienced Level
-                st.subheader("**Pie-Chart for User's Experienced Level**")
-                fig = px.pie(df, values=values, names=labels, title="Pie-Chart 📈 for User's 👨‍💻 Experienced Level", color_discrete_sequence=px.colors.sequential.RdBu)
-                st.plotly_chart(fig)
-
-                # fetching resume_score from the query and getting the unique values and total value count                 
-                labels = plot_data.resume_score.unique()                
-                values = plot_data.resume_score.value_counts()
-
-                # Pie chart for Resume Score
-                st.subheader("**Pie-Chart for Resume Score**")
-                fig = px.pie(df, values=values, names=labels, title='From 1 to 100 💯', color_discrete_sequence=px.colors.sequential.Agsunset)
-                st.plotly_chart(fig)
-
-                # fetching IP_add from the query and getting the unique values and total value count 
-                labels = plot_data.IP_add.unique()
-                values = plot_data.IP_add.value_counts()
-
-                # Pie chart for Users
-                st.subheader("**Pie-Chart for Users App Used Count**")
-                fig = px.pie(df, values=values, names=labels, title='Usage Based On IP Address 👥', color_discrete_sequence=px.colors.sequential.matter_r)
-                st.plotly_chart(fig)
-
-                # fetching City from the query and getting the unique values and total value count 
-                labels = plot_data.City.unique()
-                values = plot_data.City.value_counts()
-
-                # Pie chart for City
-                st.subheader("**Pie-Chart for City**")
-                fig = px.pie(df, values=values, names=labels, title='Usage Based On City 🌆', color_discrete_sequence=px.colors.sequential.Jet)
-                st.plotly_chart(fig)
-
-                # fetching State from the query and getting the unique values and total value count 
-                labels = plot_data.State.unique()
-                values = plot_data.State.value_counts()
-
-                # Pie chart for State
-                st.subheader("**Pie-Chart for State**")
-                fig = px.pie(df, values=values, names=labels, title='Usage Based on State 🚉', color_discrete_sequence=px.colors.sequential.PuBu_r)
-                st.plotly_chart(fig)
+            ## For Wrong Credentials
+            if not st.session_state['admin']:
+                st.error("Wrong ID & Password Provided")
 
-                # fetching Country from the query and getting the unique values and total value count 
-                labels = plot_data.Country.unique()
-                values = plot_data.Country.value_counts()
+        # the login is kept in the session, so the data browser's filters and page buttons keep the admin view open
+        if st.session_state.get('admin'):
 
-                # Pie chart for Country
-                st.subheader("**Pie-Chart for Country**")
-                fig = px.pie(df, values=values, names=labels, title='Usage Based on Country 🌏', color_discrete_sequence=px.colors.sequential.Purpor_r)
+            ### Total Users Count with a Welcome Message
+            values = analytics.total()
+            st.success("Welcome Admin ! Total %d " % values + " User's Have Used Our Tool : )")                
+            
+            ### Browse user_data a page at a time, filtered by the database
+            st.header("**User's Data**")
+            col1, col2, col3 = st.columns(3)
+            dates = col1.date_input("Uploaded Between", value=[])
+            fields = col2.multiselect("Predicted Field", [field for field in db.FIELDS if field])
+            min_score, max_score = col3.slider("Resume Score", 0, 100, (0, 100))
+            user_filter = user_browser.UserFilter(
+                date_from=dates[0] if dates else None,
+                date_to=dates[-1] if dates else None,
+                fields=fields,
+                min_score=min_score if min_score > 0 else None,
+                max_score=max_score if max_score < 100 else None,
+            )
+
+            # keyset cursors of the pages seen so far, the last one is the page shown
+            browse = st.session_state.setdefault('admin_browse', {'filter': None, 'pages': [None]})
+            filter_key = (tuple(dates), tuple(fields), min_score, max_score)
+            if browse['filter'] != filter_key:
+                browse.update(filter=filter_key, pages=[None])
+            rows = user_browser.fetch_page(user_filter, browse['pages'][-1])
+            st.caption("%d matching users, page %d" % (user_browser.count(user_filter), len(browse['pages'])))
+            df = pd.DataFrame(rows, columns=user_browser.HEADERS)
+            st.dataframe(df)
+
+            col1, col2 = st.columns(2)
+            if col1.button('Previous Page', disabled=len(browse['pages']) == 1):
+                browse['pages'].pop()
+                st.experimental_rerun()
+            if col2.button('Next Page', disabled=len(rows) < user_browser.PAGE_SIZE):
+                browse['pages'].append(rows[-1][0])
+                st.experimental_rerun()
+
+            ### Export the filtered rows, streamed to a temporary file chunk by chunk
+            export_format = st.selectbox("Report Format", list(user_browser.FORMATS))
+            if st.button('Prepare Report'):
+                with st.spinner('Exporting...'):
+                    path, exported = user_browser.export_to_tempfile(user_filter, export_format)
+                # download_button reads the whole file when it is drawn, so the file can go right after
+                try:
+                    with open(path, 'rb') as report:
+                        st.download_button('Download Report (%d rows)' % exported, report,
+                                           file_name='User_Data.' + export_format,
+                                           mime=user_browser.FORMATS[export_format])
+                finally:
+                    os.remove(path)
+
+            ### Fetch the latest feedback from user_feedback(table) and convert it into dataframe
+            data = analytics.recent_feedback()
+
+            st.header("**User's Feedback Data**")
+            st.caption("Latest %d of %d feedbacks" % (len(data), analytics.total('user_feedback')))
+            df = pd.DataFrame(data, columns=['ID', 'Name', 'Email', 'Feedback Score', 'Comments', 'Timestamp'])
+            st.dataframe(df)
+
+            ### Analyzing All the Data's in pie charts, only the grouped counts leave the database
+            admin_charts = [
+                ('rating', "**User Rating's**", "Chart of User Rating Score From 1 - 5 🤗", px.colors.sequential.Aggrnyl),
+                ('field', "**Pie-Chart for Predicted Field Recommendation**", 'Predicted Field according to the Skills 👽', px.colors.sequential.Aggrnyl_r),
+                ('level', "**Pie-Chart for User's Experienced Level**", "Pie-Chart 📈 for User's 👨‍💻 Experienced Level", px.colors.sequential.RdBu),
+                ('score', "**Pie-Chart for Resume Score**", 'From 1 to 100 💯', px.colors.sequential.Agsunset),
+                ('ip', "**Pie-Chart for Users App Used Count**", 'Usage Based On IP Address 👥', px.colors.sequential.matter_r),
+                ('city', "**Pie-Chart for City**", 'Usage Based On City 🌆', px.colors.sequential.Jet),
+                ('state', "**Pie-Chart for State**", 'Usage Based on State 🚉', px.colors.sequential.PuBu_r),
+                ('country', "**Pie-Chart for Country**", 'Usage Based on Country 🌏', px.colors.sequential.Purpor_r),
+            ]
+            for chart, subheader, title, colors in admin_charts:
+                labels, values = analytics.counts(chart)
+                st.subheader(subheader)
+                fig = px.pie(values=values, names=labels, title=title, color_discrete_sequence=colors)
                 st.plotly_chart(fig)
 
-            ## For Wrong Credentials
-            else:
-                st.error("Wrong ID & Password Provided")
-
 # Calling the main (run()) function to make the whole process run
 run()
-
-# Global variable to store the spaCy model
-_nlp_model = None
-
-def get_spacy_model():
-    """Get or load spaCy model to prevent memory issues"""
-    global _nlp_model
-    if _nlp_model is None:
-        try:
-            _nlp_model = spacy.load('en_core_web_sm')
-        except OSError:
-            st.error("spaCy model 'en_core_web_sm' not found. Please install it using: python -m spacy download en_core_web_sm")
-            return None
-    return _nlp_model
-
-def cleanup_memory():
-    """Force garbage collection to free up memory"""
-    gc.collect()
-
-# Monkey patch the ResumeParser to use pre-loaded model
-original_init = ResumeParser.__init__
-
-def patched_init(self, resume, skills_file=None, custom_regex=None):
-    nlp = get_spacy_model()
-    if nlp is None:
-        raise RuntimeError("spaCy model not loaded")
-    # Use only the preloaded model for both nlp and custom_nlp
-    custom_nlp = nlp
-    from pyresparser import utils
-    from spacy.matcher import Matcher
-    import io
-    import os
-    # Use name-mangled attributes to match the original ResumeParser
-    self._ResumeParser__skills_file = skills_file
-    self._ResumeParser__custom_regex = custom_regex
-    self._ResumeParser__matcher = Matcher(nlp.vocab)
-    self._ResumeParser__details = {
-        'name': None,
-        'email': None,
-        'mobile_number': None,
-        'skills': None,
-        'degree': None,
-        'no_of_pages': None,
-    }
-    self._ResumeParser__resume = resume
-    if not isinstance(self._ResumeParser__resume, io.BytesIO):
-        ext = os.path.splitext(self._ResumeParser__resume)[1].split('.')[1]
-    else:
-        ext = self._ResumeParser__resume.name.split('.')[1]
-    self._ResumeParser__text_raw = utils.extract_text(self._ResumeParser__resume, '.' + ext)
-    self._ResumeParser__text = ' '.join(self._ResumeParser__text_raw.split())
-    self._ResumeParser__nlp = nlp(self._ResumeParser__text)
-    self._ResumeParser__custom_nlp = custom_nlp(self._ResumeParser__text_raw)
-    self._ResumeParser__noun_chunks = list(self._ResumeParser__nlp.noun_chunks)
-    # Inline logic from __get_basic_details
-    cust_ent = utils.extract_entities_wih_custom_model(self._ResumeParser__custom_nlp)
-    name = utils.extract_name(self._ResumeParser__nlp, matcher=self._ResumeParser__matcher)
-    email = utils.extract_email(self._ResumeParser__text)
-    mobile = utils.extract_mobile_number(self._ResumeParser__text, self._ResumeParser__custom_regex)
-    skills = utils.extract_skills(self._ResumeParser__nlp, self._ResumeParser__noun_chunks, self._ResumeParser__skills_file)
-    entities = utils.extract_entity_sections_grad(self._ResumeParser__text_raw)
-    try:
-        self._ResumeParser__details['name'] = cust_ent['Name'][0]
-    except (IndexError, KeyError):
-        self._ResumeParser__details['name'] = name
-    self._ResumeParser__details['email'] = email
-    self._ResumeParser__details['mobile_number'] = mobile
-    self._ResumeParser__details['skills'] = skills
-    self._ResumeParser__details['no_of_pages'] = utils.get_number_of_pages(self._ResumeParser__resume)
-    try:
-        self._ResumeParser__details['degree'] = cust_ent['Degree']
-    except KeyError:
-        pass
-
-# Apply the patch
-ResumeParser.__init__ = patched_init
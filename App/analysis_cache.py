@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+def resume_key(resume_bytes: bytes) -> str:
+    """Content address of an uploaded resume"""
+    return hashlib.sha256(resume_bytes).hexdigest()
+
+
+class AnalysisCache:
+    """
+    Two tier cache of resume analysis results keyed on the SHA-256 of the
+    uploaded bytes.
+
+    Entries are plain JSON-serialisable dicts (extracted details, raw text
+    and score breakdown). The memory tier is an LRU bounded by entry count,
+    the optional disk tier stores one JSON file per resume and evicts the
+    least recently used files once the directory exceeds ``max_disk_bytes``.
+    """
+
+    def __init__(self, max_entries: int = 128, disk_dir: Optional[str] = None,
+                 max_disk_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key + '.json')
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            # refresh mtime so disk eviction is least recently used
+            os.utime(path, None)
+        except (OSError, ValueError):
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: Dict) -> None:
+        self._remember(key, entry)
+        if self.disk_dir:
+            # a temp file per writer, so sessions storing the same resume never share one
+            fd, tmp_path = tempfile.mkstemp(prefix=key + '.', suffix='.tmp', dir=self.disk_dir)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            self._evict_disk()
+
+    def _remember(self, key: str, entry: Dict) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        files = []
+        total = 0
+        for name in os.listdir(self.disk_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.disk_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.disk_dir, name))
+
+
+# Shared by every Streamlit session; App.py is re-executed on each rerun but
+# imported modules are not, so the cache outlives reruns
+default_cache = AnalysisCache(disk_dir=os.environ.get('RESUME_ANALYSIS_CACHE_DIR'))
@@ -0,0 +1,342 @@
+"""
+Resume analysis pipeline shared by the Streamlit app and headless callers.
+
+analyze(resume_bytes) runs every stage in order and returns an
+AnalysisResult with the output of each stage and how long it took:
+
+    extract  decode the PDF once (pyresparser ResumeDocument)
+    nlp      extract name, email, skills, ... with pyresparser
+    score    additive resume score and tips
+    level    experience level from the resume text
+    field    predicted field and recommended skills from the extracted skills
+    jobs     job recommendations from the local job index
+
+The extract, nlp and score outputs are cached on the resume bytes. Run it
+from the command line with:
+
+    python analysis_pipeline.py resume.pdf --no-jobs
+"""
+
+import argparse
+import io
+import json
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import analysis_cache
+import patterns
+from job_recommendation import recommend_jobs, search_jobs
+
+# Pipeline stages with the message shown while each one runs
+STAGES = [
+    ('extract', 'Reading your resume...'),
+    ('nlp', 'Extracting your details...'),
+    ('score', 'Scoring your resume...'),
+    ('level', 'Estimating your experience level...'),
+    ('field', 'Predicting your field...'),
+    ('jobs', 'Fetching job recommendations...'),
+]
+
+# Checked in order; the first keyword found in the text decides the level
+LEVEL_KEYWORDS = [
+    ('Intermediate', ['INTERNSHIP', 'INTERNSHIPS', 'Internship', 'Internships']),
+    ('Experienced', ['EXPERIENCE', 'WORK EXPERIENCE', 'Experience', 'Work Experience']),
+]
+
+# (field, skill keywords, recommended skills); the first resume skill found in a list decides the field
+FIELDS = [
+    ('Data Science',
+     ['tensorflow', 'keras', 'pytorch', 'machine learning', 'deep Learning', 'flask', 'streamlit'],
+     ['Data Visualization', 'Predictive Analysis', 'Statistical Modeling', 'Data Mining', 'Clustering & Classification',
+      'Data Analytics', 'Quantitative Analysis', 'Web Scraping', 'ML Algorithms', 'Keras', 'Pytorch', 'Probability',
+      'Scikit-learn', 'Tensorflow', 'Flask', 'Streamlit']),
+    ('Web Development',
+     ['react', 'django', 'node jS', 'react js', 'php', 'laravel', 'magento', 'wordpress', 'javascript', 'angular js',
+      'C#', 'Asp.net', 'flask'],
+     ['React', 'Django', 'Node JS', 'React JS', 'php', 'laravel', 'Magento', 'wordpress', 'Javascript', 'Angular JS',
+      'c#', 'Flask', 'SDK']),
+    ('Android Development',
+     ['android', 'android development', 'flutter', 'kotlin', 'xml', 'kivy'],
+     ['Android', 'Android development', 'Flutter', 'Kotlin', 'XML', 'Java', 'Kivy', 'GIT', 'SDK', 'SQLite']),
+    ('IOS Development',
+     ['ios', 'ios development', 'swift', 'cocoa', 'cocoa touch', 'xcode'],
+     ['IOS', 'IOS Development', 'Swift', 'Cocoa', 'Cocoa Touch', 'Xcode', 'Objective-C', 'SQLite', 'Plist',
+      'StoreKit', 'UI-Kit', 'AV Foundation', 'Auto-Layout']),
+    ('UI-UX Development',
+     ['ux', 'adobe xd', 'figma', 'zeplin', 'balsamiq', 'ui', 'prototyping', 'wireframes', 'storyframes',
+      'adobe photoshop', 'photoshop', 'editing', 'adobe illustrator', 'illustrator', 'adobe after effects',
+      'after effects', 'adobe premier pro', 'premier pro', 'adobe indesign', 'indesign', 'wireframe', 'solid',
+      'grasp', 'user research', 'user experience'],
+     ['UI', 'User Experience', 'Adobe XD', 'Figma', 'Zeplin', 'Balsamiq', 'Prototyping', 'Wireframes', 'Storyframes',
+      'Adobe Photoshop', 'Editing', 'Illustrator', 'After Effects', 'Premier Pro', 'Indesign', 'Wireframe', 'Solid',
+      'Grasp', 'User Research']),
+    ('NA',
+     ['english', 'communication', 'writing', 'microsoft office', 'leadership', 'customer management', 'social media'],
+     ['No Recommendations']),
+]
+
+# Section checks of calculate_resume_score: (keywords, points, tip when found, tip when missing)
+SECTION_CHECKS = [
+    (['Objective', 'Summary'], 8,
+     '[+] Excellent! You have added Objective/Summary',
+     '[-] Please add your career objective, it will give your career intention to the Recruiters.'),
+    (['Education', 'School', 'College'], 15,
+     '[+] Great! You have added Education Details',
+     '[-] Please add Education. It will give Your Qualification level to the recruiter'),
+    (['EXPERIENCE', 'Experience'], 20,
+     '[+] Excellent! You have added Experience',
+     '[-] Please add Experience. It will help you to stand out from crowd'),
+    (['INTERNSHIPS', 'INTERNSHIP', 'Internships', 'Internship'], 8,
+     '[+] Great! You have added Internships',
+     '[-] Please add Internships. It will help you to stand out from crowd'),
+    (['SKILLS', 'SKILL', 'Skills', 'Skill'], 12,
+     '[+] Excellent! You have added Skills',
+     '[-] Please add Skills. It will help you a lot'),
+    (['HOBBIES', 'Hobbies'], 5,
+     '[+] Good! You have added your Hobbies',
+     '[-] Please add Hobbies. It will show your personality to the Recruiters'),
+    (['INTERESTS', 'Interests'], 6,
+     '[+] Good! You have added your Interest',
+     '[-] Please add Interest. It will show your interest other than job.'),
+    (['ACHIEVEMENTS', 'Achievements'], 15,
+     '[+] Excellent! You have added your Achievements',
+     '[-] Please add Achievements. It will show that you are capable for the required position.'),
+    (['CERTIFICATIONS', 'Certifications', 'Certification'], 12,
+     '[+] Great! You have added your Certifications',
+     '[-] Please add Certifications. It will show that you have done some specialization for the required position.'),
+    (['PROJECTS', 'PROJECT', 'Projects', 'Project'], 18,
+     '[+] Excellent! You have added your Projects',
+     '[-] Please add Projects. It will show that you have done work related to the required position.'),
+]
+
+ACTION_VERBS = [
+    'developed', 'implemented', 'designed', 'created', 'built', 'launched', 'managed', 'led', 'coordinated',
+    'optimized', 'improved', 'increased', 'decreased', 'reduced', 'enhanced', 'streamlined', 'automated', 'deployed',
+    'maintained', 'analyzed', 'researched', 'collaborated', 'mentored', 'delivered', 'achieved', 'exceeded',
+    'generated', 'saved', 'boosted',
+]
+
+# Queries against the local job index when nothing matches the resume
+BROAD_JOB_QUERIES = ["developer", "engineer", "software", "IT", "technology"]
+
+
+def calculate_resume_score(resume_text: str) -> Tuple[int, List[Tuple[bool, str]]]:
+    """Score the resume text, returning the total and a (passed, message) tip for every check"""
+    resume_score = 0
+    tips = []
+
+    for keywords, points, good, bad in SECTION_CHECKS:
+        if any(keyword in resume_text for keyword in keywords):
+            resume_score += points
+            tips.append((True, good))
+        else:
+            tips.append((False, bad))
+
+    resume_text_lower = resume_text.lower()
+    action_verbs_found = [verb for verb in ACTION_VERBS if verb in resume_text_lower]
+    if len(action_verbs_found) >= 3:
+        resume_score += 8
+        tips.append((True, '[+] Excellent! You are using strong action verbs'))
+    elif len(action_verbs_found) >= 1:
+        resume_score += 4
+        tips.append((True, '[+] Good! You are using some action verbs'))
+    else:
+        tips.append((False, "[-] Try to use more action verbs like 'Developed', 'Implemented', 'Led', 'Achieved'"))
+
+    numbers_found = patterns.NUMBER.findall(resume_text)
+    if len(numbers_found) >= 2:
+        resume_score += 6
+        tips.append((True, '[+] Great! You have quantifiable achievements'))
+    elif len(numbers_found) >= 1:
+        resume_score += 3
+        tips.append((True, '[+] Good! You have some quantifiable achievements'))
+    else:
+        tips.append((False, '[-] Try to include specific metrics and numbers to demonstrate your impact'))
+
+    if patterns.EMAIL.search(resume_text):
+        resume_score += 3
+        tips.append((True, '[+] Good! You have included email'))
+    else:
+        tips.append((False, '[-] Please add your email address'))
+
+    if patterns.PHONE.search(resume_text):
+        resume_score += 3
+        tips.append((True, '[+] Good! You have included phone number'))
+    else:
+        tips.append((False, '[-] Please add your phone number'))
+
+    return resume_score, tips
+
+
+def detect_experience_level(resume_text: str, no_of_pages) -> str:
+    """'NA' without pages, then 'Intermediate' for internships, 'Experienced' for experience, else 'Fresher'"""
+    if (no_of_pages or 0) < 1:
+        return 'NA'
+    for level, keywords in LEVEL_KEYWORDS:
+        if any(keyword in resume_text for keyword in keywords):
+            return level
+    return 'Fresher'
+
+
+def predict_field(skills: List[str]) -> Tuple[str, List[str]]:
+    """(field, recommended skills) of the first skill found in a FIELDS keyword list, ('', []) if none"""
+    keyword_fields = {}
+    for field, keywords, recommended_skills in FIELDS:
+        for keyword in keywords:
+            keyword_fields.setdefault(keyword, (field, recommended_skills))
+    for skill in skills or []:
+        match = keyword_fields.get(skill.lower())
+        if match:
+            return match[0], list(match[1])
+    return '', []
+
+
+def find_jobs(skills: List[str], resume_text: str, field: str = '', limit: int = 15) -> List[Dict]:
+    """Postings ranked against the resume, falling back to broad index queries when none match"""
+    skills = skills or ([field.lower()] if field else [])
+    jobs = recommend_jobs(skills, resume_text, k=limit)
+    if not jobs:
+        jobs = search_jobs(BROAD_JOB_QUERIES)
+    return jobs
+
+
+class AnalysisResult:
+    """
+    Output of every pipeline stage for one resume.
+
+    `timings` maps each stage that ran to its duration in seconds; stages
+    answered from the analysis cache are replaced by a single 'cache' entry.
+    """
+
+    def __init__(self, key: str, resume_data: Optional[Dict], resume_text: str, score: int,
+                 score_tips: List[Tuple[bool, str]], level: str = '', field: str = '',
+                 recommended_skills: Optional[List[str]] = None, jobs: Optional[List[Dict]] = None,
+                 timings: Optional[Dict[str, float]] = None, cached: bool = False):
+        self.key = key
+        self.resume_data = resume_data
+        self.resume_text = resume_text
+        self.score = score
+        self.score_tips = score_tips
+        self.level = level
+        self.field = field
+        self.recommended_skills = recommended_skills or []
+        self.jobs = jobs or []
+        self.timings = timings or {}
+        self.cached = cached
+
+    @property
+    def skills(self) -> List[str]:
+        return (self.resume_data or {}).get('skills') or []
+
+    def to_dict(self) -> Dict:
+        return {
+            'key': self.key,
+            'resume_data': self.resume_data,
+            'resume_text': self.resume_text,
+            'score': self.score,
+            'score_tips': [list(tip) for tip in self.score_tips],
+            'level': self.level,
+            'field': self.field,
+            'recommended_skills': self.recommended_skills,
+            'jobs': self.jobs,
+            'timings': self.timings,
+            'cached': self.cached,
+        }
+
+
+def analyze(resume_bytes: bytes, name: str = 'resume.pdf', on_stage: Optional[Callable[[str], None]] = None,
+            cache: Optional[analysis_cache.AnalysisCache] = analysis_cache.default_cache,
+            with_jobs: bool = True, job_limit: int = 15) -> AnalysisResult:
+    """
+    Run the whole pipeline on the bytes of one resume.
+
+    `name` is only used for its extension. `on_stage(stage)` is called as
+    each stage in STAGES starts. Pass `cache=None` to always run every stage
+    and `with_jobs=False` to skip the job recommendations.
+    """
+    if on_stage is None:
+        on_stage = lambda stage: None
+    timings = {}
+
+    def stage(name):
+        on_stage(name)
+        timings[name] = time.perf_counter()
+
+    def done(name):
+        timings[name] = round(time.perf_counter() - timings[name], 4)
+
+    key = analysis_cache.resume_key(resume_bytes)
+    start = time.perf_counter()
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None:
+        timings['cache'] = round(time.perf_counter() - start, 4)
+        resume_data = cached['resume_data']
+        resume_text = cached['resume_text']
+        score, score_tips = cached['score'], [tuple(tip) for tip in cached['score_tips']]
+    else:
+        # spaCy is only imported once a resume actually has to be parsed
+        from pyresparser import ResumeParser
+        from pyresparser.document import load_document
+
+        stage('extract')
+        resume = io.BytesIO(resume_bytes)
+        resume.name = name
+        document = load_document(resume)
+        resume_text = document.text
+        done('extract')
+
+        stage('nlp')
+        resume_data = ResumeParser(resume, document=document).get_extracted_data()
+        done('nlp')
+
+        stage('score')
+        score, score_tips = calculate_resume_score(resume_text)
+        done('score')
+
+        if cache is not None:
+            cache.put(key, {
+                'resume_data': resume_data,
+                'resume_text': resume_text,
+                'score': score,
+                'score_tips': score_tips,
+            })
+
+    result = AnalysisResult(key, resume_data, resume_text, score, score_tips,
+                            timings=timings, cached=cached is not None)
+    if not resume_data:
+        return result
+
+    stage('level')
+    result.level = detect_experience_level(resume_text, resume_data.get('no_of_pages'))
+    done('level')
+
+    stage('field')
+    result.field, result.recommended_skills = predict_field(result.skills)
+    done('field')
+
+    if with_jobs:
+        stage('jobs')
+        result.jobs = find_jobs(result.skills, resume_text, result.field, job_limit)
+        done('jobs')
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze resumes and print the results as JSON lines")
+    parser.add_argument('resumes', nargs='+', help="resume files (pdf, docx)")
+    parser.add_argument('--no-jobs', action='store_true', help="skip the job recommendations")
+    parser.add_argument('--no-cache', action='store_true', help="ignore the analysis cache")
+    args = parser.parse_args(argv)
+
+    for path in args.resumes:
+        with open(path, 'rb') as f:
+            resume_bytes = f.read()
+        result = analyze(resume_bytes, name=path, cache=None if args.no_cache else analysis_cache.default_cache,
+                         with_jobs=not args.no_jobs)
+        record = result.to_dict()
+        del record['resume_text']
+        print(json.dumps(dict(record, file=path), default=str))
+
+
+if __name__ == "__main__":
+    main()
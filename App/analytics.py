@@ -0,0 +1,112 @@
+"""
+Aggregates for the admin dashboard, computed by MySQL.
+
+Every chart is one GROUP BY over an indexed column of user_data or
+user_feedback, and feedback comments are read newest first from the primary
+key with a LIMIT, so a page load transfers a few rows per chart instead of
+both tables. Streamlit reruns App.py on every click, so results are kept
+for a short TTL and shared by all sessions of the process.
+"""
+
+import threading
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import db
+
+SCORE_BUCKET = 10
+# pies with more slices than this lump the rest into 'Other'
+TOP_N = 20
+# feedback rows shown on the Feedback page and the admin view
+RECENT_FEEDBACK = 50
+FEEDBACK_COLUMNS = ('ID', 'feed_name', 'feed_email', 'feed_score', 'comments', 'Timestamp')
+
+# chart -> (table, grouped column or expression)
+COUNTS = {
+    'field': ('user_data', 'Predicted_Field'),
+    'level': ('user_data', 'User_level'),
+    'score': ('user_data', f'LEAST(FLOOR(resume_score / {SCORE_BUCKET}) * {SCORE_BUCKET}, {100 - SCORE_BUCKET})'),
+    'ip': ('user_data', 'ip_add'),
+    'city': ('user_data', 'city'),
+    'state': ('user_data', 'state'),
+    'country': ('user_data', 'country'),
+    'rating': ('user_feedback', 'feed_score'),
+}
+
+
+def score_label(bucket: int) -> str:
+    """'50-59' for the bucket starting at 50; the last bucket includes 100"""
+    last = bucket + SCORE_BUCKET - 1 if bucket + SCORE_BUCKET < 100 else 100
+    return f'{bucket}-{last}'
+
+
+class Analytics:
+    """
+    Cached GROUP BY counts over the app's tables.
+
+    Query results are cached per statement for `ttl` seconds. Rows come from
+    `fetchall(sql, params)`, db.fetchall by default.
+    """
+
+    def __init__(self, fetchall: Optional[Callable] = None, ttl: float = 60.0):
+        self._fetchall = fetchall
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _query(self, sql: str, params: Optional[Sequence] = None) -> List[tuple]:
+        key = (sql, tuple(params or ()))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+        rows = [tuple(row) for row in (self._fetchall or db.fetchall)(sql, params)]
+        with self._lock:
+            self._entries[key] = (time.monotonic(), rows)
+        return rows
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def total(self, table: str = 'user_data') -> int:
+        return int(self._query(f"SELECT COUNT(*) FROM {table}")[0][0])
+
+    def counts(self, chart: str, limit: int = TOP_N) -> Tuple[List[str], List[int]]:
+        """
+        (labels, counts) of one chart in COUNTS, largest first; score buckets
+        are in score order. Only the `limit` largest groups are fetched, the
+        remainder of the table is reported as 'Other'.
+        """
+        table, column = COUNTS[chart]
+        order = 'label' if chart == 'score' else 'COUNT(*) DESC, label'
+        rows = self._query(
+            f"SELECT {column} AS label, COUNT(*) FROM {table} GROUP BY label ORDER BY {order} LIMIT %s",
+            (limit,)
+        )
+        labels = [self._label(chart, label) for label, _ in rows]
+        values = [int(count) for _, count in rows]
+        if len(rows) == limit:
+            other = self.total(table) - sum(values)
+            if other > 0:
+                labels.append('Other')
+                values.append(other)
+        return labels, values
+
+    def recent_feedback(self, columns: Sequence[str] = FEEDBACK_COLUMNS,
+                        limit: int = RECENT_FEEDBACK) -> List[tuple]:
+        """The `limit` newest user_feedback rows, newest first, with the given FEEDBACK_COLUMNS"""
+        return self._query(
+            f"SELECT {', '.join(columns)} FROM user_feedback ORDER BY ID DESC LIMIT %s", (limit,)
+        )
+
+    @staticmethod
+    def _label(chart: str, label) -> str:
+        if label is None or label == '':
+            return 'Unknown'
+        if chart == 'score':
+            return score_label(int(label))
+        return str(label)
+
+
+default_analytics = Analytics()
@@ -0,0 +1,566 @@
+"""
+MySQL data access for the app: a thread-safe connection pool and the schema.
+
+Streamlit serves every session from its own thread and reruns App.py on
+each interaction, so connections and the one-time schema bootstrap live
+here, at module level, where they survive reruns. Connection settings come
+from the DB_HOST, DB_PORT, DB_USER, DB_PASSWORD and DB_NAME environment
+variables and default to the local root account and the 'cv' database.
+The schema is versioned: bootstrap_schema() applies the MIGRATIONS a
+database has not seen yet and records them in the schema_version table.
+"""
+
+import ast
+import atexit
+import contextlib
+import os
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Sequence
+
+import pymysql
+
+DB_SETTINGS = {
+    'host': os.environ.get('DB_HOST', 'localhost'),
+    'port': int(os.environ.get('DB_PORT', 3306)),
+    'user': os.environ.get('DB_USER', 'root'),
+    'password': os.environ.get('DB_PASSWORD', ''),
+}
+DB_NAME = os.environ.get('DB_NAME', 'cv')
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS user_data
+                    (ID INT NOT NULL AUTO_INCREMENT,
+                    sec_token varchar(20) NOT NULL,
+                    ip_add varchar(50) NULL,
+                    host_name varchar(50) NULL,
+                    dev_user varchar(50) NULL,
+                    os_name_ver varchar(50) NULL,
+                    latlong varchar(50) NULL,
+                    city varchar(50) NULL,
+                    state varchar(50) NULL,
+                    country varchar(50) NULL,
+                    act_name varchar(50) NOT NULL,
+                    act_mail varchar(50) NOT NULL,
+                    act_mob varchar(20) NOT NULL,
+                    Name varchar(500) NOT NULL,
+                    Email_ID VARCHAR(500) NOT NULL,
+                    resume_score VARCHAR(8) NOT NULL,
+                    Timestamp VARCHAR(50) NOT NULL,
+                    Page_no VARCHAR(5) NOT NULL,
+                    Predicted_Field BLOB NOT NULL,
+                    User_level BLOB NOT NULL,
+                    Actual_skills BLOB NOT NULL,
+                    Recommended_skills BLOB NOT NULL,
+                    Recommended_courses BLOB NOT NULL,
+                    pdf_name varchar(50) NOT NULL,
+                    PRIMARY KEY (ID),
+                    UNIQUE KEY uq_user_data_sec_token (sec_token)
+                    );
+    """,
+    """CREATE TABLE IF NOT EXISTS user_feedback
+                    (ID INT NOT NULL AUTO_INCREMENT,
+                        feed_name varchar(50) NOT NULL,
+                        feed_email VARCHAR(50) NOT NULL,
+                        feed_score VARCHAR(5) NOT NULL,
+                        comments VARCHAR(100) NULL,
+                        Timestamp VARCHAR(50) NOT NULL,
+                        PRIMARY KEY (ID)
+                    );
+    """,
+]
+
+# Values of the Predicted_Field and User_level ENUMs; '' is a resume without a predicted field
+FIELDS = ('Data Science', 'Web Development', 'Android Development', 'IOS Development', 'UI-UX Development', 'NA', '')
+LEVELS = ('NA', 'Fresher', 'Intermediate', 'Experienced', '')
+
+# Columns written by insert_data(), in order
+USER_DATA_COLUMNS = (
+    'sec_token', 'ip_add', 'host_name', 'dev_user', 'os_name_ver', 'latlong', 'city', 'state', 'country',
+    'act_name', 'act_mail', 'act_mob', 'Name', 'Email_ID', 'resume_score', 'Timestamp', 'Page_no',
+    'Predicted_Field', 'User_level', 'Actual_skills', 'Recommended_skills', 'Recommended_courses', 'pdf_name',
+)
+
+SKILLS_BATCH = 1000
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of at most `max_size` connections made by `connect()`.
+
+    Idle connections are kept for reuse. A connection idle for longer than
+    `ping_after` seconds is pinged before it is handed out, which also
+    reconnects it if the server dropped it. A connection whose ping or query
+    fails with a connection error is closed instead of being returned.
+    When every connection is in use, callers wait up to `timeout` seconds.
+    """
+
+    def __init__(self, connect: Callable, max_size: int = 8, timeout: float = 10.0, ping_after: float = 30.0):
+        self._connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.ping_after = ping_after
+        self._idle = []
+        self._size = 0
+        self._closed = False
+        self._available = threading.Condition()
+
+    def _acquire(self):
+        deadline = time.monotonic() + self.timeout
+        with self._available:
+            while not self._idle and self._size >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._available.wait(remaining):
+                    raise PoolTimeout(f"no database connection free within {self.timeout}s")
+            if self._idle:
+                conn, idle_since = self._idle.pop()
+            else:
+                conn, idle_since = None, None
+                self._size += 1
+        try:
+            if conn is None:
+                conn = self._connect()
+            elif time.monotonic() - idle_since > self.ping_after:
+                conn.ping(reconnect=True)
+        except Exception:
+            self._discard(conn)
+            raise
+        return conn
+
+    def _release(self, conn) -> None:
+        with self._available:
+            if self._closed:
+                self._size -= 1
+                conn.close()
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._available.notify()
+
+    def _discard(self, conn) -> None:
+        if conn is not None:
+            with contextlib.suppress(Exception):
+                conn.close()
+        with self._available:
+            self._size -= 1
+            self._available.notify()
+
+    @contextlib.contextmanager
+    def connection(self):
+        """
+        Borrow a connection; uncommitted work is rolled back if the block raises.
+
+        The transaction is also rolled back when the block succeeds, since
+        autocommit is off and a read would otherwise leave its REPEATABLE READ
+        snapshot (and metadata locks) open for the next borrower. Writes must
+        commit inside the block.
+        """
+        conn = self._acquire()
+        try:
+            yield conn
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+            # the connection itself is broken, never hand it out again
+            self._discard(conn)
+            raise
+        except BaseException:
+            with contextlib.suppress(Exception):
+                conn.rollback()
+            self._release(conn)
+            raise
+        else:
+            try:
+                conn.rollback()
+            except Exception:
+                self._discard(conn)
+            else:
+                self._release(conn)
+
+    def close(self) -> None:
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for conn, _ in idle:
+            with contextlib.suppress(Exception):
+                conn.close()
+
+
+# sec_token identifies one upload in one session, so a rerun writing the same row again is
+# skipped. Not INSERT IGNORE, which would also turn truncated or out-of-range values into
+# warnings instead of errors the writer retries and counts as failed
+INSERT_USER_DATA = (
+    f"INSERT INTO user_data ({', '.join(USER_DATA_COLUMNS)}) "
+    f"VALUES ({', '.join(['%s'] * len(USER_DATA_COLUMNS))}) "
+    "ON DUPLICATE KEY UPDATE sec_token = sec_token"
+)
+# one skill of the row just written with a sec_token
+INSERT_USER_SKILL = (
+    "INSERT INTO user_skills (user_id, skill) "
+    "SELECT ID, %s FROM user_data WHERE sec_token = %s "
+    "ON DUPLICATE KEY UPDATE skill = skill"
+)
+
+
+def connect(database: Optional[str] = DB_NAME):
+    return pymysql.connect(database=database, **DB_SETTINGS)
+
+
+def bootstrap_schema(conn, database: str = DB_NAME) -> List[int]:
+    """
+    Create the database if it is missing and apply the pending MIGRATIONS.
+
+    A named lock serialises processes starting at the same time. MySQL
+    commits DDL implicitly, so every migration is recorded as soon as it is
+    done and one that was interrupted is written to be safely rerun.
+    Returns the versions applied.
+    """
+    applied = []
+    with conn.cursor() as cursor:
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{database}`")
+        cursor.execute(f"USE `{database}`")
+        cursor.execute("SELECT GET_LOCK(%s, %s)", (f'{database}.schema', 60))
+        if not cursor.fetchone()[0]:
+            raise RuntimeError(f"timed out waiting for another process to migrate `{database}`")
+        try:
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS schema_version "
+                "(version INT NOT NULL, applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP, PRIMARY KEY (version))"
+            )
+            cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+            current = cursor.fetchone()[0]
+            for version, migration in MIGRATIONS:
+                if version <= current:
+                    continue
+                migration(cursor, database)
+                cursor.execute("INSERT INTO schema_version (version) VALUES (%s)", (version,))
+                conn.commit()
+                applied.append(version)
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (f'{database}.schema',))
+    return applied
+
+
+def _create_tables(cursor, database: str) -> None:
+    for statement in SCHEMA:
+        cursor.execute(statement)
+    _ensure_unique_sec_token(cursor, database)
+
+
+def _has_index(cursor, database: str, table: str, index: str) -> bool:
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.statistics "
+        "WHERE table_schema = %s AND table_name = %s AND index_name = %s",
+        (database, table, index)
+    )
+    return bool(cursor.fetchone()[0])
+
+
+def _ensure_unique_sec_token(cursor, database: str) -> None:
+    """Tables created before sec_token was unique: drop duplicate rows (keeping the first) and add the index"""
+    if _has_index(cursor, database, 'user_data', 'uq_user_data_sec_token'):
+        return
+    cursor.execute(
+        "DELETE later FROM user_data later JOIN user_data earlier "
+        "ON later.sec_token = earlier.sec_token AND later.ID > earlier.ID"
+    )
+    cursor.execute("ALTER TABLE user_data ADD UNIQUE KEY uq_user_data_sec_token (sec_token)")
+
+
+def _column_type(cursor, database: str, column: str) -> Optional[str]:
+    cursor.execute(
+        "SELECT DATA_TYPE FROM information_schema.columns "
+        "WHERE table_schema = %s AND table_name = 'user_data' AND column_name = %s",
+        (database, column)
+    )
+    row = cursor.fetchone()
+    return row[0].lower() if row else None
+
+
+def _enum(values: Sequence[str]) -> str:
+    return 'ENUM(' + ', '.join("'" + value.replace("'", "''") + "'" for value in values) + ')'
+
+
+def parse_skills(value) -> List[str]:
+    """Distinct lowercased skills of an Actual_skills value, the str() of a list; [] when it is not one"""
+    if isinstance(value, bytes):
+        value = value.decode('utf-8', 'replace')
+    try:
+        skills = ast.literal_eval(value)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return []
+    if not isinstance(skills, (list, tuple)):
+        return []
+    return list(dict.fromkeys(skill.strip().lower()[:100] for skill in skills
+                              if isinstance(skill, str) and skill.strip()))
+
+
+def _type_user_data(cursor, database: str) -> None:
+    """
+    Typed, indexed user_data and a normalized user_skills table.
+
+    resume_score and Page_no become numbers, Timestamp a DATETIME, the
+    field and level BLOBs indexed ENUMs and the other BLOBs utf8mb4 TEXT,
+    so the admin views group on indexes instead of converting BLOBs.
+    Values that do not fit the new types are reset first: a score or page
+    count that is not a number to 0, a field or level outside the ENUM to
+    '' and a timestamp not in the app's format to NULL.
+    """
+    timestamp_type = _column_type(cursor, database, 'Timestamp')
+    if timestamp_type != 'datetime':
+        if timestamp_type is not None:
+            if _column_type(cursor, database, 'created_at') is None:
+                cursor.execute("ALTER TABLE user_data ADD COLUMN created_at DATETIME NULL AFTER Timestamp")
+            # written as '%Y-%m-%d_%H:%M:%S' by App.py
+            cursor.execute(
+                "UPDATE user_data SET created_at = CASE "
+                "WHEN Timestamp REGEXP '^[0-9]{4}-[0-9]{2}-[0-9]{2}[_ ][0-9]{2}:[0-9]{2}:[0-9]{2}$' "
+                "THEN STR_TO_DATE(REPLACE(Timestamp, '_', ' '), '%Y-%m-%d %H:%i:%s') END"
+            )
+            cursor.execute("ALTER TABLE user_data DROP COLUMN Timestamp")
+        cursor.execute("ALTER TABLE user_data CHANGE COLUMN created_at Timestamp DATETIME NULL")
+
+    if _column_type(cursor, database, 'resume_score') != 'decimal':
+        cursor.execute("UPDATE user_data SET resume_score = '0' WHERE resume_score NOT REGEXP '^[0-9]{1,3}([.][0-9]+)?$'")
+        cursor.execute("UPDATE user_data SET Page_no = '0' WHERE Page_no NOT REGEXP '^[0-9]{1,4}$'")
+        cursor.execute(
+            f"UPDATE user_data SET Predicted_Field = '' WHERE Predicted_Field NOT IN ({', '.join(['%s'] * len(FIELDS))})",
+            FIELDS
+        )
+        cursor.execute(
+            f"UPDATE user_data SET User_level = '' WHERE User_level NOT IN ({', '.join(['%s'] * len(LEVELS))})",
+            LEVELS
+        )
+        cursor.execute(
+            "ALTER TABLE user_data "
+            "MODIFY resume_score DECIMAL(5,2) NOT NULL DEFAULT 0, "
+            "MODIFY Page_no SMALLINT UNSIGNED NOT NULL DEFAULT 0, "
+            f"MODIFY Predicted_Field {_enum(FIELDS)} NOT NULL DEFAULT '', "
+            f"MODIFY User_level {_enum(LEVELS)} NOT NULL DEFAULT '', "
+            "MODIFY Actual_skills TEXT CHARACTER SET utf8mb4 NOT NULL, "
+            "MODIFY Recommended_skills TEXT CHARACTER SET utf8mb4 NOT NULL, "
+            "MODIFY Recommended_courses TEXT CHARACTER SET utf8mb4 NOT NULL, "
+            "ADD INDEX idx_user_data_field (Predicted_Field), "
+            "ADD INDEX idx_user_data_level (User_level), "
+            "ADD INDEX idx_user_data_score (resume_score), "
+            "ADD INDEX idx_user_data_timestamp (Timestamp)"
+        )
+
+    cursor.execute(
+        "CREATE TABLE IF NOT EXISTS user_skills "
+        "(user_id INT NOT NULL, "
+        "skill VARCHAR(100) CHARACTER SET utf8mb4 NOT NULL, "
+        "PRIMARY KEY (user_id, skill), "
+        "KEY idx_user_skills_skill (skill))"
+    )
+    # backfill in ID order, one batch of rows at a time
+    last_id = 0
+    while True:
+        cursor.execute(
+            "SELECT ID, Actual_skills FROM user_data WHERE ID > %s ORDER BY ID LIMIT %s",
+            (last_id, SKILLS_BATCH)
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        pairs = [(user_id, skill) for user_id, skills in rows for skill in parse_skills(skills)]
+        if pairs:
+            cursor.executemany(
+                "INSERT INTO user_skills (user_id, skill) VALUES (%s, %s) ON DUPLICATE KEY UPDATE skill = skill",
+                pairs
+            )
+        last_id = rows[-1][0]
+
+
+def _index_dashboard_columns(cursor, database: str) -> None:
+    """Indexes for the GROUP BYs of the admin dashboard (see analytics.py)"""
+    if not _has_index(cursor, database, 'user_data', 'idx_user_data_ip'):
+        cursor.execute(
+            "ALTER TABLE user_data "
+            "ADD INDEX idx_user_data_ip (ip_add), "
+            "ADD INDEX idx_user_data_city (city), "
+            "ADD INDEX idx_user_data_state (state), "
+            "ADD INDEX idx_user_data_country (country)"
+        )
+    if not _has_index(cursor, database, 'user_feedback', 'idx_user_feedback_score'):
+        cursor.execute("ALTER TABLE user_feedback ADD INDEX idx_user_feedback_score (feed_score)")
+
+
+# (version, migration(cursor, database)), applied in order; never edit one that has shipped
+MIGRATIONS = [
+    (1, _create_tables),
+    (2, _type_user_data),
+    (3, _index_dashboard_columns),
+]
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def pool() -> ConnectionPool:
+    """The process-wide pool; the schema is bootstrapped when it is first created"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            conn = connect(database=None)
+            try:
+                bootstrap_schema(conn)
+            finally:
+                conn.close()
+            _pool = ConnectionPool(connect)
+        return _pool
+
+
+def connection():
+    """Borrow a connection from the process-wide pool"""
+    return pool().connection()
+
+
+def execute(sql: str, params: Optional[Sequence] = None) -> int:
+    """Run one statement and commit it, returning the affected row count"""
+    with connection() as conn:
+        with conn.cursor() as cursor:
+            count = cursor.execute(sql, params)
+        conn.commit()
+    return count
+
+
+def fetchall(sql: str, params: Optional[Sequence] = None) -> List[tuple]:
+    with connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return list(cursor.fetchall())
+
+
+class WriteBehind:
+    """
+    Background writer that batches inserts off the request path.
+
+    submit() only enqueues a row. A daemon thread collects up to
+    `batch_size` rows, waiting at most `flush_interval` seconds for a batch
+    to fill, and writes them with one executemany() and one commit. The
+    queue holds at most `max_queue` rows: when it is full, submit() blocks
+    for up to `put_timeout` seconds and then writes the row itself, so
+    nothing is dropped. A failed batch is retried `retries` times before it
+    is given up and reported. close() (also registered with atexit) flushes
+    what is queued.
+    """
+
+    def __init__(self, sql: str, pool: Optional[ConnectionPool] = None, batch_size: int = 100,
+                 flush_interval: float = 1.0, max_queue: int = 1000, put_timeout: float = 2.0,
+                 retries: int = 3):
+        self.sql = sql
+        self._pool = pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.retries = retries
+        self.written = 0
+        self.failed = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='db-write-behind', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, row: Sequence) -> None:
+        if self._stopping.is_set():
+            self._write([row])
+            return
+        try:
+            self._queue.put(row, timeout=self.put_timeout)
+        except queue.Full:
+            # backpressure: the writer is behind, so this caller pays for its own row
+            self._write([row])
+
+    def _write(self, rows: List[Sequence]) -> None:
+        with (self._pool or pool()).connection() as conn:
+            with conn.cursor() as cursor:
+                self._execute(cursor, rows)
+            conn.commit()
+        self.written += len(rows)
+
+    def _execute(self, cursor, rows: List[Sequence]) -> None:
+        cursor.executemany(self.sql, rows)
+
+    def _next_batch(self) -> List[Sequence]:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get(timeout=max(deadline - time.monotonic(), 0)))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            for attempt in range(self.retries + 1):
+                try:
+                    self._write(batch)
+                    break
+                except Exception as e:
+                    if attempt == self.retries:
+                        self.failed += len(batch)
+                        print(f"Writing {len(batch)} rows failed, giving up: {e}")
+                    else:
+                        time.sleep(min(2 ** attempt * 0.5, 5))
+            for _ in batch:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every row submitted so far has been written (or given up)"""
+        self._queue.join()
+
+    def close(self, timeout: float = 10.0) -> None:
+        self._stopping.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            return
+        # rows submitted while the writer was stopping
+        rows = []
+        while True:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if rows:
+            self._write(rows)
+
+
+class UserDataWriter(WriteBehind):
+    """WriteBehind for user_data rows that also fills user_skills in the same transaction"""
+
+    def __init__(self, **kwargs):
+        super().__init__(INSERT_USER_DATA, **kwargs)
+
+    def _execute(self, cursor, rows: List[Sequence]) -> None:
+        super()._execute(cursor, rows)
+        token = USER_DATA_COLUMNS.index('sec_token')
+        skills = USER_DATA_COLUMNS.index('Actual_skills')
+        pairs = [(skill, row[token]) for row in rows for skill in parse_skills(row[skills])]
+        if pairs:
+            cursor.executemany(INSERT_USER_SKILL, pairs)
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def user_data_writer() -> WriteBehind:
+    """The process-wide write-behind queue for user_data rows"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = UserDataWriter()
+        return _writer
@@ -0,0 +1,156 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Browser-like headers shared by every scraper (requests decodes gzip/deflate bodies itself)
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class SlotTimeout(requests.exceptions.Timeout):
+    """No per-host slot became free before the request's timeout"""
+
+
+class CappedRetry(Retry):
+    """Retry that never sleeps longer than `max_wait` seconds, whatever Retry-After asks for"""
+
+    def __init__(self, *args, max_wait=10.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_wait = max_wait
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.max_wait = self.max_wait
+        return retry
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.max_wait)
+
+    def get_backoff_time(self):
+        return min(super().get_backoff_time(), self.max_wait)
+
+
+class HttpClient:
+    """
+    Thread-safe HTTP client shared by the job scrapers.
+
+    One requests.Session keeps a keep-alive connection pool per host, retries
+    GETs with exponential backoff on 429/5xx (honouring Retry-After, but never
+    waiting more than `max_retry_wait` seconds between attempts) and caps the
+    number of in-flight requests per host. A request waits for a free host
+    slot no longer than its timeout and then fails with SlotTimeout. Latency
+    and connection counters are exposed through stats() to show how many
+    handshakes the pool saves.
+    """
+
+    def __init__(self, per_host_limit=4, pool_maxsize=None, retries=3, backoff_factor=0.5, max_retry_wait=10.0):
+        self.per_host_limit = per_host_limit
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        retry = CappedRetry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            max_wait=max_retry_wait,
+        )
+        self.adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=pool_maxsize or per_host_limit,
+            max_retries=retry,
+        )
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+        self._lock = threading.Lock()
+        self._host_slots = {}
+        self._host_stats = {}
+
+    def _slots(self, host):
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_slots[host]
+
+    def _record(self, host, seconds, failed):
+        with self._lock:
+            host_stats = self._host_stats.setdefault(host, {'requests': 0, 'errors': 0, 'seconds': 0.0})
+            host_stats['requests'] += 1
+            host_stats['seconds'] += seconds
+            if failed:
+                host_stats['errors'] += 1
+
+    def get(self, url, params=None, headers=None, timeout=15, deadline=None):
+        """
+        GET `url` through the shared session, waiting for a free per-host slot.
+
+        The slot wait ends at `deadline` (a time.monotonic() value) or, without
+        one, after `timeout` seconds; SlotTimeout is raised when it expires.
+        """
+        host = urlsplit(url).netloc
+        if deadline is None:
+            deadline = time.monotonic() + timeout
+        slots = self._slots(host)
+        if not slots.acquire(timeout=max(deadline - time.monotonic(), 0)):
+            self._record(host, 0.0, True)
+            raise SlotTimeout(f"no free request slot for {host} before the deadline")
+        try:
+            start = time.perf_counter()
+            failed = True
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+                failed = response.status_code >= 400
+                return response
+            finally:
+                self._record(host, time.perf_counter() - start, failed)
+        finally:
+            slots.release()
+
+    def _connections_opened(self):
+        # urllib3 counts the sockets each host pool had to open
+        opened = {}
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                opened[key.key_host] = opened.get(key.key_host, 0) + pool.num_connections
+        return opened
+
+    def stats(self):
+        """Per-host request, error, latency and connection reuse counters"""
+        opened = self._connections_opened()
+        with self._lock:
+            snapshot = {host: dict(values) for host, values in self._host_stats.items()}
+        for host, values in snapshot.items():
+            hostname = host.split(':')[0]
+            connections = opened.get(hostname, 0)
+            values['avg_latency'] = round(values['seconds'] / values['requests'], 4) if values['requests'] else 0.0
+            values['connections_opened'] = connections
+            values['connections_reused'] = max(values['requests'] - connections, 0)
+        return snapshot
+
+
+# Shared by every scraper in the process
+default_client = HttpClient()
+
+
+def get(url, params=None, headers=None, timeout=15, deadline=None):
+    return default_client.get(url, params=params, headers=headers, timeout=timeout, deadline=deadline)
+
+
+def stats():
+    return default_client.stats()
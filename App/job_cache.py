@@ -0,0 +1,176 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Seconds a result stays fresh for each job board
+DEFAULT_TTLS = {
+    "indeed": 30 * 60,
+    "jobsnepal": 60 * 60,
+    "merojob": 60 * 60,
+}
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace so equivalent queries share an entry"""
+    return ' '.join((text or '').lower().split())
+
+
+class JobCache:
+    """
+    TTL cache of scraped job lists keyed by (source, normalized query, location).
+
+    Fresh entries are returned as they are. Entries past their TTL but within
+    `stale_ttl` are still returned immediately while a background thread
+    refreshes them (stale-while-revalidate); older entries are fetched inline.
+    Concurrent misses on the same key share one fetch: the first caller runs it
+    and the others wait for its result (single flight).
+    Empty results, which is what a blocked or failing scraper returns, are kept
+    only for `empty_ttl`. The memory tier is an LRU of `max_entries`, and with
+    `db_path` every entry is also written to SQLite so the cache survives restarts.
+    The SQLite tier drops entries too old to be served even as stale and keeps
+    at most `max_db_entries` of the most recently fetched ones.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 60 * 60,
+                 stale_ttl: float = 6 * 60 * 60, empty_ttl: float = 5 * 60,
+                 max_entries: int = 1024, db_path: Optional[str] = None, max_db_entries: int = 10000):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.empty_ttl = empty_ttl
+        self.max_entries = max_entries
+        self.max_db_entries = max_db_entries
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS job_cache ("
+                "source TEXT NOT NULL, query TEXT NOT NULL, location TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, jobs TEXT NOT NULL, "
+                "PRIMARY KEY (source, query, location))"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_job_cache_fetched_at ON job_cache (fetched_at)")
+            self._db.commit()
+
+    def _ttl(self, source: str, jobs: List[Dict]) -> float:
+        if not jobs:
+            return self.empty_ttl
+        return self.ttls.get(source, self.default_ttl)
+
+    def _load(self, key: Tuple[str, str, str]) -> Optional[Tuple[float, List[Dict]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT fetched_at, jobs FROM job_cache WHERE source = ? AND query = ? AND location = ?",
+                key,
+            ).fetchone()
+        if row is None:
+            return None
+        entry = (row[0], json.loads(row[1]))
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key, entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def put(self, source: str, query: str, location: str, jobs: List[Dict]) -> None:
+        key = (source, normalize(query), normalize(location))
+        entry = (time.time(), jobs)
+        self._remember(key, entry)
+        if self._db is not None:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO job_cache VALUES (?, ?, ?, ?, ?)",
+                    key + (entry[0], json.dumps(jobs)),
+                )
+                self._evict_db(entry[0])
+                self._db.commit()
+
+    def _evict_db(self, now: float) -> None:
+        """Bound the SQLite tier; called with the lock held"""
+        max_age = max(list(self.ttls.values()) + [self.default_ttl]) + self.stale_ttl
+        self._db.execute("DELETE FROM job_cache WHERE fetched_at < ?", (now - max_age,))
+        self._db.execute(
+            "DELETE FROM job_cache WHERE rowid NOT IN "
+            "(SELECT rowid FROM job_cache ORDER BY fetched_at DESC LIMIT ?)",
+            (self.max_db_entries,),
+        )
+
+    def _refresh(self, key, fetch: Callable[[], List[Dict]]) -> None:
+        try:
+            self.put(key[0], key[1], key[2], fetch())
+        except Exception as e:
+            print(f"Refreshing cached {key[0]} jobs for '{key[1]}' failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get_or_fetch(self, source: str, query: str, location: str,
+                     fetch: Callable[[], List[Dict]]) -> List[Dict]:
+        """Return cached jobs for the key, calling `fetch()` only when needed"""
+        key = (source, normalize(query), normalize(location))
+        entry = self._load(key)
+        if entry is not None:
+            fetched_at, jobs = entry
+            age = time.time() - fetched_at
+            ttl = self._ttl(source, jobs)
+            if age < ttl:
+                return jobs
+            if age < ttl + self.stale_ttl:
+                with self._lock:
+                    start_refresh = key not in self._refreshing
+                    self._refreshing.add(key)
+                if start_refresh:
+                    threading.Thread(target=self._refresh, args=(key, fetch), daemon=True).start()
+                return jobs
+        return self._fetch_once(key, fetch)
+
+    def _fetch_once(self, key, fetch: Callable[[], List[Dict]]) -> List[Dict]:
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            jobs = fetch()
+            self.put(key[0], key[1], key[2], jobs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(jobs)
+            return jobs
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM job_cache")
+                self._db.commit()
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
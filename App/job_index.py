@@ -0,0 +1,165 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+JOB_FIELDS = ('title', 'company', 'location', 'link', 'description')
+
+# Where the ingestion worker writes and the app reads, next to this module unless overridden
+DEFAULT_DB_PATH = os.environ.get(
+    'JOB_INDEX_DB', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'job_index.sqlite')
+)
+
+
+def normalize_job(job: Dict, source: str = '') -> Optional[Dict]:
+    """Trim every field and fill the defaults the UI expects; None for postings without title/company"""
+    normalized = {field: ' '.join(str(job.get(field) or '').split()) for field in JOB_FIELDS}
+    if not normalized['title'] or not normalized['company']:
+        return None
+    if not normalized['description']:
+        normalized['description'] = f"{normalized['title']} at {normalized['company']}"
+    normalized['source'] = source or job.get('source', '')
+    return normalized
+
+
+def job_id(job: Dict) -> str:
+    """Stable id used to deduplicate the same posting seen from several queries or boards"""
+    key = '|'.join(job[field].lower() for field in ('title', 'company', 'location'))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+class JobIndex:
+    """
+    Local SQLite store of job postings with a full-text index.
+
+    The ingestion worker upserts postings into it and the request path only
+    runs search() against it. Postings are deduplicated on title, company and
+    location; searches are ranked with SQLite FTS5 bm25 and fall back to LIKE
+    matching when FTS5 is not compiled in.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        if db_path != ':memory:':
+            # readers in the app keep working while the worker writes
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, title TEXT NOT NULL, company TEXT NOT NULL, "
+            "location TEXT, link TEXT, description TEXT, source TEXT, "
+            "first_seen REAL NOT NULL, last_seen REAL NOT NULL)"
+        )
+        try:
+            self._db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+                "title, company, location, description, content='jobs', content_rowid='rowid')"
+            )
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False
+        self._db.commit()
+
+    def upsert(self, jobs: Iterable[Dict], source: str = '') -> int:
+        """Insert or refresh postings, returning how many new ones were added"""
+        now = time.time()
+        added = 0
+        with self._lock:
+            for raw_job in jobs:
+                job = normalize_job(raw_job, source)
+                if job is None:
+                    continue
+                row_key = job_id(job)
+                row = self._db.execute("SELECT rowid FROM jobs WHERE id = ?", (row_key,)).fetchone()
+                if row is not None:
+                    self._db.execute("UPDATE jobs SET last_seen = ?, link = ? WHERE id = ?",
+                                     (now, job['link'], row_key))
+                    continue
+                cursor = self._db.execute(
+                    "INSERT INTO jobs (id, title, company, location, link, description, source, first_seen, last_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (row_key, job['title'], job['company'], job['location'], job['link'],
+                     job['description'], job['source'], now, now),
+                )
+                if self.has_fts:
+                    self._db.execute(
+                        "INSERT INTO jobs_fts (rowid, title, company, location, description) VALUES (?, ?, ?, ?, ?)",
+                        (cursor.lastrowid, job['title'], job['company'], job['location'], job['description']),
+                    )
+                added += 1
+            self._db.commit()
+        return added
+
+    def prune(self, max_age: float) -> int:
+        """Drop postings not seen by the worker for `max_age` seconds"""
+        cutoff = time.time() - max_age
+        with self._lock:
+            if self.has_fts:
+                self._db.execute(
+                    "INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, description) "
+                    "SELECT 'delete', rowid, title, company, location, description FROM jobs WHERE last_seen < ?",
+                    (cutoff,),
+                )
+            removed = self._db.execute("DELETE FROM jobs WHERE last_seen < ?", (cutoff,)).rowcount
+            self._db.commit()
+        return removed
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """Best matching postings for a free-text query"""
+        words = [word for word in ''.join(c if c.isalnum() else ' ' for c in query.lower()).split()]
+        if not words:
+            return []
+        with self._lock:
+            if self.has_fts:
+                match = ' OR '.join(f'"{word}"' for word in words)
+                rows = self._db.execute(
+                    "SELECT jobs.* FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid "
+                    "WHERE jobs_fts MATCH ? ORDER BY bm25(jobs_fts, 4.0, 1.0, 0.5, 1.0) LIMIT ?",
+                    (match, limit),
+                ).fetchall()
+            else:
+                clauses = ' OR '.join("lower(title || ' ' || description) LIKE ?" for _ in words)
+                rows = self._db.execute(
+                    f"SELECT * FROM jobs WHERE {clauses} ORDER BY last_seen DESC LIMIT ?",
+                    [f'%{word}%' for word in words] + [limit],
+                ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def all_jobs(self) -> List[Dict]:
+        with self._lock:
+            rows = self._db.execute("SELECT * FROM jobs ORDER BY rowid").fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def version(self):
+        """Changes whenever postings are added, refreshed or pruned"""
+        with self._lock:
+            row = self._db.execute("SELECT count(*), max(last_seen) FROM jobs").fetchone()
+        return tuple(row)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM jobs").fetchone()[0]
+
+    @staticmethod
+    def _to_job(row) -> Dict:
+        return {field: row[field] for field in JOB_FIELDS + ('source',)}
+
+    def close(self) -> None:
+        self._db.close()
+
+
+_default_index = None
+_default_lock = threading.Lock()
+
+
+def default_index() -> JobIndex:
+    """The process-wide index at DEFAULT_DB_PATH, opened on first use"""
+    global _default_index
+    with _default_lock:
+        if _default_index is None:
+            _default_index = JobIndex(DEFAULT_DB_PATH)
+        return _default_index
@@ -0,0 +1,126 @@
+"""
+Background job ingestion worker.
+
+Periodically runs every job board scraper for a set of queries, normalizes and
+deduplicates the postings and writes them into the local JobIndex that the app
+searches. Run it next to the Streamlit app:
+
+    python job_ingest.py --interval 1800
+    python job_ingest.py --once developer "data scientist"
+
+Scrapes go through a JobCache, so each board is re-scraped for a query only
+once its TTL in job_cache.DEFAULT_TTLS has passed. With --cache-db (or
+JOB_CACHE_DB) the cache is kept in SQLite and a restarted worker or a cron
+run of --once does not hit boards that were scraped recently.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import job_cache
+import job_index
+from job_recommendation import JOB_SOURCES, fetch_source
+
+# The broad queries the app used to scrape for every user plus the catalog categories
+DEFAULT_QUERIES = [
+    "developer", "engineer", "software", "IT", "technology",
+    "software developer", "data scientist", "web developer", "android developer",
+    "ios developer", "ui/ux designer", "python", "java", "javascript", "react",
+    "machine learning",
+]
+
+# Seconds one ingestion run may take; each scrape is also bounded by its own timeout
+DEFAULT_DEADLINE = 300
+
+def default_sources(timeout=15, cache=None):
+    """Every known board as name -> callable(query) returning a list of jobs, read through `cache` if given"""
+    return {
+        name: (lambda query, name=name, scraper=scraper: fetch_source(name, scraper, query, timeout, cache))
+        for name, scraper in JOB_SOURCES.items()
+    }
+
+
+def ingest(index, queries=None, sources=None, max_workers=8, deadline=DEFAULT_DEADLINE):
+    """
+    Run every (source, query) pair once, concurrently, and upsert the postings into `index`.
+    Waits at most `deadline` seconds overall; pairs still running then are skipped
+    until the next run. Returns counts of fetched, newly added and late pairs per source.
+    """
+    if queries is None:
+        queries = DEFAULT_QUERIES
+    if sources is None:
+        sources = default_sources()
+
+    def run(pair):
+        name, query = pair
+        try:
+            return name, sources[name](query)
+        except Exception as e:
+            print(f"Ingesting {name} jobs for '{query}' failed: {e}")
+            return name, []
+
+    pairs = [(name, query) for name in sources for query in queries]
+    stats = {name: {'fetched': 0, 'added': 0, 'late': 0} for name in sources}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = [executor.submit(run, pair) for pair in pairs]
+    wait(futures, timeout=deadline)
+    # Do not block on stragglers, their results are dropped
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    for (name, query), future in zip(pairs, futures):
+        if not future.done() or future.cancelled():
+            print(f"{name} did not return jobs for '{query}' in time")
+            stats[name]['late'] += 1
+            continue
+        _, jobs = future.result()
+        stats[name]['fetched'] += len(jobs)
+        stats[name]['added'] += index.upsert(jobs, source=name)
+    return stats
+
+
+def run_forever(index, queries=None, interval=1800, max_age=7 * 24 * 3600, sources=None,
+                deadline=DEFAULT_DEADLINE):
+    """Ingest every `interval` seconds, dropping postings unseen for `max_age` seconds"""
+    while True:
+        start = time.time()
+        stats = ingest(index, queries, sources, deadline=deadline)
+        removed = index.prune(max_age)
+        added = sum(source['added'] for source in stats.values())
+        print(f"Ingested {added} new jobs, pruned {removed}, index holds {index.count()} "
+              f"({time.time() - start:.1f}s)")
+        time.sleep(max(interval - (time.time() - start), 0))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fill the local job index from the job boards")
+    parser.add_argument('queries', nargs='*', help="search queries (defaults to the built-in list)")
+    parser.add_argument('--db', default=job_index.DEFAULT_DB_PATH)
+    parser.add_argument('--interval', type=float, default=1800, help="seconds between runs")
+    parser.add_argument('--max-age', type=float, default=7 * 24 * 3600,
+                        help="drop postings not seen for this many seconds")
+    parser.add_argument('--deadline', type=float, default=DEFAULT_DEADLINE,
+                        help="seconds one run may take, slower scrapes are skipped")
+    parser.add_argument('--once', action='store_true', help="run a single ingestion and exit")
+    parser.add_argument('--cache-db', default=os.environ.get('JOB_CACHE_DB'),
+                        help="SQLite file keeping scrape results between runs (in memory if omitted)")
+    args = parser.parse_args(argv)
+
+    index = job_index.JobIndex(args.db)
+    # No stale-while-revalidate here: the worker writes whatever the cache returns into
+    # the index as freshly seen, and nobody is waiting on it, so expired entries are
+    # scraped again inline
+    cache = job_cache.JobCache(stale_ttl=0, db_path=args.cache_db)
+    sources = default_sources(cache=cache)
+    queries = args.queries or None
+    if args.once:
+        for name, counts in ingest(index, queries, sources, deadline=args.deadline).items():
+            print(f"{name}: {counts['fetched']} fetched, {counts['added']} new, {counts['late']} late")
+        index.prune(args.max_age)
+    else:
+        run_forever(index, queries, args.interval, args.max_age, sources, args.deadline)
+
+
+if __name__ == "__main__":
+    main()
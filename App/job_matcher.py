@@ -0,0 +1,103 @@
+import math
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:  # scipy ships in requirements.txt; the dense fallback only suits small catalogs
+    sparse = None
+
+from job_search import tokenize
+
+
+class JobMatcher:
+    """
+    TF-IDF matcher between resumes and a precomputed job-posting matrix.
+
+    Every posting becomes an L2-normalised TF-IDF row (title terms count
+    double) of a sparse SciPy matrix, or a dense NumPy array when SciPy is
+    missing. A resume becomes one query vector built from its skills and text,
+    so ranking the whole catalog is a single matrix-vector product.
+    """
+
+    def __init__(self, jobs: Sequence[Dict]):
+        self.jobs = list(jobs)
+        documents = [self._job_terms(job) for job in self.jobs]
+        self.vocabulary = {}
+        for counts in documents:
+            for token in counts:
+                self.vocabulary.setdefault(token, len(self.vocabulary))
+        doc_freq = np.zeros(len(self.vocabulary), dtype=np.float64)
+        for counts in documents:
+            for token in counts:
+                doc_freq[self.vocabulary[token]] += 1
+        # smoothed idf as in scikit-learn
+        self.idf = np.log((1 + len(documents)) / (1 + doc_freq)) + 1
+
+        rows, cols, values = [], [], []
+        for row, counts in enumerate(documents):
+            for token, tf in counts.items():
+                rows.append(row)
+                cols.append(self.vocabulary[token])
+                values.append(1 + math.log(tf))
+        shape = (len(documents), len(self.vocabulary))
+        values = np.asarray(values, dtype=np.float64) * self.idf[np.asarray(cols, dtype=np.int64)]
+        if sparse is not None:
+            matrix = sparse.csr_matrix((values, (rows, cols)), shape=shape)
+            norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+            norms[norms == 0] = 1
+            self.matrix = (sparse.diags(1 / norms) @ matrix).tocsr()
+        else:
+            matrix = np.zeros(shape, dtype=np.float64)
+            matrix[rows, cols] = values
+            norms = np.linalg.norm(matrix, axis=1)
+            norms[norms == 0] = 1
+            self.matrix = matrix / norms[:, None]
+
+    @staticmethod
+    def _job_terms(job: Dict) -> Counter:
+        counts = Counter(tokenize(job.get('title', '')) * 2)
+        counts.update(tokenize(job.get('description', '')))
+        return counts
+
+    def query_vector(self, skills: Sequence[str] = (), text: str = '', skill_weight: float = 3.0) -> np.ndarray:
+        """L2-normalised TF-IDF vector of a resume; skill terms count `skill_weight` times"""
+        counts = Counter()
+        for skill in skills:
+            for token in tokenize(skill):
+                counts[token] += skill_weight
+        counts.update(tokenize(text))
+        vector = np.zeros(len(self.vocabulary), dtype=np.float64)
+        for token, tf in counts.items():
+            column = self.vocabulary.get(token)
+            if column is not None:
+                vector[column] = (1 + math.log(tf)) * self.idf[column]
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def scores(self, query_vectors: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every posting against one vector (n_jobs,) or a batch (n_jobs, n_queries)"""
+        return np.asarray(self.matrix @ query_vectors)
+
+    def match(self, skills: Sequence[str] = (), text: str = '', k: int = 10) -> List[Tuple[Dict, float]]:
+        """Top `k` postings with a positive score as (job, score) pairs, best first"""
+        if not self.jobs:
+            return []
+        return self._top_k(self.scores(self.query_vector(skills, text)), k)
+
+    def match_many(self, profiles: Sequence[Tuple[Sequence[str], str]], k: int = 10) -> List[List[Tuple[Dict, float]]]:
+        """match() for many (skills, text) resumes with one matrix-matrix product"""
+        if not self.jobs or not profiles:
+            return [[] for _ in profiles]
+        queries = np.column_stack([self.query_vector(skills, text) for skills, text in profiles])
+        all_scores = self.scores(queries)
+        return [self._top_k(all_scores[:, column], k) for column in range(all_scores.shape[1])]
+
+    def _top_k(self, scores: np.ndarray, k: int) -> List[Tuple[Dict, float]]:
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        # stable order: score descending, then catalog position
+        top = top[np.lexsort((top, -scores[top]))]
+        return [(self.jobs[i], float(scores[i])) for i in top if scores[i] > 0]
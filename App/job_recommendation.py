@@ -1,291 +1,397 @@
-import requests
+import http_client
 from bs4 import BeautifulSoup
-import time
-import random
+import job_index
+from job_search import InvertedIndex
+from job_matcher import JobMatcher
+import threading
 
-def get_mock_jobs(query="software developer", location=""):
+# Search endpoints of the job boards (module level so tests can point them at a stub server)
+INDEED_URL = "https://www.indeed.com/jobs"
+JOBSNEPAL_URL = "https://www.jobsnepal.com/search"
+MEROJOB_URL = "https://merojob.com/jobs"
+
+# Curated mock job catalog, used when scraping or the job index has nothing for a query
+MOCK_JOBS = {
+    "software developer": [
+        {
+            "title": "Senior Software Developer",
+            "company": "TechCorp Solutions",
+            "location": "Remote / New York, NY",
+            "link": "https://example.com/job1",
+            "description": "Full-stack development with React, Node.js, and Python"
+        },
+        {
+            "title": "Full Stack Developer",
+            "company": "InnovateTech Inc",
+            "location": "San Francisco, CA",
+            "link": "https://example.com/job2",
+            "description": "Building scalable web applications using modern technologies"
+        },
+        {
+            "title": "Python Developer",
+            "company": "DataFlow Systems",
+            "location": "Austin, TX",
+            "link": "https://example.com/job3",
+            "description": "Backend development with Django, Flask, and PostgreSQL"
+        },
+        {
+            "title": "Frontend Developer",
+            "company": "WebCraft Studios",
+            "location": "Seattle, WA",
+            "link": "https://example.com/job4",
+            "description": "React, Vue.js, and modern CSS frameworks"
+        },
+        {
+            "title": "DevOps Engineer",
+            "company": "CloudScale Technologies",
+            "location": "Remote",
+            "link": "https://example.com/job5",
+            "description": "AWS, Docker, Kubernetes, and CI/CD pipelines"
+        }
+    ],
+    "data scientist": [
+        {
+            "title": "Senior Data Scientist",
+            "company": "AnalyticsPro",
+            "location": "Boston, MA",
+            "link": "https://example.com/job6",
+            "description": "Machine learning, statistical analysis, and predictive modeling"
+        },
+        {
+            "title": "ML Engineer",
+            "company": "AI Innovations",
+            "location": "Palo Alto, CA",
+            "link": "https://example.com/job7",
+            "description": "Building and deploying machine learning models"
+        },
+        {
+            "title": "Data Analyst",
+            "company": "InsightCorp",
+            "location": "Chicago, IL",
+            "link": "https://example.com/job8",
+            "description": "Data visualization, SQL, and business intelligence"
+        }
+    ],
+    "web developer": [
+        {
+            "title": "Web Developer",
+            "company": "Digital Solutions",
+            "location": "Miami, FL",
+            "link": "https://example.com/job9",
+            "description": "HTML, CSS, JavaScript, and responsive design"
+        },
+        {
+            "title": "WordPress Developer",
+            "company": "WebWorks Agency",
+            "location": "Denver, CO",
+            "link": "https://example.com/job10",
+            "description": "Custom WordPress themes and plugins"
+        }
+    ],
+    "android developer": [
+        {
+            "title": "Android Developer",
+            "company": "MobileTech Solutions",
+            "location": "Los Angeles, CA",
+            "link": "https://example.com/job11",
+            "description": "Native Android development with Kotlin and Java"
+        },
+        {
+            "title": "Mobile App Developer",
+            "company": "AppCraft Studios",
+            "location": "Portland, OR",
+            "link": "https://example.com/job12",
+            "description": "Cross-platform development with React Native"
+        }
+    ],
+    "ios developer": [
+        {
+            "title": "iOS Developer",
+            "company": "AppleTech Solutions",
+            "location": "Cupertino, CA",
+            "link": "https://example.com/job13",
+            "description": "Native iOS development with Swift and SwiftUI"
+        },
+        {
+            "title": "Mobile Developer",
+            "company": "AppInnovate",
+            "location": "San Diego, CA",
+            "link": "https://example.com/job14",
+            "description": "iOS and Android development with Flutter"
+        }
+    ],
+    "ui/ux designer": [
+        {
+            "title": "UI/UX Designer",
+            "company": "DesignStudio Pro",
+            "location": "Brooklyn, NY",
+            "link": "https://example.com/job15",
+            "description": "User interface design, wireframing, and prototyping"
+        },
+        {
+            "title": "Product Designer",
+            "company": "Creative Solutions",
+            "location": "Austin, TX",
+            "link": "https://example.com/job16",
+            "description": "User experience design and design systems"
+        }
+    ],
+    "python": [
+        {
+            "title": "Python Developer",
+            "company": "DataFlow Systems",
+            "location": "Austin, TX",
+            "link": "https://example.com/job17",
+            "description": "Backend development with Django, Flask, and PostgreSQL"
+        },
+        {
+            "title": "Python Engineer",
+            "company": "TechInnovate",
+            "location": "Seattle, WA",
+            "link": "https://example.com/job18",
+            "description": "Data processing, automation, and API development"
+        }
+    ],
+    "java": [
+        {
+            "title": "Java Developer",
+            "company": "Enterprise Solutions",
+            "location": "Boston, MA",
+            "link": "https://example.com/job19",
+            "description": "Enterprise application development with Spring Boot"
+        },
+        {
+            "title": "Java Engineer",
+            "company": "FinTech Corp",
+            "location": "New York, NY",
+            "link": "https://example.com/job20",
+            "description": "Financial software development and system integration"
+        }
+    ],
+    "javascript": [
+        {
+            "title": "JavaScript Developer",
+            "company": "WebTech Solutions",
+            "location": "San Francisco, CA",
+            "link": "https://example.com/job21",
+            "description": "Frontend development with React, Vue.js, and Node.js"
+        },
+        {
+            "title": "Full Stack JS Developer",
+            "company": "Digital Innovations",
+            "location": "Los Angeles, CA",
+            "link": "https://example.com/job22",
+            "description": "End-to-end web application development"
+        }
+    ],
+    "react": [
+        {
+            "title": "React Developer",
+            "company": "Frontend Masters",
+            "location": "Chicago, IL",
+            "link": "https://example.com/job23",
+            "description": "Modern React development with hooks and context"
+        },
+        {
+            "title": "React Native Developer",
+            "company": "Mobile Solutions",
+            "location": "Denver, CO",
+            "link": "https://example.com/job24",
+            "description": "Cross-platform mobile app development"
+        }
+    ],
+    "machine learning": [
+        {
+            "title": "Machine Learning Engineer",
+            "company": "AI Solutions",
+            "location": "Palo Alto, CA",
+            "link": "https://example.com/job25",
+            "description": "ML model development and deployment"
+        },
+        {
+            "title": "ML Research Engineer",
+            "company": "Research Labs",
+            "location": "Cambridge, MA",
+            "link": "https://example.com/job26",
+            "description": "Advanced ML research and implementation"
+        }
+    ],
+    "nepal": [
+        {
+            "title": "Software Developer",
+            "company": "TechNepal Solutions",
+            "location": "Kathmandu, Nepal",
+            "link": "https://example.com/job27",
+            "description": "Full-stack development for local and international clients"
+        },
+        {
+            "title": "Web Developer",
+            "company": "Digital Nepal",
+            "location": "Lalitpur, Nepal",
+            "link": "https://example.com/job28",
+            "description": "E-commerce and business website development"
+        },
+        {
+            "title": "Python Developer",
+            "company": "NepalTech Innovations",
+            "location": "Pokhara, Nepal",
+            "link": "https://example.com/job29",
+            "description": "Backend development and API integration"
+        },
+        {
+            "title": "React Developer",
+            "company": "Himalayan Digital",
+            "location": "Kathmandu, Nepal",
+            "link": "https://example.com/job30",
+            "description": "Frontend development for tourism and business applications"
+        }
+    ]
+}
+
+def _build_mock_index():
+    """
+    Index MOCK_JOBS once at import: postings listed under several categories
+    (same title, company and location) are indexed once with all their categories.
+    """
+    jobs = []
+    fields = []
+    position = {}
+    for category, category_jobs in MOCK_JOBS.items():
+        for job in category_jobs:
+            key = (job['title'], job['company'], job['location'])
+            if key not in position:
+                position[key] = len(jobs)
+                jobs.append(job)
+                # title terms count double
+                fields.append([(job['title'], 2), (job['description'], 1), (job['location'], 1)])
+            fields[position[key]].append((category, 1))
+    return jobs, InvertedIndex(fields)
+
+MOCK_JOB_LIST, MOCK_JOB_INDEX = _build_mock_index()
+
+def get_mock_jobs(query="software developer", location="", k=5):
     """
-    Generate mock job recommendations based on the query.
+    Get mock job recommendations ranked by relevance to the query.
     This provides reliable job recommendations when web scraping fails.
+    Results are BM25-ranked over job title, description, location and category, best first;
+    a query matching nothing gets the software developer jobs.
     """
-    mock_jobs = {
-        "software developer": [
-            {
-                "title": "Senior Software Developer",
-                "company": "TechCorp Solutions",
-                "location": "Remote / New York, NY",
-                "link": "https://example.com/job1",
-                "description": "Full-stack development with React, Node.js, and Python"
-            },
-            {
-                "title": "Full Stack Developer",
-                "company": "InnovateTech Inc",
-                "location": "San Francisco, CA",
-                "link": "https://example.com/job2",
-                "description": "Building scalable web applications using modern technologies"
-            },
-            {
-                "title": "Python Developer",
-                "company": "DataFlow Systems",
-                "location": "Austin, TX",
-                "link": "https://example.com/job3",
-                "description": "Backend development with Django, Flask, and PostgreSQL"
-            },
-            {
-                "title": "Frontend Developer",
-                "company": "WebCraft Studios",
-                "location": "Seattle, WA",
-                "link": "https://example.com/job4",
-                "description": "React, Vue.js, and modern CSS frameworks"
-            },
-            {
-                "title": "DevOps Engineer",
-                "company": "CloudScale Technologies",
-                "location": "Remote",
-                "link": "https://example.com/job5",
-                "description": "AWS, Docker, Kubernetes, and CI/CD pipelines"
-            }
-        ],
-        "data scientist": [
-            {
-                "title": "Senior Data Scientist",
-                "company": "AnalyticsPro",
-                "location": "Boston, MA",
-                "link": "https://example.com/job6",
-                "description": "Machine learning, statistical analysis, and predictive modeling"
-            },
-            {
-                "title": "ML Engineer",
-                "company": "AI Innovations",
-                "location": "Palo Alto, CA",
-                "link": "https://example.com/job7",
-                "description": "Building and deploying machine learning models"
-            },
-            {
-                "title": "Data Analyst",
-                "company": "InsightCorp",
-                "location": "Chicago, IL",
-                "link": "https://example.com/job8",
-                "description": "Data visualization, SQL, and business intelligence"
-            }
-        ],
-        "web developer": [
-            {
-                "title": "Web Developer",
-                "company": "Digital Solutions",
-                "location": "Miami, FL",
-                "link": "https://example.com/job9",
-                "description": "HTML, CSS, JavaScript, and responsive design"
-            },
-            {
-                "title": "WordPress Developer",
-                "company": "WebWorks Agency",
-                "location": "Denver, CO",
-                "link": "https://example.com/job10",
-                "description": "Custom WordPress themes and plugins"
-            }
-        ],
-        "android developer": [
-            {
-                "title": "Android Developer",
-                "company": "MobileTech Solutions",
-                "location": "Los Angeles, CA",
-                "link": "https://example.com/job11",
-                "description": "Native Android development with Kotlin and Java"
-            },
-            {
-                "title": "Mobile App Developer",
-                "company": "AppCraft Studios",
-                "location": "Portland, OR",
-                "link": "https://example.com/job12",
-                "description": "Cross-platform development with React Native"
-            }
-        ],
-        "ios developer": [
-            {
-                "title": "iOS Developer",
-                "company": "AppleTech Solutions",
-                "location": "Cupertino, CA",
-                "link": "https://example.com/job13",
-                "description": "Native iOS development with Swift and SwiftUI"
-            },
-            {
-                "title": "Mobile Developer",
-                "company": "AppInnovate",
-                "location": "San Diego, CA",
-                "link": "https://example.com/job14",
-                "description": "iOS and Android development with Flutter"
-            }
-        ],
-        "ui/ux designer": [
-            {
-                "title": "UI/UX Designer",
-                "company": "DesignStudio Pro",
-                "location": "Brooklyn, NY",
-                "link": "https://example.com/job15",
-                "description": "User interface design, wireframing, and prototyping"
-            },
-            {
-                "title": "Product Designer",
-                "company": "Creative Solutions",
-                "location": "Austin, TX",
-                "link": "https://example.com/job16",
-                "description": "User experience design and design systems"
-            }
-        ],
-        "python": [
-            {
-                "title": "Python Developer",
-                "company": "DataFlow Systems",
-                "location": "Austin, TX",
-                "link": "https://example.com/job17",
-                "description": "Backend development with Django, Flask, and PostgreSQL"
-            },
-            {
-                "title": "Python Engineer",
-                "company": "TechInnovate",
-                "location": "Seattle, WA",
-                "link": "https://example.com/job18",
-                "description": "Data processing, automation, and API development"
-            }
-        ],
-        "java": [
-            {
-                "title": "Java Developer",
-                "company": "Enterprise Solutions",
-                "location": "Boston, MA",
-                "link": "https://example.com/job19",
-                "description": "Enterprise application development with Spring Boot"
-            },
-            {
-                "title": "Java Engineer",
-                "company": "FinTech Corp",
-                "location": "New York, NY",
-                "link": "https://example.com/job20",
-                "description": "Financial software development and system integration"
-            }
-        ],
-        "javascript": [
-            {
-                "title": "JavaScript Developer",
-                "company": "WebTech Solutions",
-                "location": "San Francisco, CA",
-                "link": "https://example.com/job21",
-                "description": "Frontend development with React, Vue.js, and Node.js"
-            },
-            {
-                "title": "Full Stack JS Developer",
-                "company": "Digital Innovations",
-                "location": "Los Angeles, CA",
-                "link": "https://example.com/job22",
-                "description": "End-to-end web application development"
-            }
-        ],
-        "react": [
-            {
-                "title": "React Developer",
-                "company": "Frontend Masters",
-                "location": "Chicago, IL",
-                "link": "https://example.com/job23",
-                "description": "Modern React development with hooks and context"
-            },
-            {
-                "title": "React Native Developer",
-                "company": "Mobile Solutions",
-                "location": "Denver, CO",
-                "link": "https://example.com/job24",
-                "description": "Cross-platform mobile app development"
-            }
-        ],
-        "machine learning": [
-            {
-                "title": "Machine Learning Engineer",
-                "company": "AI Solutions",
-                "location": "Palo Alto, CA",
-                "link": "https://example.com/job25",
-                "description": "ML model development and deployment"
-            },
-            {
-                "title": "ML Research Engineer",
-                "company": "Research Labs",
-                "location": "Cambridge, MA",
-                "link": "https://example.com/job26",
-                "description": "Advanced ML research and implementation"
-            }
-        ],
-        "nepal": [
-            {
-                "title": "Software Developer",
-                "company": "TechNepal Solutions",
-                "location": "Kathmandu, Nepal",
-                "link": "https://example.com/job27",
-                "description": "Full-stack development for local and international clients"
-            },
-            {
-                "title": "Web Developer",
-                "company": "Digital Nepal",
-                "location": "Lalitpur, Nepal",
-                "link": "https://example.com/job28",
-                "description": "E-commerce and business website development"
-            },
-            {
-                "title": "Python Developer",
-                "company": "NepalTech Innovations",
-                "location": "Pokhara, Nepal",
-                "link": "https://example.com/job29",
-                "description": "Backend development and API integration"
-            },
-            {
-                "title": "React Developer",
-                "company": "Himalayan Digital",
-                "location": "Kathmandu, Nepal",
-                "link": "https://example.com/job30",
-                "description": "Frontend development for tourism and business applications"
-            }
-        ]
-    }
-    
-    # Find the best matching category
-    query_lower = query.lower()
-    best_matches = []
+    ranked = MOCK_JOB_INDEX.search(query, k=k)
+    if not ranked:
+        return MOCK_JOBS["software developer"][:k]
+    return [MOCK_JOB_LIST[doc_id] for doc_id, _ in ranked]
+
+def parse_indeed_html(html):
+    """
+    Parse an Indeed search results page.
+    Returns a list of jobs with title, company, location, and link.
+    """
+    jobs = []
+    soup = BeautifulSoup(html, "html.parser")
     
-    # Check for exact matches first
-    for category in mock_jobs.keys():
-        if category in query_lower or query_lower in category:
-            best_matches.append(category)
+    # Try multiple possible selectors for job cards
+    job_cards = soup.find_all("a", class_="tapItem")
+    if not job_cards:
+        job_cards = soup.find_all("div", class_="job_seen_beacon")
+    if not job_cards:
+        job_cards = soup.find_all("div", {"data-jk": True})
     
-    # If no exact matches, check for partial matches
-    if not best_matches:
-        for category in mock_jobs.keys():
-            # Check if any word in the query matches the category
-            query_words = query_lower.split()
-            for word in query_words:
-                if word in category or category in word:
-                    best_matches.append(category)
-                    break
+    for card in job_cards[:10]:  # Limit to 10 jobs
+        try:
+            # Try multiple selectors for each field
+            title_elem = (card.find("h2", class_="jobTitle") or 
+                         card.find("a", class_="jcs-JobTitle") or
+                         card.find("span", class_="jobTitle"))
+            
+            company_elem = (card.find("span", class_="companyName") or
+                           card.find("div", class_="companyName") or
+                           card.find("span", class_="company"))
+            
+            location_elem = (card.find("div", class_="companyLocation") or
+                            card.find("span", class_="location") or
+                            card.find("div", class_="location"))
+            
+            if title_elem and company_elem and location_elem:
+                title = title_elem.get_text(strip=True)
+                company = company_elem.get_text(strip=True)
+                location = location_elem.get_text(strip=True)
+                
+                # Get the job link
+                link = card.get("href", "")
+                if link and not link.startswith("http"):
+                    link = "https://www.indeed.com" + link
+                
+                if title and company and location:
+                    jobs.append({
+                        "title": title,
+                        "company": company,
+                        "location": location,
+                        "link": link,
+                        "description": f"{title} at {company}"
+                    })
+        except Exception as e:
+            continue  # Skip this job if there's an error
     
-    # If still no matches, use default
-    if not best_matches:
-        best_matches = ["software developer"]
+    return jobs
+
+def parse_listing_html(html, site_url):
+    """
+    Parse a JobsNepal/MeroJob style search results page (both boards share the markup).
+    Relative job links are resolved against `site_url`.
+    """
+    jobs = []
+    soup = BeautifulSoup(html, "html.parser")
     
-    # Collect jobs from all matching categories
-    all_jobs = []
-    for match in best_matches:
-        if match in mock_jobs:
-            all_jobs.extend(mock_jobs[match])
+    # Try multiple possible selectors
+    job_cards = soup.find_all("div", class_="job-listing")
+    if not job_cards:
+        job_cards = soup.find_all("div", class_="job-item")
+    if not job_cards:
+        job_cards = soup.find_all("div", class_="search-result")
     
-    # Remove duplicates and shuffle
-    unique_jobs = []
-    seen_titles = set()
-    for job in all_jobs:
-        if job['title'] not in seen_titles:
-            unique_jobs.append(job)
-            seen_titles.add(job['title'])
+    for card in job_cards[:10]:
+        try:
+            title_elem = (card.find("a", class_="job-title") or
+                         card.find("h3") or
+                         card.find("a", class_="title"))
+            
+            company_elem = (card.find("div", class_="company-name") or
+                           card.find("span", class_="company") or
+                           card.find("div", class_="employer"))
+            
+            location_elem = (card.find("div", class_="job-location") or
+                            card.find("span", class_="location") or
+                            card.find("div", class_="address"))
+            
+            if title_elem and company_elem and location_elem:
+                title = title_elem.get_text(strip=True)
+                company = company_elem.get_text(strip=True)
+                location = location_elem.get_text(strip=True)
+                
+                link = title_elem.get("href", "")
+                if link and not link.startswith("http"):
+                    link = site_url + link
+                
+                if title and company and location:
+                    jobs.append({
+                        "title": title,
+                        "company": company,
+                        "location": location,
+                        "link": link,
+                        "description": f"{title} at {company}"
+                    })
+        except Exception as e:
+            continue
     
-    random.shuffle(unique_jobs)
-    return unique_jobs[:5]  # Return up to 5 jobs
+    return jobs
+
+def parse_jobsnepal_html(html):
+    return parse_listing_html(html, "https://www.jobsnepal.com")
+
+def parse_merojob_html(html):
+    return parse_listing_html(html, "https://merojob.com")
 
-def scrape_indeed_jobs(query="software developer", location=""):
+def scrape_indeed_jobs(query="software developer", location="", timeout=15):
     """
     Scrape job listings from Indeed for a given query and location.
     Returns a list of jobs with title, company, location, and link.
@@ -293,264 +399,140 @@ def scrape_indeed_jobs(query="software developer", location=""):
     jobs = []
     try:
         # Use a more robust approach with better headers and error handling
-        base_url = "https://www.indeed.com/jobs"
+        base_url = INDEED_URL
         params = {
             "q": query,
             "l": location,
             "sort": "date"
         }
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
-        
-        response = requests.get(base_url, params=params, headers=headers, timeout=15)
+        response = http_client.get(base_url, params=params, timeout=timeout)
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # Try multiple possible selectors for job cards
-        job_cards = soup.find_all("a", class_="tapItem")
-        if not job_cards:
-            job_cards = soup.find_all("div", class_="job_seen_beacon")
-        if not job_cards:
-            job_cards = soup.find_all("div", {"data-jk": True})
-        
-        for card in job_cards[:10]:  # Limit to 10 jobs
-            try:
-                # Try multiple selectors for each field
-                title_elem = (card.find("h2", class_="jobTitle") or 
-                             card.find("a", class_="jcs-JobTitle") or
-                             card.find("span", class_="jobTitle"))
-                
-                company_elem = (card.find("span", class_="companyName") or
-                               card.find("div", class_="companyName") or
-                               card.find("span", class_="company"))
-                
-                location_elem = (card.find("div", class_="companyLocation") or
-                                card.find("span", class_="location") or
-                                card.find("div", class_="location"))
-                
-                if title_elem and company_elem and location_elem:
-                    title = title_elem.get_text(strip=True)
-                    company = company_elem.get_text(strip=True)
-                    location = location_elem.get_text(strip=True)
-                    
-                    # Get the job link
-                    link = card.get("href", "")
-                    if link and not link.startswith("http"):
-                        link = "https://www.indeed.com" + link
-                    
-                    if title and company and location:
-                        jobs.append({
-                            "title": title,
-                            "company": company,
-                            "location": location,
-                            "link": link,
-                            "description": f"{title} at {company}"
-                        })
-            except Exception as e:
-                continue  # Skip this job if there's an error
+        jobs = parse_indeed_html(response.text)
                 
     except Exception as e:
         print(f"Error scraping Indeed: {e}")
     
     return jobs
 
-def scrape_jobsnepal_jobs(query="software developer"):
+def scrape_jobsnepal_jobs(query="software developer", timeout=15):
     """
     Scrape job listings from JobsNepal for a given query.
     Returns a list of jobs with title, company, location, and link.
     """
     jobs = []
     try:
-        base_url = "https://www.jobsnepal.com/search"
+        base_url = JOBSNEPAL_URL
         params = {
             "q": query,
             "page": 1
         }
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        }
-        
-        response = requests.get(base_url, params=params, headers=headers, timeout=15)
+        response = http_client.get(base_url, params=params, timeout=timeout)
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # Try multiple possible selectors
-        job_cards = soup.find_all("div", class_="job-listing")
-        if not job_cards:
-            job_cards = soup.find_all("div", class_="job-item")
-        if not job_cards:
-            job_cards = soup.find_all("div", class_="search-result")
-        
-        for card in job_cards[:10]:
-            try:
-                title_elem = (card.find("a", class_="job-title") or
-                             card.find("h3") or
-                             card.find("a", class_="title"))
-                
-                company_elem = (card.find("div", class_="company-name") or
-                               card.find("span", class_="company") or
-                               card.find("div", class_="employer"))
-                
-                location_elem = (card.find("div", class_="job-location") or
-                                card.find("span", class_="location") or
-                                card.find("div", class_="address"))
-                
-                if title_elem and company_elem and location_elem:
-                    title = title_elem.get_text(strip=True)
-                    company = company_elem.get_text(strip=True)
-                    location = location_elem.get_text(strip=True)
-                    
-                    link = title_elem.get("href", "")
-                    if link and not link.startswith("http"):
-                        link = "https://www.jobsnepal.com" + link
-                    
-                    if title and company and location:
-                        jobs.append({
-                            "title": title,
-                            "company": company,
-                            "location": location,
-                            "link": link,
-                            "description": f"{title} at {company}"
-                        })
-            except Exception as e:
-                continue
+        jobs = parse_jobsnepal_html(response.text)
                 
     except Exception as e:
         print(f"Error scraping JobsNepal: {e}")
     
     return jobs
 
-def scrape_merojob_jobs(query="software developer"):
+def scrape_merojob_jobs(query="software developer", timeout=15):
     """
     Scrape job listings from MeroJob for a given query.
     Returns a list of jobs with title, company, location, and link.
     """
     jobs = []
     try:
-        base_url = "https://merojob.com/jobs"
+        base_url = MEROJOB_URL
         params = {
             "search": query,
             "page": 1
         }
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        }
-        
-        response = requests.get(base_url, params=params, headers=headers, timeout=15)
+        response = http_client.get(base_url, params=params, timeout=timeout)
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # Try multiple possible selectors
-        job_cards = soup.find_all("div", class_="job-listing")
-        if not job_cards:
-            job_cards = soup.find_all("div", class_="job-item")
-        if not job_cards:
-            job_cards = soup.find_all("div", class_="search-result")
-        
-        for card in job_cards[:10]:
-            try:
-                title_elem = (card.find("a", class_="job-title") or
-                             card.find("h3") or
-                             card.find("a", class_="title"))
-                
-                company_elem = (card.find("div", class_="company-name") or
-                               card.find("span", class_="company") or
-                               card.find("div", class_="employer"))
-                
-                location_elem = (card.find("div", class_="job-location") or
-                                card.find("span", class_="location") or
-                                card.find("div", class_="address"))
-                
-                if title_elem and company_elem and location_elem:
-                    title = title_elem.get_text(strip=True)
-                    company = company_elem.get_text(strip=True)
-                    location = location_elem.get_text(strip=True)
-                    
-                    link = title_elem.get("href", "")
-                    if link and not link.startswith("http"):
-                        link = "https://merojob.com" + link
-                    
-                    if title and company and location:
-                        jobs.append({
-                            "title": title,
-                            "company": company,
-                            "location": location,
-                            "link": link,
-                            "description": f"{title} at {company}"
-                        })
-            except Exception as e:
-                continue
+        jobs = parse_merojob_html(response.text)
                 
     except Exception as e:
         print(f"Error scraping MeroJob: {e}")
     
     return jobs
 
-def get_global_jobs(query="software developer"):
+# Live job boards, each called as scraper(query=..., timeout=...). Only the ingestion
+# worker (job_ingest.py) scrapes them; the request path reads the job index.
+JOB_SOURCES = {
+    "indeed": scrape_indeed_jobs,
+    "jobsnepal": scrape_jobsnepal_jobs,
+    "merojob": scrape_merojob_jobs,
+}
+
+def fetch_source(name, scraper, query, timeout, cache=None):
+    """Run one scraper, going through `cache` (a job_cache.JobCache) when one is given."""
+    def fetch():
+        return scraper(query=query, timeout=timeout)
+    if cache is None:
+        return fetch()
+    return cache.get_or_fetch(name, query, "", fetch)
+
+def merge_jobs(jobs_by_query, min_jobs=3):
     """
-    Get job recommendations with fallback to mock data if scraping fails.
+    Flatten (query, jobs) pairs in order, deduplicating by title.
+    Queries with fewer than `min_jobs` results are topped up from get_mock_jobs.
     """
     jobs = []
-    
-    # Try to get real jobs first
-    try:
-        jobs.extend(scrape_indeed_jobs(query=query))
-        time.sleep(1)  # Be respectful to servers
-    except Exception as e:
-        print(f"Indeed scraping failed: {e}")
-    
-    # If we don't have enough jobs, add mock jobs
-    if len(jobs) < 3:
-        mock_jobs = get_mock_jobs(query=query)
-        # Add mock jobs that aren't duplicates
-        seen_titles = {job['title'] for job in jobs}
-        for mock_job in mock_jobs:
-            if mock_job['title'] not in seen_titles:
-                jobs.append(mock_job)
-                seen_titles.add(mock_job['title'])
-    
-    return jobs[:10]  # Return up to 10 jobs
+    seen_titles = set()
+
+    def add(job):
+        if job['title'] not in seen_titles:
+            jobs.append(job)
+            seen_titles.add(job['title'])
 
-def get_nepal_jobs(query="software developer"):
+    for query, query_jobs in jobs_by_query:
+        for job in query_jobs:
+            add(job)
+        if len(query_jobs) < min_jobs:
+            for job in get_mock_jobs(query=query):
+                add(job)
+
+    return jobs
+
+def search_jobs(queries, index=None, limit=10, min_jobs=3):
     """
-    Get Nepal-specific job recommendations with fallback to mock data.
+    Get jobs for the queries from the local job index kept up to date by job_ingest.py.
+    Nothing is scraped on this path; queries the index cannot answer fall back to mock jobs.
+    """
+    if index is None:
+        index = job_index.default_index()
+    return merge_jobs([(query, index.search(query, limit=limit)) for query in queries], min_jobs)
+
+_matcher_lock = threading.Lock()
+_matcher_cache = {}
+
+def get_job_matcher(index=None):
+    """
+    JobMatcher over the indexed postings plus the mock catalog.
+    Built once per process and rebuilt only when the job index changes.
+    """
+    if index is None:
+        index = job_index.default_index()
+    key = (id(index), index.version())
+    with _matcher_lock:
+        if _matcher_cache.get('key') != key:
+            jobs = index.all_jobs()
+            seen_titles = {job['title'] for job in jobs}
+            jobs.extend(job for job in MOCK_JOB_LIST if job['title'] not in seen_titles)
+            _matcher_cache['matcher'] = JobMatcher(jobs)
+            _matcher_cache['key'] = key
+        return _matcher_cache['matcher']
+
+def recommend_jobs(skills, resume_text="", k=15, index=None):
+    """
+    Rank every known posting against the resume skills and text in one
+    matrix-vector product. Returns the top `k` jobs (deduplicated by title),
+    each with a "score" field holding its cosine similarity.
     """
     jobs = []
-    
-    # Try to get real Nepal jobs
-    try:
-        jobs.extend(scrape_jobsnepal_jobs(query=query))
-        time.sleep(1)
-    except Exception as e:
-        print(f"JobsNepal scraping failed: {e}")
-    
-    try:
-        jobs.extend(scrape_merojob_jobs(query=query))
-        time.sleep(1)
-    except Exception as e:
-        print(f"MeroJob scraping failed: {e}")
-    
-    # If we don't have enough jobs, add mock jobs
-    if len(jobs) < 3:
-        mock_jobs = get_mock_jobs(query=query)
-        # Add mock jobs that aren't duplicates
-        seen_titles = {job['title'] for job in jobs}
-        for mock_job in mock_jobs:
-            if mock_job['title'] not in seen_titles:
-                jobs.append(mock_job)
-                seen_titles.add(mock_job['title'])
-    
-    return jobs[:10]  # Return up to 10 jobs
+    seen_titles = set()
+    for job, score in get_job_matcher(index).match(skills, resume_text, k=k * 2):
+        if job['title'] not in seen_titles:
+            jobs.append(dict(job, score=round(score, 4)))
+            seen_titles.add(job['title'])
+    return jobs[:k]
@@ -1,12 +1,10 @@
-import requests
+import http_client
 from bs4 import BeautifulSoup
 
-# Helper function to fetch and parse HTML
+# Helper function to fetch and parse HTML (shared keep-alive session, default browser headers)
 
 def get_soup(url, headers=None):
-    if headers is None:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36'}
-    resp = requests.get(url, headers=headers)
+    resp = http_client.get(url, headers=headers)
     resp.raise_for_status()
     return BeautifulSoup(resp.text, 'html.parser'), resp.text
 
@@ -0,0 +1,60 @@
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+(?:[+#]+)?')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, keeping suffixes such as c++ and c#"""
+    return TOKEN_PATTERN.findall((text or '').lower())
+
+
+class InvertedIndex:
+    """
+    BM25-ranked inverted index over a fixed list of documents.
+
+    Each document is a list of (text, weight) fields; a field with weight 2
+    counts its terms twice. The index is built once, and a query only visits
+    the postings of its own terms, so lookups stay cheap as the catalog grows.
+    Ties are broken by document order, which keeps results deterministic.
+    """
+
+    def __init__(self, documents: Sequence[Iterable[Tuple[str, int]]], k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = defaultdict(list)
+        self.doc_lengths = []
+        for doc_id, fields in enumerate(documents):
+            counts = Counter()
+            for text, weight in fields:
+                for token in tokenize(text):
+                    counts[token] += weight
+            self.doc_lengths.append(sum(counts.values()))
+            for token, tf in counts.items():
+                self.postings[token].append((doc_id, tf))
+        self.num_docs = len(self.doc_lengths)
+        self.avg_length = (sum(self.doc_lengths) / self.num_docs) if self.num_docs else 0.0
+        self.idf = {
+            token: math.log(1 + (self.num_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for token, docs in self.postings.items()
+        }
+
+    def scores(self, query: str) -> Dict[int, float]:
+        """BM25 score of every document sharing at least one term with the query"""
+        scores = defaultdict(float)
+        for token in set(tokenize(query)):
+            idf = self.idf.get(token)
+            if idf is None:
+                continue
+            for doc_id, tf in self.postings[token]:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_length)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return scores
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[int, float]]:
+        """Top `k` (doc_id, score) pairs, best first"""
+        scores = self.scores(query)
+        return heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
@@ -0,0 +1,84 @@
+from collections import deque
+from typing import Dict, Iterable, List
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over several named keyword vocabularies.
+
+    All terms of every vocabulary are compiled into one trie with failure
+    links, so find() scans the text once no matter how many terms there are.
+    Matching is case-insensitive and only accepts whole words or phrases: a
+    hit must not be preceded or followed by a letter or digit, so "r" does not
+    match inside "docker" and "led" does not match inside "skilled".
+    """
+
+    def __init__(self, vocabularies: Dict[str, Iterable[str]]):
+        self.vocabularies = {name: list(dict.fromkeys(term.lower() for term in terms))
+                             for name, terms in vocabularies.items()}
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        # term -> [(vocabulary, position in vocabulary)]
+        self._owners = {}
+        for name, terms in self.vocabularies.items():
+            for position, term in enumerate(terms):
+                if term not in self._owners:
+                    self._owners[term] = []
+                    self._add(term)
+                self._owners[term].append((name, position))
+        self._link()
+
+    def _add(self, term: str) -> None:
+        node = 0
+        for char in term:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][char] = next_node
+            node = next_node
+        self._output[node].append(term)
+
+    def _link(self) -> None:
+        """Breadth-first pass setting failure links and merging suffix outputs"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def terms(self, text: str) -> set:
+        """Every distinct term found in `text` on word boundaries"""
+        text = (text or '').lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for term in output[node]:
+                if term in found:
+                    continue
+                start = end - len(term)
+                if (start == 0 or not text[start - 1].isalnum()) and \
+                        (end == len(text) or not text[end].isalnum()):
+                    found.add(term)
+        return found
+
+    def find(self, text: str) -> Dict[str, List[str]]:
+        """Hits per vocabulary in one scan, each list in the vocabulary's own order"""
+        positions = {name: [] for name in self.vocabularies}
+        for term in self.terms(text):
+            for name, position in self._owners[term]:
+                positions[name].append(position)
+        return {name: [self.vocabularies[name][position] for position in sorted(found)]
+                for name, found in positions.items()}
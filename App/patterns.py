@@ -0,0 +1,79 @@
+"""
+Regular expressions shared by App.py and resume_scorer.py, compiled once at import.
+"""
+
+import re
+from typing import Optional
+
+EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE = re.compile(r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+NUMBER = re.compile(r'\b\d+(?:\.\d+)?%?\b')
+
+# Matched against a stripped line
+HEADER = re.compile(r'^[A-Z][A-Z\s]+$')
+BULLET = re.compile(r'^[\-\*•]\s')
+
+WHITESPACE = re.compile(r'\s+')
+SPECIAL_CHARACTERS = re.compile(r'[^\w\s\-\.\,\;\:\!\?\(\)]')
+
+# Layout-preserving preprocessing: whitespace within a line, line breaks
+# (including page breaks), and the characters kept so emails, phone numbers,
+# percentages, bullets and skills like c++ still match
+HORIZONTAL_WHITESPACE = re.compile(r'[^\S\n]+')
+LINE_BREAK = re.compile(r'\r\n?|[\f\v\x1c-\x1e\x85\u2028\u2029]')
+LAYOUT_SPECIAL_CHARACTERS = re.compile(r'[^\w\s\-\.\,\;\:\!\?\(\)@+#/%&\*•]')
+SKILL = re.compile(r'\b[A-Za-z][A-Za-z\s\+#\.]+(?:\+|\s|$)')
+
+# Section header keywords, earlier sections win when a line mentions several
+SECTION_PATTERNS = {
+    'contact': r'(contact|phone|email|address|location)',
+    'summary': r'(summary|profile|objective|about)',
+    'experience': r'(experience|work experience|employment|professional experience)',
+    'education': r'(education|academic|qualification|degree)',
+    'skills': r'(skills|technical skills|competencies|expertise)',
+    'projects': r'(projects|portfolio|work samples)',
+    'certifications': r'(certifications|certificates|accreditations)',
+    'achievements': r'(achievements|awards|recognition|honors)',
+    'volunteer': r'(volunteer|volunteering|community service)',
+    'languages': r'(languages|language skills)',
+    'interests': r'(interests|hobbies|activities)'
+}
+
+# Every section keyword as one alternation with a named group per section. The
+# alternation sits in a lookahead, so finditer() tries it at each position of
+# the line in a single left-to-right scan and reports keywords that overlap
+# ("language skills" holds both languages and skills); at each position the
+# earliest section in SECTION_PATTERNS is the one reported.
+SECTION_KEYWORDS = re.compile(
+    '(?=' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in SECTION_PATTERNS.items()) + ')',
+    re.IGNORECASE
+)
+SECTION_PRIORITY = {name: rank for rank, name in enumerate(SECTION_PATTERNS)}
+
+# A heading line of the layout-preserving mode: the keyword with at most one
+# qualifying word before and after it ("Professional Summary", "Contact
+# Information", "Awards & Honors") and an optional colon. Contact details ("Email: ...") and prose
+# that mentions a section word are not headings.
+SECTION_HEADING = re.compile(
+    r'^\s*(?:[a-z]+\s+)??(?:' +
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in SECTION_PATTERNS.items()) +
+    r')(?:\s*(?:&|and|/)\s*[a-z]+|\s+[a-z]+)?\s*:?\s*$',
+    re.IGNORECASE
+)
+
+
+def detect_section(line: str) -> Optional[str]:
+    """Name of the first section in SECTION_PATTERNS mentioned anywhere in the line, or None"""
+    section = None
+    for match in SECTION_KEYWORDS.finditer(line):
+        if section is None or SECTION_PRIORITY[match.lastgroup] < SECTION_PRIORITY[section]:
+            section = match.lastgroup
+            if SECTION_PRIORITY[section] == 0:
+                break
+    return section
+
+
+def detect_heading(line: str) -> Optional[str]:
+    """Name of the section a line that is only a heading introduces, or None"""
+    match = SECTION_HEADING.match(line)
+    return match.lastgroup if match else None
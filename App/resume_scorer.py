@@ -1,29 +1,230 @@
-import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.stem import WordNetLemmatizer
-import spacy
+import json
+import threading
+import multiprocessing as mp
 from collections import Counter
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 import logging
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+import patterns
+from keyword_matcher import KeywordMatcher
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# Score components in the order of ResumeScorer.weights and component_scores
+COMPONENTS = (
+    'content_completeness', 'content_quality', 'structure_formatting', 'skills_analysis',
+    'action_verbs', 'professional_presentation', 'industry_specific'
+)
 
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet')
+# Keys of the component scores in generate_recommendations()
+RECOMMENDATION_KEYS = {
+    'content_completeness': 'completeness',
+    'content_quality': 'quality',
+    'structure_formatting': 'structure',
+    'skills_analysis': 'skills',
+    'action_verbs': 'action_verbs',
+    'professional_presentation': 'presentation',
+    'industry_specific': 'industry'
+}
+
+# (lowest overall score, grade, description), best grade first
+GRADES = (
+    (90, 'A+', 'Excellent'),
+    (80, 'A', 'Very Good'),
+    (70, 'B+', 'Good'),
+    (60, 'B', 'Above Average'),
+    (50, 'C+', 'Average'),
+    (40, 'C', 'Below Average'),
+    (float('-inf'), 'D', 'Needs Improvement')
+)
+
+
+def grade_for(overall_score: float) -> Tuple[str, str]:
+    """(grade, description) of an overall score"""
+    for minimum, grade, description in GRADES:
+        if overall_score >= minimum:
+            return grade, description
+
+# NLTK and spaCy are imported and loaded on first use, once per process
+_resources = {}
+_resources_lock = threading.RLock()
+
+
+def _shared(name, load):
+    with _resources_lock:
+        if name not in _resources:
+            _resources[name] = load()
+        return _resources[name]
+
+
+def _require_nltk_data(path: str, package: str) -> None:
+    """Fail fast when NLTK data is missing instead of downloading it at run time"""
+    import nltk
+    try:
+        nltk.data.find(path)
+    except LookupError:
+        raise LookupError(
+            f"NLTK data '{package}' is not installed; install it with "
+            f"'python -m nltk.downloader {package}'"
+        ) from None
+
+
+def _load_tokenizers():
+    import nltk.tokenize
+    # NLTK >= 3.8.2 reads the punkt model from 'punkt_tab'
+    package = 'punkt_tab' if hasattr(nltk.tokenize, 'PunktTokenizer') else 'punkt'
+    _require_nltk_data(f'tokenizers/{package}', package)
+    return nltk.tokenize.sent_tokenize, nltk.tokenize.word_tokenize
+
+
+def _load_stop_words():
+    _require_nltk_data('corpora/stopwords', 'stopwords')
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words('english'))
+
+
+def _load_lemmatizer():
+    _require_nltk_data('corpora/wordnet', 'wordnet')
+    from nltk.stem import WordNetLemmatizer
+    return WordNetLemmatizer()
+
+
+def _load_nlp():
+    import spacy
+    return spacy.load('en_core_web_sm')
+
+
+def get_tokenizers():
+    """NLTK (sent_tokenize, word_tokenize), checking the punkt data once"""
+    return _shared('tokenizers', _load_tokenizers)
+
+
+def get_stop_words() -> frozenset:
+    return _shared('stop_words', _load_stop_words)
+
+
+def get_lemmatizer():
+    return _shared('lemmatizer', _load_lemmatizer)
+
+
+def get_nlp():
+    return _shared('nlp', _load_nlp)
+
+class AnalyzedResume:
+    """
+    One resume analyzed once and shared by every score component.
+    
+    Holds the preprocessed text, its lowercase form, lines, sentences, word
+    tokens and sections, plus the keyword hits of the full text. Keyword hits
+    of individual sections are computed on first use and then reused.
+    """
+    
+    def __init__(self, text: str, sections: Dict[str, str], keyword_matcher: KeywordMatcher):
+        self.text = text
+        self.lower = text.lower()
+        self.lines = text.split('\n')
+        sent_tokenize, word_tokenize = get_tokenizers()
+        self.sentences = sent_tokenize(text)
+        self.sentence_tokens = [word_tokenize(sentence) for sentence in self.sentences]
+        # word_tokenize tokenizes sentence by sentence, so the flattened tokens are the same
+        self.tokens = [token.lower() for tokens in self.sentence_tokens for token in tokens]
+        self.sections = sections
+        self.keywords = keyword_matcher.find(text)
+        self._keyword_matcher = keyword_matcher
+        self._section_keywords = {}
+    
+    def section_keywords(self, name: str) -> Dict[str, List[str]]:
+        """Keyword hits of one section, an empty section has none"""
+        if name not in self._section_keywords:
+            self._section_keywords[name] = self._keyword_matcher.find(self.sections.get(name, ''))
+        return self._section_keywords[name]
+
+class ScoreColumns:
+    """
+    Scores of many resumes stored column by column.
+    
+    `components` maps every component name to a float NumPy array with one
+    entry per resume, `overall` holds the weighted scores, and `grades` and
+    `details` keep the per-resume grade and detailed analysis in input order.
+    """
+    
+    def __init__(self, components: Dict[str, np.ndarray], overall: np.ndarray,
+                 grades: List[str], details: List[Dict]):
+        self.components = components
+        self.overall = overall
+        self.grades = grades
+        self.details = details
+    
+    @classmethod
+    def from_results(cls, results: Iterable[Dict]) -> 'ScoreColumns':
+        """Collect calculate_overall_score() results, e.g. streamed from score_many()"""
+        columns = {name: [] for name in COMPONENTS}
+        overall, grades, details = [], [], []
+        for result in results:
+            for name in COMPONENTS:
+                columns[name].append(result['component_scores'][name])
+            overall.append(result['overall_score'])
+            grades.append(result['grade'])
+            details.append(result['detailed_analysis'])
+        components = {name: np.asarray(values, dtype=np.float64) for name, values in columns.items()}
+        return cls(components, np.asarray(overall, dtype=np.float64), grades, details)
+    
+    def __len__(self) -> int:
+        return len(self.overall)
+    
+    def matrix(self) -> np.ndarray:
+        """Component scores as an (n_resumes, len(COMPONENTS)) array"""
+        return np.column_stack([self.components[name] for name in COMPONENTS])
+    
+    def save(self, path: str) -> None:
+        """
+        Write the columns to one compressed .npz file.
+        
+        Details are UTF-8 JSON documents concatenated into one byte array with
+        an offsets array (document i is bytes offsets[i]:offsets[i + 1]), so
+        each takes its own length rather than that of the longest one.
+        """
+        encoded = [json.dumps(d, default=_json_default).encode('utf-8') for d in self.details]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(document) for document in encoded])
+        np.savez_compressed(
+            path,
+            components=self.matrix(),
+            overall=self.overall,
+            grades=np.asarray(self.grades, dtype=str),
+            details=np.frombuffer(b''.join(encoded), dtype=np.uint8),
+            details_offsets=offsets
+        )
+    
+    @classmethod
+    def load(cls, path: str) -> 'ScoreColumns':
+        with np.load(path) as data:
+            matrix = data['components']
+            components = {name: matrix[:, i].copy() for i, name in enumerate(COMPONENTS)}
+            blob = data['details'].tobytes()
+            offsets = data['details_offsets'].tolist()
+            details = [json.loads(blob[start:end]) for start, end in zip(offsets, offsets[1:])]
+            return cls(components, data['overall'], data['grades'].tolist(), details)
+
+
+def _json_default(value):
+    # NumPy scalars that end up in the detailed analysis
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+# The scorer of a score_many() worker process, created once by the pool initializer
+_worker = {}
+
+
+def _init_score_worker(scorer_class, weights):
+    scorer = scorer_class()
+    scorer.weights = dict(weights)
+    get_tokenizers()
+    _worker['scorer'] = scorer
+
+
+def _score_text(text):
+    return _worker['scorer'].calculate_overall_score(text)
 
 class ResumeScorer:
     """
@@ -39,11 +240,7 @@ class ResumeScorer:
     """
     
     def __init__(self):
-        self.nlp = spacy.load('en_core_web_sm')
-        self.lemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
-        
-        # Scoring weights for different components
+        # Scoring weights for different components, keys as in COMPONENTS
         self.weights = {
             'content_completeness': 0.25,
             'content_quality': 0.20,
@@ -104,6 +301,41 @@ class ResumeScorer:
             'proper grammar', 'concise writing', 'logical flow', 'relevant content'
         ]
         
+        # Vocabularies of the individual score components
+        self.professional_words = ['collaborated', 'implemented', 'developed', 'managed', 'led', 'achieved']
+        self.professional_terms = ['collaborated', 'implemented', 'developed', 'managed', 'achieved', 'delivered', 'optimized']
+        self.technical_keywords = ['python', 'java', 'javascript', 'sql', 'html', 'css', 'react', 'angular', 'node', 'docker', 'aws', 'machine learning', 'data analysis']
+        self.soft_keywords = ['leadership', 'communication', 'teamwork', 'problem solving', 'time management', 'collaboration', 'adaptability']
+        self.current_skills = ['python', 'javascript', 'react', 'node.js', 'docker', 'kubernetes', 'aws', 'machine learning', 'data science']
+        self.skill_categories = ['technical', 'soft', 'programming', 'tools', 'languages']
+        self.resume_terms = ['resume', 'cv', 'curriculum vitae']
+        self.certification_terms = ['certification', 'certifications', 'certificate', 'certificates']
+        self.industry_section_terms = {
+            'data_science': ['projects', 'research', 'analysis'],
+            'web_development': ['projects', 'portfolio', 'deployment'],
+            'mobile_development': ['apps', 'mobile', 'ios', 'android'],
+            'ui_ux': ['design', 'prototype', 'wireframe']
+        }
+        
+        # One automaton for every vocabulary, so each text is scanned once
+        vocabularies = {
+            'action_verbs': self.action_verbs,
+            'impact_metrics': self.impact_metrics,
+            'professional_words': self.professional_words,
+            'professional_terms': self.professional_terms,
+            'technical_keywords': self.technical_keywords,
+            'soft_keywords': self.soft_keywords,
+            'current_skills': self.current_skills,
+            'skill_categories': self.skill_categories,
+            'resume_terms': self.resume_terms,
+            'certification_terms': self.certification_terms
+        }
+        for industry, keywords in self.industry_keywords.items():
+            vocabularies[f'industry:{industry}'] = keywords
+        for industry, terms in self.industry_section_terms.items():
+            vocabularies[f'industry_sections:{industry}'] = terms
+        self.keyword_matcher = KeywordMatcher(vocabularies)
+        
         # Required sections for a complete resume
         self.required_sections = [
             'contact information', 'summary', 'objective', 'experience', 'work experience',
@@ -114,38 +346,57 @@ class ResumeScorer:
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
     
-    def preprocess_text(self, text: str) -> str:
-        """Clean and preprocess the resume text"""
+    # Not needed for scoring, loaded only when accessed and shared by every scorer
+    @property
+    def nlp(self):
+        return get_nlp()
+    
+    @property
+    def lemmatizer(self):
+        return get_lemmatizer()
+    
+    @property
+    def stop_words(self) -> frozenset:
+        return get_stop_words()
+    
+    def preprocess_text(self, text: str, keep_lines: bool = False) -> str:
+        """
+        Clean and preprocess the resume text.
+        
+        By default the text is lowercased and flattened into one line. With
+        `keep_lines` the layout is kept instead: case, line breaks and blank
+        lines survive, page breaks become line breaks, and only whitespace
+        within a line is collapsed, so headers, bullets and spacing can be
+        scored per line.
+        """
+        if keep_lines:
+            text = patterns.LINE_BREAK.sub('\n', text)
+            text = patterns.LAYOUT_SPECIAL_CHARACTERS.sub('', text)
+            lines = (patterns.HORIZONTAL_WHITESPACE.sub(' ', line).strip() for line in text.split('\n'))
+            return '\n'.join(lines).strip('\n')
+        
         # Convert to lowercase
         text = text.lower()
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = patterns.WHITESPACE.sub(' ', text)
         
         # Remove special characters but keep important ones
-        text = re.sub(r'[^\w\s\-\.\,\;\:\!\?\(\)]', '', text)
+        text = patterns.SPECIAL_CHARACTERS.sub('', text)
         
         return text.strip()
     
-    def extract_sections(self, text: str) -> Dict[str, str]:
-        """Extract different sections from the resume"""
+    def extract_sections(self, text: str, headings_only: bool = False) -> Dict[str, str]:
+        """
+        Extract different sections from the resume, one line at a time.
+        
+        With `headings_only` a line starts a section only when it is nothing
+        but a heading (patterns.SECTION_HEADING), otherwise when it mentions
+        a section keyword anywhere.
+        """
+        detect = patterns.detect_heading if headings_only else patterns.detect_section
         sections = {}
         
-        # Common section headers
-        section_patterns = {
-            'contact': r'(contact|phone|email|address|location)',
-            'summary': r'(summary|profile|objective|about)',
-            'experience': r'(experience|work experience|employment|professional experience)',
-            'education': r'(education|academic|qualification|degree)',
-            'skills': r'(skills|technical skills|competencies|expertise)',
-            'projects': r'(projects|portfolio|work samples)',
-            'certifications': r'(certifications|certificates|accreditations)',
-            'achievements': r'(achievements|awards|recognition|honors)',
-            'volunteer': r'(volunteer|volunteering|community service)',
-            'languages': r'(languages|language skills)',
-            'interests': r'(interests|hobbies|activities)'
-        }
-        
         lines = text.split('\n')
         current_section = 'general'
         current_content = []
@@ -155,18 +406,14 @@ class ResumeScorer:
             if not line:
                 continue
                 
-            # Check if this line is a section header
-            section_found = False
-            for section_name, pattern in section_patterns.items():
-                if re.search(pattern, line, re.IGNORECASE):
-                    if current_content:
-                        sections[current_section] = ' '.join(current_content)
-                    current_section = section_name
-                    current_content = []
-                    section_found = True
-                    break
-            
-            if not section_found:
+            # Check if this line is a section header (patterns.SECTION_PATTERNS)
+            section_name = detect(line)
+            if section_name:
+                if current_content:
+                    sections[current_section] = ' '.join(current_content)
+                current_section = section_name
+                current_content = []
+            else:
                 current_content.append(line)
         
         # Add the last section
@@ -175,8 +422,15 @@ class ResumeScorer:
         
         return sections
     
-    def calculate_content_completeness_score(self, sections: Dict[str, str], text: str) -> Tuple[float, Dict]:
+    def analyze_text(self, text: str, keep_lines: bool = False) -> AnalyzedResume:
+        """Preprocess, split into sections and tokenize a resume once for all components"""
+        processed_text = self.preprocess_text(text, keep_lines)
+        sections = self.extract_sections(processed_text, headings_only=keep_lines)
+        return AnalyzedResume(processed_text, sections, self.keyword_matcher)
+    
+    def calculate_content_completeness_score(self, doc: AnalyzedResume) -> Tuple[float, Dict]:
         """Calculate score based on content completeness"""
+        sections = doc.sections
         score = 0
         max_score = 100
         details = {}
@@ -196,30 +450,29 @@ class ResumeScorer:
         
         # Check for contact information completeness
         contact_info = sections.get('contact', '') + sections.get('general', '')
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        phone_pattern = r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+        has_email = bool(patterns.EMAIL.search(contact_info))
+        has_phone = bool(patterns.PHONE.search(contact_info))
         
-        if re.search(email_pattern, contact_info):
+        if has_email:
             score += 5
-        if re.search(phone_pattern, contact_info):
+        if has_phone:
             score += 5
         
         details['found_sections'] = found_sections
         details['essential_sections_found'] = essential_found
-        details['has_email'] = bool(re.search(email_pattern, contact_info))
-        details['has_phone'] = bool(re.search(phone_pattern, contact_info))
+        details['has_email'] = has_email
+        details['has_phone'] = has_phone
         
         return min(score, max_score), details
     
-    def calculate_content_quality_score(self, sections: Dict[str, str], text: str) -> Tuple[float, Dict]:
+    def calculate_content_quality_score(self, doc: AnalyzedResume) -> Tuple[float, Dict]:
         """Calculate score based on content quality"""
         score = 0
         max_score = 100
         details = {}
         
         # Analyze sentence structure and complexity
-        sentences = sent_tokenize(text)
-        avg_sentence_length = np.mean([len(word_tokenize(sent)) for sent in sentences])
+        avg_sentence_length = np.mean([len(tokens) for tokens in doc.sentence_tokens])
         
         # Optimal sentence length is between 10-20 words
         if 10 <= avg_sentence_length <= 20:
@@ -232,33 +485,26 @@ class ResumeScorer:
             score += 5
         
         # Check for action verbs in experience section
-        experience_text = sections.get('experience', '')
-        action_verbs_found = []
-        for verb in self.action_verbs:
-            if verb in experience_text.lower():
-                action_verbs_found.append(verb)
+        experience_text = doc.sections.get('experience', '')
+        experience_hits = doc.section_keywords('experience')
+        action_verbs_found = experience_hits['action_verbs']
         
         action_verb_score = min(len(action_verbs_found) * 3, 30)
         score += action_verb_score
         
         # Check for impact metrics
-        impact_metrics_found = []
-        for metric in self.impact_metrics:
-            if metric in experience_text.lower():
-                impact_metrics_found.append(metric)
+        impact_metrics_found = experience_hits['impact_metrics']
         
         impact_score = min(len(impact_metrics_found) * 2, 20)
         score += impact_score
         
         # Check for quantifiable achievements (numbers, percentages)
-        numbers_pattern = r'\b\d+(?:\.\d+)?%?\b'
-        numbers_found = re.findall(numbers_pattern, experience_text)
+        numbers_found = patterns.NUMBER.findall(experience_text)
         quantifiable_score = min(len(numbers_found) * 2, 20)
         score += quantifiable_score
         
         # Check for professional language
-        professional_words = ['collaborated', 'implemented', 'developed', 'managed', 'led', 'achieved']
-        professional_count = sum(1 for word in professional_words if word in text.lower())
+        professional_count = len(doc.keywords['professional_words'])
         professional_score = min(professional_count * 2, 10)
         score += professional_score
         
@@ -270,13 +516,13 @@ class ResumeScorer:
         
         return min(score, max_score), details
     
-    def calculate_structure_formatting_score(self, text: str) -> Tuple[float, Dict]:
+    def calculate_structure_formatting_score(self, doc: AnalyzedResume) -> Tuple[float, Dict]:
         """Calculate score based on structure and formatting"""
         score = 0
         max_score = 100
         details = {}
         
-        lines = text.split('\n')
+        lines = doc.lines
         
         # Check for consistent formatting
         line_lengths = [len(line.strip()) for line in lines if line.strip()]
@@ -290,14 +536,12 @@ class ResumeScorer:
                 score += 10
         
         # Check for proper section headers (capitalized, clear)
-        header_pattern = r'^[A-Z][A-Z\s]+$'
-        headers_found = sum(1 for line in lines if re.match(header_pattern, line.strip()))
+        headers_found = sum(1 for line in lines if patterns.HEADER.match(line.strip()))
         header_score = min(headers_found * 5, 30)
         score += header_score
         
         # Check for bullet points and lists
-        bullet_pattern = r'^[\-\*•]\s'
-        bullets_found = sum(1 for line in lines if re.match(bullet_pattern, line.strip()))
+        bullets_found = sum(1 for line in lines if patterns.BULLET.match(line.strip()))
         bullet_score = min(bullets_found * 2, 20)
         score += bullet_score
         
@@ -309,7 +553,7 @@ class ResumeScorer:
             score += 5
         
         # Check for professional formatting
-        if any(word in text.lower() for word in ['resume', 'cv', 'curriculum vitae']):
+        if doc.keywords['resume_terms']:
             score += 15
         
         details['avg_line_length'] = round(avg_line_length, 2) if line_lengths else 0
@@ -319,18 +563,20 @@ class ResumeScorer:
         
         return min(score, max_score), details
     
-    def calculate_skills_analysis_score(self, sections: Dict[str, str], text: str) -> Tuple[float, Dict]:
+    def calculate_skills_analysis_score(self, doc: AnalyzedResume) -> Tuple[float, Dict]:
         """Calculate score based on skills analysis"""
         score = 0
         max_score = 100
         details = {}
         
-        skills_text = sections.get('skills', '')
+        skills_text = doc.sections.get('skills', '')
+        skills_hits = doc.section_keywords('skills')
         if not skills_text:
-            skills_text = text  # Fallback to full text
+            skills_text = doc.text  # Fallback to full text
+            skills_hits = doc.keywords
         
         # Count total skills mentioned
-        skills_list = re.findall(r'\b[A-Za-z][A-Za-z\s\+#\.]+(?:\+|\s|$)', skills_text)
+        skills_list = patterns.SKILL.findall(skills_text)
         total_skills = len([skill.strip() for skill in skills_list if len(skill.strip()) > 2])
         
         # Score based on number of skills (optimal: 10-20 skills)
@@ -344,11 +590,8 @@ class ResumeScorer:
             score += 5
         
         # Check for technical vs soft skills balance
-        technical_keywords = ['python', 'java', 'javascript', 'sql', 'html', 'css', 'react', 'angular', 'node', 'docker', 'aws', 'machine learning', 'data analysis']
-        soft_keywords = ['leadership', 'communication', 'teamwork', 'problem solving', 'time management', 'collaboration', 'adaptability']
-        
-        technical_skills = sum(1 for keyword in technical_keywords if keyword in skills_text.lower())
-        soft_skills = sum(1 for keyword in soft_keywords if keyword in skills_text.lower())
+        technical_skills = len(skills_hits['technical_keywords'])
+        soft_skills = len(skills_hits['soft_keywords'])
         
         # Balance score
         if technical_skills > 0 and soft_skills > 0:
@@ -357,13 +600,12 @@ class ResumeScorer:
             score += 15
         
         # Check for current/relevant skills
-        current_skills = ['python', 'javascript', 'react', 'node.js', 'docker', 'kubernetes', 'aws', 'machine learning', 'data science']
-        current_skills_found = sum(1 for skill in current_skills if skill in skills_text.lower())
+        current_skills_found = len(skills_hits['current_skills'])
         current_score = min(current_skills_found * 3, 30)
         score += current_score
         
         # Check for skill categorization
-        if any(category in skills_text.lower() for category in ['technical', 'soft', 'programming', 'tools', 'languages']):
+        if skills_hits['skill_categories']:
             score += 15
         
         details['total_skills'] = total_skills
@@ -373,21 +615,18 @@ class ResumeScorer:
         
         return min(score, max_score), details
     
-    def calculate_action_verbs_score(self, sections: Dict[str, str]) -> Tuple[float, Dict]:
+    def calculate_action_verbs_score(self, doc: AnalyzedResume) -> Tuple[float, Dict]:
         """Calculate score based on action verbs usage"""
         score = 0
         max_score = 100
         details = {}
         
-        experience_text = sections.get('experience', '')
+        experience_text = doc.sections.get('experience', '')
         if not experience_text:
             return 0, {'action_verbs_found': [], 'impact_verbs_found': []}
         
         # Find action verbs
-        found_verbs = []
-        for verb in self.action_verbs:
-            if verb in experience_text.lower():
-                found_verbs.append(verb)
+        found_verbs = doc.section_keywords('experience')['action_verbs']
         
         # Score based on number of action verbs
         verb_score = min(len(found_verbs) * 5, 50)
@@ -408,14 +647,14 @@ class ResumeScorer:
         
         return min(score, max_score), details
     
-    def calculate_professional_presentation_score(self, text: str) -> Tuple[float, Dict]:
+    def calculate_professional_presentation_score(self, doc: AnalyzedResume) -> Tuple[float, Dict]:
         """Calculate score based on professional presentation"""
         score = 0
         max_score = 100
         details = {}
         
         # Check for grammar and spelling (basic check)
-        sentences = sent_tokenize(text)
+        sentences = doc.sentences
         proper_sentences = 0
         
         for sentence in sentences:
@@ -427,13 +666,12 @@ class ResumeScorer:
         score += grammar_score
         
         # Check for professional language
-        professional_terms = ['collaborated', 'implemented', 'developed', 'managed', 'achieved', 'delivered', 'optimized']
-        professional_count = sum(1 for term in professional_terms if term in text.lower())
+        professional_count = len(doc.keywords['professional_terms'])
         professional_score = min(professional_count * 3, 30)
         score += professional_score
         
         # Check for concise writing (avoid redundancy)
-        words = word_tokenize(text.lower())
+        words = doc.tokens
         unique_words = set(words)
         vocabulary_richness = len(unique_words) / len(words) if words else 0
         
@@ -445,7 +683,7 @@ class ResumeScorer:
             score += 10
         
         # Check for consistent formatting
-        lines = text.split('\n')
+        lines = doc.lines
         consistent_formatting = all(len(line.strip()) <= 100 for line in lines if line.strip())
         if consistent_formatting:
             score += 10
@@ -457,18 +695,15 @@ class ResumeScorer:
         
         return min(score, max_score), details
     
-    def calculate_industry_specific_score(self, sections: Dict[str, str], text: str) -> Tuple[float, Dict]:
+    def calculate_industry_specific_score(self, doc: AnalyzedResume) -> Tuple[float, Dict]:
         """Calculate score based on industry-specific requirements"""
         score = 0
         max_score = 100
         details = {}
         
         # Determine industry based on skills and content
-        industry_scores = {}
-        
-        for industry, keywords in self.industry_keywords.items():
-            keyword_matches = sum(1 for keyword in keywords if keyword in text.lower())
-            industry_scores[industry] = keyword_matches
+        hits = doc.keywords
+        industry_scores = {industry: len(hits[f'industry:{industry}']) for industry in self.industry_keywords}
         
         # Find the most relevant industry
         if industry_scores:
@@ -484,21 +719,11 @@ class ResumeScorer:
                 score += 15
             
             # Check for industry-specific sections
-            if best_industry == 'data_science':
-                if any(section in text.lower() for section in ['projects', 'research', 'analysis']):
-                    score += 25
-            elif best_industry == 'web_development':
-                if any(section in text.lower() for section in ['projects', 'portfolio', 'deployment']):
-                    score += 25
-            elif best_industry == 'mobile_development':
-                if any(section in text.lower() for section in ['apps', 'mobile', 'ios', 'android']):
-                    score += 25
-            elif best_industry == 'ui_ux':
-                if any(section in text.lower() for section in ['design', 'prototype', 'wireframe']):
-                    score += 25
+            if hits[f'industry_sections:{best_industry}']:
+                score += 25
             
             # Bonus for having relevant certifications
-            if 'certification' in text.lower() or 'certificate' in text.lower():
+            if hits['certification_terms']:
                 score += 25
         
         details['industry_scores'] = industry_scores
@@ -507,22 +732,20 @@ class ResumeScorer:
         
         return min(score, max_score), details
     
-    def calculate_overall_score(self, text: str) -> Dict:
-        """Calculate the overall resume score with detailed breakdown"""
-        # Preprocess text
-        processed_text = self.preprocess_text(text)
-        
-        # Extract sections
-        sections = self.extract_sections(processed_text)
+    def calculate_overall_score(self, text: str, keep_lines: bool = False) -> Dict:
+        """Calculate the overall resume score with detailed breakdown (see preprocess_text for `keep_lines`)"""
+        # Preprocess, extract sections and tokenize once for every component
+        doc = self.analyze_text(text, keep_lines)
+        sections = doc.sections
         
         # Calculate individual component scores
-        completeness_score, completeness_details = self.calculate_content_completeness_score(sections, processed_text)
-        quality_score, quality_details = self.calculate_content_quality_score(sections, processed_text)
-        structure_score, structure_details = self.calculate_structure_formatting_score(processed_text)
-        skills_score, skills_details = self.calculate_skills_analysis_score(sections, processed_text)
-        action_verbs_score, action_verbs_details = self.calculate_action_verbs_score(sections)
-        presentation_score, presentation_details = self.calculate_professional_presentation_score(processed_text)
-        industry_score, industry_details = self.calculate_industry_specific_score(sections, processed_text)
+        completeness_score, completeness_details = self.calculate_content_completeness_score(doc)
+        quality_score, quality_details = self.calculate_content_quality_score(doc)
+        structure_score, structure_details = self.calculate_structure_formatting_score(doc)
+        skills_score, skills_details = self.calculate_skills_analysis_score(doc)
+        action_verbs_score, action_verbs_details = self.calculate_action_verbs_score(doc)
+        presentation_score, presentation_details = self.calculate_professional_presentation_score(doc)
+        industry_score, industry_details = self.calculate_industry_specific_score(doc)
         
         # Calculate weighted overall score
         overall_score = (
@@ -536,27 +759,7 @@ class ResumeScorer:
         )
         
         # Determine grade
-        if overall_score >= 90:
-            grade = 'A+'
-            grade_description = 'Excellent'
-        elif overall_score >= 80:
-            grade = 'A'
-            grade_description = 'Very Good'
-        elif overall_score >= 70:
-            grade = 'B+'
-            grade_description = 'Good'
-        elif overall_score >= 60:
-            grade = 'B'
-            grade_description = 'Above Average'
-        elif overall_score >= 50:
-            grade = 'C+'
-            grade_description = 'Average'
-        elif overall_score >= 40:
-            grade = 'C'
-            grade_description = 'Below Average'
-        else:
-            grade = 'D'
-            grade_description = 'Needs Improvement'
+        grade, grade_description = grade_for(overall_score)
         
         # Generate recommendations
         recommendations = self.generate_recommendations({
@@ -595,6 +798,74 @@ class ResumeScorer:
             'sections_found': list(sections.keys())
         }
     
+    def score_document(self, document) -> Dict:
+        """
+        Score a pyresparser ResumeDocument without decoding the PDF again,
+        keeping the line structure of its pages
+        """
+        return self.calculate_overall_score('\n'.join(document.pages), keep_lines=True)
+    
+    def score_many(self, texts: Iterable[str], workers: int = 1, chunksize: int = 8) -> Iterator[Dict]:
+        """
+        Score many resumes, yielding calculate_overall_score() results in input order.
+        
+        With `workers` > 1 the texts are scored in a process pool. Each worker
+        creates one scorer with this scorer's class and weights and reuses it
+        for every text, and results are yielded as soon as they are ready.
+        """
+        if workers <= 1:
+            for text in texts:
+                yield self.calculate_overall_score(text)
+            return
+        pool = mp.Pool(workers, initializer=_init_score_worker, initargs=(type(self), self.weights))
+        try:
+            for result in pool.imap(_score_text, texts, chunksize):
+                yield result
+        finally:
+            # all results are in, or the caller stopped iterating early
+            pool.terminate()
+            pool.join()
+    
+    def score_columns(self, texts: Iterable[str], workers: int = 1, chunksize: int = 8) -> ScoreColumns:
+        """score_many() collected into one NumPy array per component"""
+        return ScoreColumns.from_results(self.score_many(texts, workers, chunksize))
+    
+    def reweight(self, columns: ScoreColumns, weights: Optional[Dict[str, float]] = None) -> Dict:
+        """
+        Overall scores, grades and recommendations of a stored population under new weights.
+        
+        The weighted sum is one matrix-vector product and grading one
+        searchsorted over GRADES. Recommendations only depend on which
+        components fall below their thresholds, so generate_recommendations()
+        runs once per distinct pattern rather than once per resume.
+        """
+        weights = self.weights if weights is None else weights
+        matrix = columns.matrix()
+        if not len(matrix):
+            return {'overall_score': np.zeros(0), 'grade': np.zeros(0, dtype=str),
+                    'grade_description': np.zeros(0, dtype=str), 'recommendations': []}
+        weighted = matrix @ np.asarray([weights[name] for name in COMPONENTS], dtype=np.float64)
+        
+        minimums = np.asarray([minimum for minimum, _, _ in GRADES[:-1]][::-1])
+        rank = np.searchsorted(minimums, weighted, side='right')
+        grades = np.asarray([grade for _, grade, _ in GRADES][::-1])
+        descriptions = np.asarray([description for _, _, description in GRADES][::-1])
+        
+        # below 70 is the threshold of every component in generate_recommendations()
+        _, first_rows, inverse = np.unique(matrix < 70, axis=0, return_index=True, return_inverse=True)
+        by_pattern = [
+            self.generate_recommendations({
+                RECOMMENDATION_KEYS[name]: matrix[row, i] for i, name in enumerate(COMPONENTS)
+            })
+            for row in first_rows
+        ]
+        return {
+            'overall_score': np.round(weighted, 2),
+            'grade': grades[rank],
+            'grade_description': descriptions[rank],
+            'recommendations': [by_pattern[i] for i in np.ravel(inverse)]
+        }
+    
     def generate_recommendations(self, scores: Dict[str, float]) -> List[str]:
         """Generate specific recommendations based on scores"""
         recommendations = []
@@ -0,0 +1,193 @@
+"""
+Filtered, keyset-paginated browsing and streaming export of user_data for admins.
+
+Pages are fetched with `ID < last ID seen ORDER BY ID DESC LIMIT n`, so
+every page costs the same however deep the admin pages. Exports read from
+an unbuffered server-side cursor in chunks and write each chunk to the file
+before fetching the next, so memory stays flat whatever the table size.
+"""
+
+import csv
+import datetime
+import os
+import tempfile
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import pymysql
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional, exports fall back to CSV only
+    pa = pq = None
+
+import db
+
+# (user_data column, column name shown to admins and written to exports)
+COLUMNS = [
+    ('ID', 'ID'),
+    ('sec_token', 'Token'),
+    ('ip_add', 'IP Address'),
+    ('act_name', 'Name'),
+    ('act_mail', 'Mail'),
+    ('act_mob', 'Mobile Number'),
+    ('Predicted_Field', 'Predicted Field'),
+    ('Timestamp', 'Timestamp'),
+    ('Name', 'Predicted Name'),
+    ('Email_ID', 'Predicted Mail'),
+    ('resume_score', 'Resume Score'),
+    ('Page_no', 'Total Page'),
+    ('pdf_name', 'File Name'),
+    ('User_level', 'User Level'),
+    ('Actual_skills', 'Actual Skills'),
+    ('Recommended_skills', 'Recommended Skills'),
+    ('Recommended_courses', 'Recommended Course'),
+    ('city', 'City'),
+    ('state', 'State'),
+    ('country', 'Country'),
+    ('latlong', 'Lat Long'),
+    ('os_name_ver', 'Server OS'),
+    ('host_name', 'Server Name'),
+    ('dev_user', 'Server User'),
+]
+HEADERS = [header for _, header in COLUMNS]
+
+PAGE_SIZE = 50
+EXPORT_CHUNK = 5000
+# export format -> MIME type
+FORMATS = {'csv': 'text/csv'}
+if pa is not None:
+    FORMATS['parquet'] = 'application/vnd.apache.parquet'
+
+
+class UserFilter:
+    """
+    Server-side filters of the browser and exports; None means unfiltered.
+
+    `date_from` and `date_to` are inclusive dates, `fields` a list of
+    Predicted_Field values and the score bounds are inclusive.
+    """
+
+    def __init__(self, date_from: Optional[datetime.date] = None, date_to: Optional[datetime.date] = None,
+                 fields: Optional[Sequence[str]] = None, min_score: Optional[float] = None,
+                 max_score: Optional[float] = None):
+        self.date_from = date_from
+        self.date_to = date_to
+        self.fields = list(fields or [])
+        self.min_score = min_score
+        self.max_score = max_score
+
+    def where(self, before_id: Optional[int] = None) -> Tuple[str, List]:
+        """WHERE clause on the indexed ID, Timestamp, Predicted_Field and resume_score columns, and its params"""
+        conditions, params = [], []
+        if before_id is not None:
+            conditions.append("ID < %s")
+            params.append(before_id)
+        if self.date_from is not None:
+            conditions.append("Timestamp >= %s")
+            params.append(datetime.datetime.combine(self.date_from, datetime.time.min))
+        if self.date_to is not None:
+            conditions.append("Timestamp < %s")
+            params.append(datetime.datetime.combine(self.date_to + datetime.timedelta(days=1), datetime.time.min))
+        if self.fields:
+            conditions.append(f"Predicted_Field IN ({', '.join(['%s'] * len(self.fields))})")
+            params.extend(self.fields)
+        if self.min_score is not None:
+            conditions.append("resume_score >= %s")
+            params.append(self.min_score)
+        if self.max_score is not None:
+            conditions.append("resume_score <= %s")
+            params.append(self.max_score)
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+
+SELECT_COLUMNS = "SELECT " + ", ".join(column for column, _ in COLUMNS) + " FROM user_data"
+
+
+def count(user_filter: UserFilter, fetchall: Optional[Callable] = None) -> int:
+    where, params = user_filter.where()
+    return int((fetchall or db.fetchall)("SELECT COUNT(*) FROM user_data" + where, params)[0][0])
+
+
+def fetch_page(user_filter: UserFilter, before_id: Optional[int] = None, page_size: int = PAGE_SIZE,
+               fetchall: Optional[Callable] = None) -> List[tuple]:
+    """
+    Up to `page_size` rows, newest first, with IDs below `before_id`.
+
+    The ID of the last row is the `before_id` of the next page; fewer rows
+    than `page_size` means there is no next page.
+    """
+    where, params = user_filter.where(before_id)
+    rows = (fetchall or db.fetchall)(SELECT_COLUMNS + where + " ORDER BY ID DESC LIMIT %s", params + [page_size])
+    return [tuple(row) for row in rows]
+
+
+def _parquet_schema():
+    types = {'ID': pa.int64(), 'resume_score': pa.decimal128(5, 2), 'Page_no': pa.int32(),
+             'Timestamp': pa.timestamp('s')}
+    return pa.schema([(header, types.get(column, pa.string())) for column, header in COLUMNS])
+
+
+def _write_csv(chunks, path: str) -> int:
+    written = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        for rows in chunks:
+            writer.writerows(rows)
+            written += len(rows)
+    return written
+
+
+def _write_parquet(chunks, path: str) -> int:
+    schema = _parquet_schema()
+    written = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows in chunks:
+            # one row group per chunk
+            columns = list(zip(*rows))
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema
+            ))
+            written += len(rows)
+    return written
+
+
+def export(user_filter: UserFilter, path: str, fmt: str = 'csv', chunk_size: int = EXPORT_CHUNK,
+           pool: Optional[db.ConnectionPool] = None) -> int:
+    """
+    Write every row matching `user_filter` to `path` as CSV or Parquet and
+    return the row count.
+
+    Rows are streamed from a server-side cursor `chunk_size` at a time, so
+    only one chunk is ever held in memory. The pooled connection is busy
+    until the export finishes.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unsupported export format {fmt!r}, expected one of {list(FORMATS)}")
+    where, params = user_filter.where()
+    with (pool or db.pool()).connection() as conn:
+        with conn.cursor(pymysql.cursors.SSCursor) as cursor:
+            cursor.execute(SELECT_COLUMNS + where + " ORDER BY ID DESC", params)
+
+            def chunks():
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        return
+                    yield rows
+
+            if fmt == 'parquet':
+                return _write_parquet(chunks(), path)
+            return _write_csv(chunks(), path)
+
+
+def export_to_tempfile(user_filter: UserFilter, fmt: str = 'csv', **kwargs) -> Tuple[str, int]:
+    """export() into a new temporary file; returns its path, which the caller removes, and the row count"""
+    fd, path = tempfile.mkstemp(prefix='user_data_', suffix='.' + fmt)
+    os.close(fd)
+    try:
+        return path, export(user_filter, path, fmt, **kwargs)
+    except BaseException:
+        os.remove(path)
+        raise
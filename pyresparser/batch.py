@@ -0,0 +1,202 @@
+"""Parse a directory of resumes into a JSON Lines file.
+
+    python -m pyresparser.batch resumes/ -o parsed.jsonl --resume
+
+Every worker process loads the spaCy pipelines once through the pool
+initializer. Results are written as they complete, one JSON object per
+line (``{"file": ..., "data": ...}`` or ``{"file": ..., "error": ...}``),
+so memory use does not grow with the corpus. The output file doubles as
+the checkpoint: with ``--resume`` files already recorded in it are skipped.
+"""
+import argparse
+import contextlib
+import json
+import multiprocessing as mp
+import os
+import signal
+import sys
+import time
+from . import models
+from .resume_parser import ResumeParser
+
+
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.doc')
+
+_options = {}
+
+
+class FileTimeout(Exception):
+    pass
+
+
+def _init_worker(skills_file, custom_regex, timeout):
+    _options['skills_file'] = skills_file
+    _options['custom_regex'] = custom_regex
+    _options['timeout'] = timeout
+    models.preload()
+
+
+@contextlib.contextmanager
+def _deadline(seconds):
+    # SIGALRM only exists on Unix; elsewhere files run without a deadline
+    if not seconds or not hasattr(signal, 'SIGALRM'):
+        yield
+        return
+
+    def _raise(signum, frame):
+        raise FileTimeout('timed out after %ss' % seconds)
+
+    previous = signal.signal(signal.SIGALRM, _raise)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def parse_file(path):
+    """Parse one resume, never raising: failures become an error record"""
+    try:
+        with _deadline(_options.get('timeout')):
+            data = ResumeParser(
+                path,
+                skills_file=_options.get('skills_file'),
+                custom_regex=_options.get('custom_regex')
+            ).get_extracted_data()
+        return {'file': path, 'data': data}
+    except Exception as e:
+        return {'file': path, 'error': '%s: %s' % (type(e).__name__, e)}
+
+
+def iter_resumes(directory):
+    for root, directories, filenames in os.walk(directory):
+        directories.sort()
+        for filename in sorted(filenames):
+            if filename.lower().endswith(RESUME_EXTENSIONS):
+                yield os.path.join(root, filename)
+
+
+def read_checkpoint(output, retry_errors=False):
+    """Files already recorded in ``output`` (a truncated last line is ignored)"""
+    done = set()
+    if not output or not os.path.exists(output):
+        return done
+    with open(output, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if retry_errors and 'error' in record:
+                continue
+            done.add(record['file'])
+    return done
+
+
+def run(
+    directory,
+    output=None,
+    processes=None,
+    chunk_size=4,
+    timeout=None,
+    resume=False,
+    retry_errors=False,
+    skills_file=None,
+    custom_regex=None
+):
+    """Parse every resume below ``directory`` and stream records to ``output``.
+
+    Returns a summary dict with counts, elapsed seconds and files per second.
+    """
+    done = read_checkpoint(output, retry_errors) if resume else set()
+    pending = (path for path in iter_resumes(directory) if path not in done)
+
+    if output:
+        out = open(output, 'a' if resume else 'w', encoding='utf-8')
+        if out.tell():
+            # drop onto a fresh line if the previous run died mid-record
+            with open(output, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    out.write('\n')
+    else:
+        out = sys.stdout
+
+    summary = {'parsed': 0, 'failed': 0, 'skipped': len(done)}
+    start = time.time()
+    pool = mp.Pool(
+        processes or mp.cpu_count(),
+        initializer=_init_worker,
+        initargs=(skills_file, custom_regex, timeout)
+    )
+    try:
+        for record in pool.imap_unordered(parse_file, pending, chunk_size):
+            out.write(json.dumps(record, default=str) + '\n')
+            out.flush()
+            if 'error' in record:
+                summary['failed'] += 1
+            else:
+                summary['parsed'] += 1
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.time() - start
+    processed = summary['parsed'] + summary['failed']
+    summary['seconds'] = round(elapsed, 2)
+    summary['files_per_second'] = round(processed / elapsed, 2) if elapsed else 0.0
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Parse resumes in bulk into JSON Lines'
+    )
+    parser.add_argument('directory', nargs='?', default='resumes')
+    parser.add_argument('-o', '--output', help='JSONL file, stdout if omitted')
+    parser.add_argument('-p', '--processes', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=4)
+    parser.add_argument(
+        '--timeout', type=float, default=60,
+        help='seconds allowed per file, 0 disables the limit'
+    )
+    parser.add_argument(
+        '--resume', action='store_true',
+        help='skip files already recorded in the output file'
+    )
+    parser.add_argument(
+        '--retry-errors', action='store_true',
+        help='with --resume, parse files that failed last time again'
+    )
+    parser.add_argument('--skills-file', default=None)
+    parser.add_argument('--custom-regex', default=None)
+    args = parser.parse_args(argv)
+
+    if args.resume and not args.output:
+        parser.error('--resume needs --output')
+
+    summary = run(
+        args.directory,
+        output=args.output,
+        processes=args.processes,
+        chunk_size=args.chunk_size,
+        timeout=args.timeout,
+        resume=args.resume,
+        retry_errors=args.retry_errors,
+        skills_file=args.skills_file,
+        custom_regex=args.custom_regex
+    )
+    sys.stderr.write(
+        '%(parsed)d parsed, %(failed)d failed, %(skipped)d skipped '
+        'in %(seconds)ss (%(files_per_second)s files/s)\n' % summary
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+import io
+import os
+from pdfminer.converter import PDFPageAggregator
+from pdfminer.layout import LAParams, LTContainer, LTText, LTTextBox
+from pdfminer.pdfinterp import PDFPageInterpreter
+from pdfminer.pdfinterp import PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFSyntaxError
+from . import utils
+
+
+class ResumeDocument(object):
+    """A resume decoded once and shared by every consumer.
+
+    ``pages`` holds the text of each page as pdfminer's TextConverter
+    would render it and ``boxes`` holds, per page, the layout text boxes
+    as ``(x0, y0, x1, y1, text)`` tuples.  ``page_count`` is ``None``
+    for formats without pages (docx/doc), like
+    ``utils.get_number_of_pages``.
+    """
+
+    def __init__(
+        self,
+        pages,
+        boxes=None,
+        page_count=None,
+        name=None,
+        text=None
+    ):
+        self.pages = pages
+        self.boxes = boxes if boxes is not None else [[] for _ in pages]
+        self.page_count = page_count
+        self.name = name
+        if text is None:
+            # same shape as utils.extract_text, which prefixes every PDF
+            # page with a space
+            text = ''.join(' ' + page for page in pages)
+        self.text = text
+
+    @property
+    def lines(self):
+        return [line for page in self.pages for line in page.splitlines()]
+
+
+def _render(item, chunks, boxes):
+    # mirrors pdfminer's TextConverter.receive_layout
+    if isinstance(item, LTContainer):
+        for child in item:
+            _render(child, chunks, boxes)
+    elif isinstance(item, LTText):
+        chunks.append(item.get_text())
+    if isinstance(item, LTTextBox):
+        chunks.append('\n')
+        boxes.append((item.x0, item.y0, item.x1, item.y1, item.get_text()))
+
+
+def _read_pdf(fh):
+    resource_manager = PDFResourceManager()
+    device = PDFPageAggregator(resource_manager, laparams=LAParams())
+    interpreter = PDFPageInterpreter(resource_manager, device)
+    pages = []
+    boxes = []
+    try:
+        for page in PDFPage.get_pages(
+            fh,
+            caching=True,
+            check_extractable=True
+        ):
+            interpreter.process_page(page)
+            chunks = []
+            page_boxes = []
+            _render(device.get_result(), chunks, page_boxes)
+            chunks.append('\f')
+            pages.append(''.join(chunks))
+            boxes.append(page_boxes)
+    except PDFSyntaxError:
+        return [], [], None
+    finally:
+        device.close()
+    return pages, boxes, len(pages)
+
+
+def _extension(resume):
+    name = resume.name if isinstance(resume, io.BytesIO) else resume
+    return '.' + os.path.splitext(name)[1].split('.')[1]
+
+
+def load_document(resume):
+    """Parse ``resume`` (a path or a named BytesIO) in a single pass.
+
+    PDFs are read with one layout analysis per page; other formats go
+    through ``utils.extract_text`` and have no page information.
+    """
+    ext = _extension(resume)
+    name = resume.name if isinstance(resume, io.BytesIO) else resume
+    if ext != '.pdf':
+        text = utils.extract_text(resume, ext)
+        return ResumeDocument([text], name=name, text=text)
+    if isinstance(resume, io.BytesIO):
+        resume.seek(0)
+        pages, boxes, page_count = _read_pdf(resume)
+    else:
+        with open(resume, 'rb') as fh:
+            pages, boxes, page_count = _read_pdf(fh)
+    return ResumeDocument(pages, boxes, page_count, name=name)
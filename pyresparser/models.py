@@ -0,0 +1,87 @@
+import os
+import threading
+import spacy
+
+
+BASE_MODEL = 'en_core_web_sm'
+CUSTOM_MODEL = os.path.dirname(os.path.abspath(__file__))
+
+# Components the extractors in utils actually read: the base pipeline needs
+# POS tags for the name matcher and the dependency parse for noun_chunks,
+# the custom pipeline only its entities
+BASE_COMPONENTS = ('tagger', 'parser')
+CUSTOM_COMPONENTS = ('ner',)
+
+_models = {}
+_lock = threading.RLock()
+
+
+def _load(name):
+    if name == CUSTOM_MODEL:
+        try:
+            return spacy.load(CUSTOM_MODEL)
+        except (OSError, IOError):
+            # The custom NER model is not shipped with every install,
+            # fall back to the base pipeline like the app always did
+            return get_model(BASE_MODEL)
+    return spacy.load(name)
+
+
+def get_model(name):
+    """Return the spaCy pipeline ``name``, loading it once per process.
+
+    Loaded pipelines are shared by every ResumeParser, thread and
+    Streamlit session in the process.
+    """
+    model = _models.get(name)
+    if model is not None:
+        return model
+    with _lock:
+        model = _models.get(name)
+        if model is None:
+            model = _load(name)
+            _models[name] = model
+    return model
+
+
+def get_nlp():
+    return get_model(BASE_MODEL)
+
+
+def get_custom_nlp():
+    return get_model(CUSTOM_MODEL)
+
+
+def _unused(nlp, keep):
+    return [name for name in nlp.pipe_names if name not in keep]
+
+
+def base_disabled():
+    """Components of the base pipeline to pass as ``disable=``"""
+    return _unused(get_nlp(), BASE_COMPONENTS)
+
+
+def custom_disabled():
+    """Components of the custom pipeline to pass as ``disable=``"""
+    return _unused(get_custom_nlp(), CUSTOM_COMPONENTS)
+
+
+def preload(warm_up=True):
+    """Load both pipelines ahead of the first resume.
+
+    With ``warm_up`` a short text is run through each pipeline so lazily
+    initialised components are ready before a user is waiting on them.
+    Safe to call as a multiprocessing Pool initializer.
+    """
+    nlp = get_nlp()
+    custom_nlp = get_custom_nlp()
+    if warm_up:
+        nlp('John Doe, Software Engineer at Example Corp.')
+        custom_nlp('John Doe\nBachelor of Science')
+    return nlp, custom_nlp
+
+
+def clear():
+    """Drop every loaded pipeline (mainly useful in tests)."""
+    with _lock:
+        _models.clear()
@@ -1,10 +1,9 @@
+import itertools
 import os
-import multiprocessing as mp
-import io
-import spacy
-import pprint
 from spacy.matcher import Matcher
 from . import utils
+from . import models
+from .document import load_document
 
 
 class ResumeParser(object):
@@ -13,10 +12,12 @@ class ResumeParser(object):
         self,
         resume,
         skills_file=None,
-        custom_regex=None
+        custom_regex=None,
+        document=None,
+        docs=None
     ):
-        nlp = spacy.load('en_core_web_sm')
-        custom_nlp = spacy.load(os.path.dirname(os.path.abspath(__file__)))
+        nlp = models.get_nlp()
+        custom_nlp = models.get_custom_nlp()
         self.__skills_file = skills_file
         self.__custom_regex = custom_regex
         self.__matcher = Matcher(nlp.vocab)
@@ -29,20 +30,26 @@ class ResumeParser(object):
             'no_of_pages': None,
         }
         self.__resume = resume
-        if not isinstance(self.__resume, io.BytesIO):
-            ext = os.path.splitext(self.__resume)[1].split('.')[1]
-        else:
-            ext = self.__resume.name.split('.')[1]
-        self.__text_raw = utils.extract_text(self.__resume, '.' + ext)
+        if document is None:
+            document = load_document(self.__resume)
+        self.__document = document
+        self.__text_raw = document.text
         self.__text = ' '.join(self.__text_raw.split())
-        self.__nlp = nlp(self.__text)
-        self.__custom_nlp = custom_nlp(self.__text_raw)
+        if docs is None:
+            docs = (
+                nlp(self.__text, disable=models.base_disabled()),
+                custom_nlp(self.__text_raw, disable=models.custom_disabled())
+            )
+        self.__nlp, self.__custom_nlp = docs
         self.__noun_chunks = list(self.__nlp.noun_chunks)
         self.__get_basic_details()
 
     def get_extracted_data(self):
         return self.__details
 
+    def get_document(self):
+        return self.__document
+
     def __get_basic_details(self):
         cust_ent = utils.extract_entities_wih_custom_model(
                             self.__custom_nlp
@@ -74,7 +81,7 @@ class ResumeParser(object):
         self.__details['skills'] = skills
 
         # no of pages
-        self.__details['no_of_pages'] = utils.get_number_of_pages(self.__resume)
+        self.__details['no_of_pages'] = self.__document.page_count
 
         # extract education Degree
         try:
@@ -90,23 +97,48 @@ def resume_result_wrapper(resume):
     return parser.get_extracted_data()
 
 
-if __name__ == '__main__':
-    pool = mp.Pool(mp.cpu_count())
-
-    resumes = []
-    data = []
-    for root, directories, filenames in os.walk('resumes'):
-        for filename in filenames:
-            file = os.path.join(root, filename)
-            resumes.append(file)
-
-    results = [
-        pool.apply_async(
-            resume_result_wrapper,
-            args=(x,)
-        ) for x in resumes
+def parse_many(
+    resumes,
+    batch_size=32,
+    n_process=1,
+    skills_file=None,
+    custom_regex=None
+):
+    """Parse several resumes, batching the spaCy work with ``nlp.pipe``.
+
+    Resumes are loaded lazily and streamed through both pipelines in
+    batches with the components the extractors never use disabled, so only
+    about ``batch_size`` documents are held at a time. Returns the extracted
+    details in the order of ``resumes``.
+    """
+    loaded = ((resume, load_document(resume)) for resume in resumes)
+    # each pipeline reads its own copy of the stream; tee only buffers the
+    # documents a pipeline has read ahead of the one being parsed
+    loaded, for_nlp, for_custom = itertools.tee(loaded, 3)
+    nlp_docs = models.get_nlp().pipe(
+        (' '.join(document.text.split()) for _, document in for_nlp),
+        batch_size=batch_size,
+        n_process=n_process,
+        disable=models.base_disabled()
+    )
+    custom_docs = models.get_custom_nlp().pipe(
+        (document.text for _, document in for_custom),
+        batch_size=batch_size,
+        n_process=n_process,
+        disable=models.custom_disabled()
+    )
+    return [
+        ResumeParser(
+            resume,
+            skills_file=skills_file,
+            custom_regex=custom_regex,
+            document=document,
+            docs=docs
+        ).get_extracted_data()
+        for (resume, document), docs in zip(loaded, zip(nlp_docs, custom_docs))
     ]
 
-    results = [p.get() for p in results]
 
-    pprint.pprint(results)
+if __name__ == '__main__':
+    from .batch import main
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed resume analysis cache
+"""
+
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+from analysis_cache import AnalysisCache, resume_key
+
+
+def test_key_is_content_addressed():
+    """Identical bytes share a key, different bytes do not"""
+    assert resume_key(b'%PDF-1.4 same') == resume_key(b'%PDF-1.4 same')
+    assert resume_key(b'%PDF-1.4 same') != resume_key(b'%PDF-1.4 other')
+
+
+def test_memory_tier_is_lru():
+    """The least recently used entry is dropped first"""
+    cache = AnalysisCache(max_entries=2)
+    cache.put('a', {'score': 1})
+    cache.put('b', {'score': 2})
+    cache.get('a')
+    cache.put('c', {'score': 3})
+    assert cache.get('a') == {'score': 1}
+    assert cache.get('b') is None
+    assert cache.get('c') == {'score': 3}
+
+
+def test_disk_tier_survives_new_instance():
+    """Entries written to disk are found by a fresh cache"""
+    with tempfile.TemporaryDirectory() as disk_dir:
+        AnalysisCache(disk_dir=disk_dir).put('a', {'resume_text': 'hello'})
+        assert AnalysisCache(disk_dir=disk_dir).get('a') == {'resume_text': 'hello'}
+
+
+def test_disk_tier_evicts_by_size():
+    """The disk tier stays under its byte budget"""
+    with tempfile.TemporaryDirectory() as disk_dir:
+        cache = AnalysisCache(max_entries=1, disk_dir=disk_dir, max_disk_bytes=300)
+        for i in range(10):
+            cache.put(str(i), {'resume_text': 'x' * 100})
+        total = sum(os.path.getsize(os.path.join(disk_dir, name)) for name in os.listdir(disk_dir))
+        assert total <= 300
+        assert cache.get('9') is not None
+        assert cache.get('0') is None
+
+
+def test_concurrent_writers_of_one_key():
+    """Sessions storing the same resume at once each write their own temp file"""
+    with tempfile.TemporaryDirectory() as disk_dir:
+        cache = AnalysisCache(disk_dir=disk_dir)
+        entries = [{'resume_text': str(i) * 50000} for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda entry: cache.put('a', entry), entries))
+        assert os.listdir(disk_dir) == ['a.json']
+        assert AnalysisCache(disk_dir=disk_dir).get('a') in entries
+
+
+if __name__ == "__main__":
+    for test in [test_key_is_content_addressed, test_memory_tier_is_lru,
+                 test_disk_tier_survives_new_instance, test_disk_tier_evicts_by_size,
+                 test_concurrent_writers_of_one_key]:
+        test()
+        print(f"✅ {test.__name__}")
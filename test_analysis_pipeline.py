@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the resume analysis pipeline stages
+"""
+
+import os
+import sys
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+import analysis_pipeline
+from analysis_cache import AnalysisCache, resume_key
+
+RESUME_TEXT = (
+    'Jane Doe jane@example.com +1 555-123-4567\n'
+    'Summary\nData scientist.\n'
+    'EXPERIENCE\nDeveloped and deployed models, improved accuracy by 12%\n'
+    'Education\nBSc 2019\n'
+    'Skills\nPython, TensorFlow\n'
+)
+
+
+def test_calculate_resume_score_tips():
+    score, tips = analysis_pipeline.calculate_resume_score(RESUME_TEXT)
+    assert score == 8 + 15 + 20 + 12 + 8 + 6 + 3 + 3
+    assert len(tips) == len(analysis_pipeline.SECTION_CHECKS) + 4
+    assert (True, '[+] Excellent! You have added Experience') in tips
+    assert (False, '[-] Please add Projects. It will show that you have done work related to the required position.') in tips
+
+
+def test_experience_level():
+    detect = analysis_pipeline.detect_experience_level
+    assert detect(RESUME_TEXT, 0) == 'NA'
+    assert detect(RESUME_TEXT, 1) == 'Experienced'
+    assert detect('Internships\nWork Experience', 2) == 'Intermediate'
+    assert detect('Education only', 1) == 'Fresher'
+
+
+def test_predict_field_uses_first_matching_skill():
+    """Skills are checked in resume order and a keyword listed twice belongs to the first field"""
+    field, recommended = analysis_pipeline.predict_field(['Communication', 'Flask', 'React'])
+    assert field == 'NA' and recommended == ['No Recommendations']
+    assert analysis_pipeline.predict_field(['Flask', 'React'])[0] == 'Data Science'
+    assert analysis_pipeline.predict_field(['Figma'])[0] == 'UI-UX Development'
+    assert analysis_pipeline.predict_field(['Cobol']) == ('', [])
+
+
+def test_analyze_cached_resume_runs_remaining_stages(monkeypatch):
+    """A cached parse skips extraction; level, field and jobs still run and are timed"""
+    resume_bytes = b'%PDF-1.4 cached resume'
+    cache = AnalysisCache()
+    cache.put(resume_key(resume_bytes), {
+        'resume_data': {'name': 'Jane Doe', 'skills': ['Python', 'TensorFlow'], 'no_of_pages': 1},
+        'resume_text': RESUME_TEXT,
+        'score': 75,
+        'score_tips': [[True, 'tip']],
+    })
+    monkeypatch.setattr(analysis_pipeline, 'recommend_jobs',
+                        lambda skills, text, k: [{'title': 'Data Scientist', 'skills': skills}])
+    stages = []
+    result = analysis_pipeline.analyze(resume_bytes, on_stage=stages.append, cache=cache)
+
+    assert result.cached and stages == ['level', 'field', 'jobs']
+    assert set(result.timings) == {'cache', 'level', 'field', 'jobs'}
+    assert result.score_tips == [(True, 'tip')]
+    assert (result.level, result.field) == ('Experienced', 'Data Science')
+    assert result.jobs == [{'title': 'Data Scientist', 'skills': ['Python', 'TensorFlow']}]
+    assert result.to_dict()['score'] == 75
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached admin dashboard aggregates, using a fake fetchall
+"""
+
+import os
+import sys
+from decimal import Decimal
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+from analytics import Analytics, score_label
+
+
+class FakeDatabase:
+    def __init__(self, groups, total=0):
+        self.groups = groups
+        self.total = total
+        self.queries = []
+
+    def fetchall(self, sql, params=None):
+        self.queries.append((sql, params))
+        if sql.startswith('SELECT COUNT(*)'):
+            return [(self.total,)]
+        return self.groups[:params[0]]
+
+
+def test_counts_are_grouped_by_the_database():
+    database = FakeDatabase([('Data Science', 5), ('', 2)])
+    labels, values = Analytics(database.fetchall).counts('field')
+    assert (labels, values) == (['Data Science', 'Unknown'], [5, 2])
+    sql, params = database.queries[0]
+    assert 'GROUP BY' in sql and 'Predicted_Field' in sql and params == (20,)
+
+
+def test_small_groups_are_reported_as_other():
+    database = FakeDatabase([('1.2.3.4', 6), ('5.6.7.8', 3)], total=12)
+    labels, values = Analytics(database.fetchall).counts('ip', limit=2)
+    assert labels == ['1.2.3.4', '5.6.7.8', 'Other'] and values == [6, 3, 3]
+
+
+def test_score_buckets():
+    assert score_label(0) == '0-9' and score_label(50) == '50-59' and score_label(90) == '90-100'
+    database = FakeDatabase([(Decimal('40'), 1), (Decimal('90'), 4)])
+    assert Analytics(database.fetchall).counts('score') == (['40-49', '90-100'], [1, 4])
+
+
+def test_results_are_cached_for_the_ttl():
+    database = FakeDatabase([('5', 3)], total=3)
+    analytics = Analytics(database.fetchall, ttl=60)
+    assert analytics.counts('rating') == analytics.counts('rating')
+    assert analytics.total('user_feedback') == 3
+    assert len(database.queries) == 2
+
+    analytics.clear()
+    analytics.counts('rating')
+    assert len(database.queries) == 3
+
+    analytics.ttl = 0
+    analytics.counts('rating')
+    assert len(database.queries) == 4
+
+
+def test_recent_feedback_is_limited_and_cached():
+    rows = [(3, 'Ann', 'Great tool'), (2, 'Bob', 'Too slow'), (1, 'Cy', 'Nice')]
+    database = FakeDatabase(rows)
+    analytics = Analytics(database.fetchall)
+    assert analytics.recent_feedback(('ID', 'feed_name', 'comments'), limit=2) == rows[:2]
+    assert analytics.recent_feedback(('ID', 'feed_name', 'comments'), limit=2) == rows[:2]
+    assert len(database.queries) == 1
+    sql, params = database.queries[0]
+    assert 'ORDER BY ID DESC LIMIT' in sql and 'SELECT *' not in sql and params == (2,)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the bulk resume parsing CLI (pyresparser.batch), using a stub parser
+in place of the spaCy-backed ResumeParser
+"""
+
+import importlib
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+pytestmark = pytest.mark.skipif(
+    mp.get_start_method() != 'fork', reason="workers must inherit the stub parser by forking"
+)
+
+
+class StubParser:
+    """Parses 'slow' files for 10 s and fails on 'broken' ones"""
+
+    def __init__(self, path, skills_file=None, custom_regex=None):
+        self.path = path
+
+    def get_extracted_data(self):
+        name = os.path.basename(self.path)
+        if 'slow' in name:
+            time.sleep(10)
+        if 'broken' in name:
+            raise ValueError('unreadable file')
+        return {'name': name}
+
+
+@pytest.fixture
+def batch(monkeypatch):
+    import pyresparser
+    models = types.ModuleType('pyresparser.models')
+    models.preload = lambda warm_up=True: None
+    resume_parser = types.ModuleType('pyresparser.resume_parser')
+    resume_parser.ResumeParser = StubParser
+    monkeypatch.setitem(sys.modules, 'pyresparser.models', models)
+    monkeypatch.setitem(sys.modules, 'pyresparser.resume_parser', resume_parser)
+    monkeypatch.setattr(pyresparser, 'models', models, raising=False)
+    monkeypatch.setattr(pyresparser, 'resume_parser', resume_parser, raising=False)
+    sys.modules.pop('pyresparser.batch', None)
+    yield importlib.import_module('pyresparser.batch')
+    sys.modules.pop('pyresparser.batch', None)
+
+
+def make_resumes(directory, names):
+    for name in names:
+        (directory / name).write_bytes(b'%PDF-1.4 stub')
+    return [str(directory / name) for name in names]
+
+
+def read_records(path):
+    """Every complete record of a JSONL output file"""
+    records = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                pass
+    return records
+
+
+def test_timed_out_and_failed_files_become_error_records(batch, tmp_path):
+    resumes = tmp_path / 'resumes'
+    resumes.mkdir()
+    make_resumes(resumes, ['a.pdf', 'slow.pdf', 'broken.docx', 'notes.txt'])
+    output = str(tmp_path / 'parsed.jsonl')
+
+    start = time.time()
+    summary = batch.run(str(resumes), output=output, processes=2, timeout=0.5)
+    assert time.time() - start < 5
+
+    assert (summary['parsed'], summary['failed'], summary['skipped']) == (1, 2, 0)
+    assert 'seconds' in summary and 'files_per_second' in summary
+    records = {os.path.basename(record['file']): record for record in read_records(output)}
+    assert set(records) == {'a.pdf', 'slow.pdf', 'broken.docx'}
+    assert records['a.pdf']['data'] == {'name': 'a.pdf'}
+    assert records['slow.pdf']['error'].startswith('FileTimeout')
+    assert records['broken.docx']['error'] == 'ValueError: unreadable file'
+
+
+def test_resumed_run_skips_checkpointed_files(batch, tmp_path):
+    resumes = tmp_path / 'resumes'
+    resumes.mkdir()
+    a, b, broken = make_resumes(resumes, ['a.pdf', 'b.pdf', 'broken.pdf'])
+    output = tmp_path / 'parsed.jsonl'
+    # a previous run recorded a.pdf and a failure, then died in the middle of a record
+    output.write_text(json.dumps({'file': a, 'data': {'name': 'a.pdf'}}) + '\n' +
+                      json.dumps({'file': broken, 'error': 'ValueError: unreadable file'}) + '\n' +
+                      '{"file": "' + b, encoding='utf-8')
+
+    summary = batch.run(str(resumes), output=str(output), processes=1, resume=True)
+    assert (summary['parsed'], summary['failed'], summary['skipped']) == (1, 0, 2)
+    lines = output.read_text(encoding='utf-8').splitlines()
+    assert lines[2] == '{"file": "' + b and json.loads(lines[3])['file'] == b
+
+    summary = batch.run(str(resumes), output=str(output), processes=1, resume=True, retry_errors=True)
+    assert (summary['parsed'], summary['failed'], summary['skipped']) == (0, 1, 2)
+    assert [record['file'] for record in read_records(output)].count(broken) == 2
+
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Tests for the MySQL connection pool, using fake connections
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pymysql
+import pytest
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+import db
+
+
+class FakeConnection:
+    def __init__(self, schema_version=0):
+        self.closed = False
+        self.pings = 0
+        self.rollbacks = 0
+        self.statements = []
+        self.batches = []
+        self.schema_version = schema_version
+
+    def ping(self, reconnect=False):
+        self.pings += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def commit(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def cursor(self):
+        conn = self
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, sql, params=None):
+                conn.statements.append(sql)
+
+            def executemany(self, sql, rows):
+                conn.batches.append(list(rows))
+
+            def fetchone(self):
+                last = conn.statements[-1]
+                if 'GET_LOCK' in last:
+                    return (1,)
+                if 'FROM schema_version' in last:
+                    return (conn.schema_version,)
+                if 'information_schema.columns' in last:
+                    return ('varchar',)
+                return (0,)
+
+            def fetchall(self):
+                return []
+
+        return Cursor()
+
+
+def make_pool(**kwargs):
+    made = []
+
+    def connect():
+        made.append(FakeConnection())
+        return made[-1]
+
+    return db.ConnectionPool(connect, **kwargs), made
+
+
+def test_connections_are_reused():
+    pool, made = make_pool()
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert first is second and len(made) == 1
+
+
+def test_pool_is_bounded_and_waits_for_a_free_connection():
+    pool, made = make_pool(max_size=2, timeout=0.1)
+    with pool.connection(), pool.connection():
+        with pytest.raises(db.PoolTimeout):
+            with pool.connection():
+                pass
+
+    pool.timeout = 2
+    held = pool._acquire()
+    other = pool._acquire()
+    threading.Timer(0.05, pool._release, args=(held,)).start()
+    with pool.connection() as conn:
+        assert conn is held
+    pool._release(other)
+    assert len(made) == 2
+
+
+def test_idle_connections_are_pinged_before_reuse():
+    pool, made = make_pool(ping_after=0)
+    with pool.connection():
+        pass
+    time.sleep(0.01)
+    with pool.connection() as conn:
+        assert conn.pings == 1
+
+
+def test_broken_connections_are_dropped_and_failed_work_rolled_back():
+    pool, made = make_pool()
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            raise ValueError('bad row')
+    assert conn.rollbacks == 1 and not conn.closed
+
+    with pytest.raises(pymysql.err.OperationalError):
+        with pool.connection() as conn:
+            raise pymysql.err.OperationalError(2013, 'Lost connection')
+    assert conn.closed
+    with pool.connection() as fresh:
+        assert fresh is not conn
+    assert len(made) == 2
+
+
+def test_reads_end_their_transaction_before_the_connection_is_reused(monkeypatch):
+    """Otherwise the next borrower would keep reading the first read's snapshot"""
+    pool, made = make_pool()
+    monkeypatch.setattr(db, '_pool', pool)
+    db.fetchall('SELECT COUNT(*) FROM user_data')
+    assert made[0].rollbacks == 1
+    db.fetchall('SELECT COUNT(*) FROM user_data')
+    assert len(made) == 1 and made[0].rollbacks == 2
+
+
+def test_bootstrap_creates_database_and_applies_migrations():
+    conn = FakeConnection()
+    assert db.bootstrap_schema(conn, 'cv') == [version for version, _ in db.MIGRATIONS]
+    assert conn.statements[:2] == ['CREATE DATABASE IF NOT EXISTS `cv`', 'USE `cv`']
+    assert 'GET_LOCK' in conn.statements[2] and 'RELEASE_LOCK' in conn.statements[-1]
+    assert any(statement.startswith('ALTER TABLE user_data ADD UNIQUE KEY') for statement in conn.statements)
+    typed = next(statement for statement in conn.statements if 'MODIFY resume_score DECIMAL' in statement)
+    assert "ENUM('Data Science'" in typed and 'ADD INDEX idx_user_data_timestamp (Timestamp)' in typed
+    assert any('CHANGE COLUMN created_at Timestamp DATETIME' in statement for statement in conn.statements)
+    assert any('CREATE TABLE IF NOT EXISTS user_skills' in statement for statement in conn.statements)
+
+
+def test_bootstrap_skips_applied_migrations():
+    conn = FakeConnection(schema_version=db.MIGRATIONS[-1][0])
+    assert db.bootstrap_schema(conn, 'cv') == []
+    assert not any('user_data' in statement for statement in conn.statements)
+
+
+def test_enums_cover_every_field_and_level_the_pipeline_produces():
+    analysis_pipeline = pytest.importorskip('analysis_pipeline')
+    assert {field for field, _, _ in analysis_pipeline.FIELDS} | {''} == set(db.FIELDS)
+    levels = {analysis_pipeline.detect_experience_level(text, pages)
+              for text, pages in [('', 0), ('', 1), ('Internship', 1), ('Work Experience', 2)]}
+    assert levels <= set(db.LEVELS)
+
+
+def test_parse_skills():
+    assert db.parse_skills("['Python', 'SQL ', 'python', '']") == ['python', 'sql']
+    assert db.parse_skills(b"['C++']") == ['c++']
+    assert db.parse_skills('Python, SQL') == []
+    assert db.parse_skills("{'a': 1}") == []
+
+
+def test_user_data_writer_also_writes_skills():
+    pool, made = make_pool()
+    writer = db.UserDataWriter(pool=pool, flush_interval=0.01)
+    row = dict.fromkeys(db.USER_DATA_COLUMNS, '')
+    row.update(sec_token='tok', Actual_skills="['Python', 'SQL']")
+    writer.submit(tuple(row.values()))
+    writer.flush()
+    writer.close()
+    assert made[0].batches == [[tuple(row.values())], [('python', 'tok'), ('sql', 'tok')]]
+
+
+def test_only_repeated_rows_are_skipped():
+    """Duplicate keys are skipped, but truncation and range errors still raise instead of becoming warnings"""
+    for sql, key in [(db.INSERT_USER_DATA, 'sec_token'), (db.INSERT_USER_SKILL, 'skill')]:
+        assert 'IGNORE' not in sql
+        assert sql.endswith(f'ON DUPLICATE KEY UPDATE {key} = {key}')
+
+
+def test_schema_is_bootstrapped_once_per_process(monkeypatch):
+    connections = []
+    monkeypatch.setattr(db, 'connect', lambda database=db.DB_NAME: connections.append(FakeConnection()) or connections[-1])
+    monkeypatch.setattr(db, '_pool', None)
+    assert db.pool() is db.pool()
+    assert len(connections) == 1 and connections[0].closed
+    assert connections[0].statements[0].startswith('CREATE DATABASE')
+
+
+def test_write_behind_batches_rows_off_the_caller_thread():
+    pool, made = make_pool()
+    writer = db.WriteBehind('INSERT IGNORE INTO t VALUES (%s)', pool=pool, batch_size=3, flush_interval=0.05)
+    for i in range(7):
+        writer.submit((i,))
+    writer.flush()
+    batches = [batch for conn in made for batch in conn.batches]
+    assert sorted(row for batch in batches for row in batch) == [(i,) for i in range(7)]
+    assert all(len(batch) <= 3 for batch in batches) and len(batches) >= 3
+    assert writer.written == 7
+    writer.close()
+    # after shutdown rows are written synchronously
+    writer.submit((7,))
+    assert writer.written == 8
+
+
+def test_write_behind_applies_backpressure_when_full():
+    """A full queue makes the caller write its own row instead of dropping it"""
+    pool, made = make_pool()
+    writer = db.WriteBehind('INSERT', pool=pool, batch_size=1, max_queue=1, put_timeout=0.2)
+    release = threading.Event()
+    original = writer._write
+    writer._write = lambda rows: (release.wait(2) if threading.current_thread() is writer._thread else None, original(rows))
+    for i in range(4):
+        writer.submit((i,))
+    assert writer.written == 2  # one row is being written, one is queued, two were written inline
+    release.set()
+    writer.flush()
+    writer.close()
+    assert writer.written == 4
+
+
+def test_write_behind_retries_then_gives_up(monkeypatch):
+    monkeypatch.setattr(db.time, 'sleep', lambda seconds: None)
+    attempts = []
+
+    class FailingPool:
+        @staticmethod
+        def connection():
+            attempts.append(1)
+            raise pymysql.err.OperationalError(2003, "Can't connect")
+
+    writer = db.WriteBehind('INSERT', pool=FailingPool(), retries=2, flush_interval=0.01)
+    writer.submit((1,))
+    writer.flush()
+    writer.close()
+    assert len(attempts) == 3 and writer.failed == 1
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the TTL cache in front of the job scrapers
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+from job_cache import JobCache
+
+JOBS = [{'title': 'Python Developer', 'company': 'Acme', 'location': 'Remote', 'link': 'https://example.com'}]
+
+
+class CountingFetch:
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.jobs
+
+
+def test_normalized_queries_share_an_entry():
+    """'  Python ' and 'python' hit the same cached result"""
+    cache = JobCache()
+    fetch = CountingFetch(JOBS)
+    assert cache.get_or_fetch('indeed', 'python', '', fetch) == JOBS
+    assert cache.get_or_fetch('indeed', '  Python ', '', fetch) == JOBS
+    assert fetch.calls == 1
+
+
+def test_stale_entry_is_served_while_revalidating():
+    """An expired entry is returned at once and refreshed in the background"""
+    cache = JobCache(ttls={'indeed': 0.05}, stale_ttl=60)
+    cache.get_or_fetch('indeed', 'python', '', CountingFetch(JOBS))
+    time.sleep(0.1)
+    newer = [dict(JOBS[0], title='Senior Python Developer')]
+    refresh = CountingFetch(newer)
+    assert cache.get_or_fetch('indeed', 'python', '', refresh) == JOBS
+    for _ in range(50):
+        if refresh.calls:
+            break
+        time.sleep(0.01)
+    time.sleep(0.05)
+    assert refresh.calls == 1
+    assert cache.get_or_fetch('indeed', 'python', '', refresh) == newer
+
+
+def test_sqlite_backing_survives_restart():
+    """A new cache on the same database serves earlier results"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'jobs.sqlite')
+        first = JobCache(db_path=db_path)
+        first.get_or_fetch('merojob', 'java', '', CountingFetch(JOBS))
+        first.close()
+        second = JobCache(db_path=db_path)
+        fetch = CountingFetch([])
+        assert second.get_or_fetch('merojob', 'java', '', fetch) == JOBS
+        second.close()
+        assert fetch.calls == 0
+
+
+def test_sqlite_backing_is_bounded():
+    """Rows too old to serve are dropped and only the newest max_db_entries are kept"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = JobCache(ttls={}, default_ttl=0.5, stale_ttl=0, db_path=os.path.join(tmp, 'jobs.sqlite'),
+                         max_db_entries=3)
+        cache.put('indeed', 'old', '', JOBS)
+        time.sleep(0.6)
+        for query in ['python', 'java']:
+            cache.put('indeed', query, '', JOBS)
+        expired = cache._db.execute("SELECT query FROM job_cache ORDER BY fetched_at").fetchall()
+        for query in ['rust', 'go']:
+            cache.put('indeed', query, '', JOBS)
+        trimmed = cache._db.execute("SELECT query FROM job_cache ORDER BY fetched_at").fetchall()
+        cache.close()
+    assert expired == [('python',), ('java',)]
+    assert trimmed == [('java',), ('rust',), ('go',)]
+
+
+def test_concurrent_misses_share_one_fetch():
+    """Sessions missing the same key together wait for a single scrape"""
+    cache = JobCache()
+    release = threading.Event()
+
+    class SlowFetch(CountingFetch):
+        def __call__(self):
+            release.wait(5)
+            return super().__call__()
+
+    fetch = SlowFetch(JOBS)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(cache.get_or_fetch, 'indeed', 'python', '', fetch) for _ in range(8)]
+        time.sleep(0.1)
+        release.set()
+        assert all(future.result() == JOBS for future in futures)
+    assert fetch.calls == 1
+
+
+def test_failed_fetch_is_not_cached():
+    """Waiters see the leader's error and the next call tries again"""
+    cache = JobCache()
+
+    def failing():
+        raise RuntimeError('blocked')
+
+    try:
+        cache.get_or_fetch('indeed', 'python', '', failing)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError('the fetch error was swallowed')
+    fetch = CountingFetch(JOBS)
+    assert cache.get_or_fetch('indeed', 'python', '', fetch) == JOBS
+    assert fetch.calls == 1
+
+
+if __name__ == "__main__":
+    for test in [test_normalized_queries_share_an_entry, test_stale_entry_is_served_while_revalidating,
+                 test_sqlite_backing_survives_restart, test_sqlite_backing_is_bounded,
+                 test_concurrent_misses_share_one_fetch,
+                 test_failed_fetch_is_not_cached]:
+        test()
+        print(f"✅ {test.__name__}")
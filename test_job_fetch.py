@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tests for the job board fetch layer against a local stub HTTP server
+"""
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+import job_recommendation
+import pytest
+
+from http_client import HttpClient, SlotTimeout
+from job_index import JobIndex
+from job_ingest import default_sources, ingest
+
+INDEED_PAGE = """
+<html><body>
+<a class="tapItem" href="/viewjob?jk=1">
+  <h2 class="jobTitle">Stub Python Developer</h2>
+  <span class="companyName">Stub Corp</span>
+  <div class="companyLocation">Remote</div>
+</a>
+</body></html>
+"""
+
+NEPAL_PAGE = """
+<html><body>
+<div class="job-listing">
+  <a class="job-title" href="/job/1">Stub Django Developer</a>
+  <div class="company-name">Stub Nepal</div>
+  <div class="job-location">Kathmandu</div>
+</div>
+</body></html>
+"""
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # keep-alive, so the shared session can reuse connections
+    protocol_version = 'HTTP/1.1'
+    flaky_calls = 0
+    throttled_calls = 0
+
+    def do_GET(self):
+        if self.path.startswith('/slow'):
+            time.sleep(2)
+        if self.path.startswith('/throttled'):
+            StubHandler.throttled_calls += 1
+            if StubHandler.throttled_calls == 1:
+                self.send_response(429)
+                self.send_header('Retry-After', '3600')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        if self.path.startswith('/missing'):
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self.path.startswith('/flaky'):
+            StubHandler.flaky_calls += 1
+            if StubHandler.flaky_calls == 1:
+                self.send_response(503)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        body = (INDEED_PAGE if self.path.startswith('/indeed') else NEPAL_PAGE).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def point_boards_at(monkeypatch, base, indeed='/indeed', jobsnepal='/jobsnepal', merojob='/merojob'):
+    monkeypatch.setattr(job_recommendation, 'INDEED_URL', base + indeed)
+    monkeypatch.setattr(job_recommendation, 'JOBSNEPAL_URL', base + jobsnepal)
+    monkeypatch.setattr(job_recommendation, 'MEROJOB_URL', base + merojob)
+
+
+def test_ingest_from_stub_server(monkeypatch):
+    """The ingestion worker scrapes every source for every query concurrently"""
+    server, base = start_stub_server()
+    try:
+        point_boards_at(monkeypatch, base)
+        index = JobIndex(':memory:')
+        stats = ingest(index, queries=['python', 'django'], sources=default_sources(timeout=5))
+    finally:
+        server.shutdown()
+    assert {name: counts['fetched'] for name, counts in stats.items()} == \
+        {'indeed': 2, 'jobsnepal': 2, 'merojob': 2}
+    # the stub boards return the same posting for every query and both Nepal boards list the Django one
+    assert sorted(job['title'] for job in index.all_jobs()) == ['Stub Django Developer', 'Stub Python Developer']
+    index.close()
+
+
+def test_ingest_respects_deadline(monkeypatch):
+    """Slow boards are skipped once the overall deadline passes, finished ones are kept"""
+    server, base = start_stub_server()
+    try:
+        point_boards_at(monkeypatch, base, jobsnepal='/slow', merojob='/slow')
+        index = JobIndex(':memory:')
+        start = time.time()
+        stats = ingest(index, queries=['python', 'java'], sources=default_sources(timeout=5), deadline=0.5)
+        elapsed = time.time() - start
+    finally:
+        server.shutdown()
+    assert elapsed < 1.5
+    assert stats['indeed'] == {'fetched': 2, 'added': 1, 'late': 0}
+    assert stats['jobsnepal']['late'] == 2 and stats['merojob']['late'] == 2
+    assert [job['title'] for job in index.all_jobs()] == ['Stub Python Developer']
+    index.close()
+
+
+def test_ingest_keeps_other_sources_when_one_fails(monkeypatch):
+    """A board that errors out contributes nothing, the others are still ingested"""
+    server, base = start_stub_server()
+    try:
+        point_boards_at(monkeypatch, base, merojob='/missing')
+        index = JobIndex(':memory:')
+        stats = ingest(index, queries=['python'], sources=default_sources(timeout=5))
+    finally:
+        server.shutdown()
+    assert stats['merojob']['fetched'] == 0
+    assert stats['indeed']['fetched'] == 1 and stats['jobsnepal']['fetched'] == 1
+    index.close()
+
+
+def test_http_client_reuses_connections():
+    """Sequential requests to one host share a keep-alive connection"""
+    server, base = start_stub_server()
+    try:
+        client = HttpClient()
+        for _ in range(5):
+            assert client.get(base + '/indeed').status_code == 200
+        host_stats = client.stats()[base.split('//')[1]]
+    finally:
+        server.shutdown()
+    assert host_stats['requests'] == 5
+    assert host_stats['connections_opened'] == 1
+    assert host_stats['connections_reused'] == 4
+
+
+def test_http_client_retries_server_errors():
+    """A 503 is retried with backoff before the response is returned"""
+    server, base = start_stub_server()
+    try:
+        StubHandler.flaky_calls = 0
+        response = HttpClient(backoff_factor=0).get(base + '/flaky')
+    finally:
+        server.shutdown()
+    assert response.status_code == 200
+    assert StubHandler.flaky_calls == 2
+
+
+def test_http_client_caps_retry_after():
+    """An hour-long Retry-After is clamped to max_retry_wait"""
+    server, base = start_stub_server()
+    try:
+        StubHandler.throttled_calls = 0
+        start = time.monotonic()
+        response = HttpClient(max_retry_wait=0.2).get(base + '/throttled')
+        elapsed = time.monotonic() - start
+    finally:
+        server.shutdown()
+    assert response.status_code == 200 and StubHandler.throttled_calls == 2
+    assert elapsed < 2
+
+
+def test_http_client_slot_wait_ends_at_the_deadline():
+    """With every host slot busy, a request fails fast instead of queueing without limit"""
+    server, base = start_stub_server()
+    try:
+        client = HttpClient(per_host_limit=1)
+        busy = threading.Thread(target=client.get, args=(base + '/slow',))
+        busy.start()
+        time.sleep(0.2)
+        start = time.monotonic()
+        with pytest.raises(SlotTimeout):
+            client.get(base + '/indeed', timeout=0.3)
+        assert time.monotonic() - start < 1
+        busy.join()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    for test in [test_ingest_from_stub_server, test_ingest_respects_deadline,
+                 test_ingest_keeps_other_sources_when_one_fails]:
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            test(monkeypatch)
+        print(f"✅ {test.__name__}")
+    for test in [test_http_client_reuses_connections, test_http_client_retries_server_errors,
+                 test_http_client_caps_retry_after, test_http_client_slot_wait_ends_at_the_deadline]:
+        test()
+        print(f"✅ {test.__name__}")
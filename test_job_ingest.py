@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the job board parsers, the ingestion worker and the local job index.
+Everything runs from the saved HTML pages in fixtures/, no network is used.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+import job_recommendation
+from job_cache import JobCache
+from job_index import JobIndex
+from job_ingest import default_sources, ingest
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def fixture_sources():
+    pages = {
+        'indeed': job_recommendation.parse_indeed_html(read_fixture('indeed_search.html')),
+        'jobsnepal': job_recommendation.parse_jobsnepal_html(read_fixture('jobsnepal_search.html')),
+        'merojob': job_recommendation.parse_merojob_html(read_fixture('merojob_search.html')),
+    }
+    return {name: (lambda query, jobs=jobs: jobs) for name, jobs in pages.items()}
+
+
+def test_parse_indeed_fixture():
+    """Cards without a location are skipped and links are made absolute"""
+    jobs = job_recommendation.parse_indeed_html(read_fixture('indeed_search.html'))
+    assert [job['title'] for job in jobs] == ['Senior Python Developer', 'Machine Learning Engineer']
+    assert jobs[0]['company'] == 'Acme Analytics'
+    assert jobs[0]['link'] == 'https://www.indeed.com/rc/clk?jk=a1b2c3'
+
+
+def test_parse_nepal_fixtures():
+    """JobsNepal and MeroJob markup variants are both understood"""
+    jobsnepal = job_recommendation.parse_jobsnepal_html(read_fixture('jobsnepal_search.html'))
+    assert [job['location'] for job in jobsnepal] == ['Kathmandu', 'Lalitpur']
+    assert jobsnepal[0]['link'] == 'https://www.jobsnepal.com/django-developer-101'
+    merojob = job_recommendation.parse_merojob_html(read_fixture('merojob_search.html'))
+    assert [job['title'] for job in merojob] == ['Python Developer', 'Django Developer']
+
+
+def test_ingest_deduplicates_postings():
+    """The same posting from two boards or two runs is stored once"""
+    index = JobIndex(':memory:')
+    stats = ingest(index, queries=['python', 'django'], sources=fixture_sources())
+    # 6 postings per query, the Django Developer one is listed on two boards
+    assert stats['indeed']['fetched'] == 4
+    assert index.count() == 5
+    assert sum(source['added'] for source in stats.values()) == 5
+    again = ingest(index, queries=['python'], sources=fixture_sources())
+    assert sum(source['added'] for source in again.values()) == 0
+    index.close()
+
+
+def test_search_jobs_reads_only_the_index():
+    """The request path ranks indexed postings and tops up from mock jobs"""
+    index = JobIndex(':memory:')
+    ingest(index, queries=['python'], sources=fixture_sources())
+    results = index.search('django developer')
+    assert results[0]['title'] == 'Django Developer'
+    jobs = job_recommendation.search_jobs(['machine learning'], index=index)
+    assert jobs[0]['title'] == 'Machine Learning Engineer'
+    # one indexed match is not enough, mock jobs fill the rest
+    assert len(jobs) > 1
+    index.close()
+
+
+def test_placeholder_scrapers_are_not_ingested():
+    """job_scraper.py returns the same fake postings for any query, so its boards are not sources"""
+    assert set(default_sources()) == set(job_recommendation.JOB_SOURCES)
+
+
+def test_ingest_skips_boards_scraped_within_their_ttl(monkeypatch):
+    """Through the cache, a second run only re-scrapes boards whose results expired"""
+    calls = []
+
+    def scraper(query, timeout):
+        calls.append(query)
+        return job_recommendation.parse_indeed_html(read_fixture('indeed_search.html'))
+
+    monkeypatch.setattr('job_ingest.JOB_SOURCES', {'indeed': scraper})
+    sources = default_sources(cache=JobCache(stale_ttl=0))
+    index = JobIndex(':memory:')
+    ingest(index, queries=['python', 'Python '], sources=sources)
+    ingest(index, queries=['python'], sources=sources)
+    assert calls == ['python']
+    assert index.count() == 2
+    index.close()
+
+
+if __name__ == "__main__":
+    for test in [test_parse_indeed_fixture, test_parse_nepal_fixtures,
+                 test_ingest_deduplicates_postings, test_search_jobs_reads_only_the_index,
+                 test_placeholder_scrapers_are_not_ingested]:
+        test()
+        print(f"✅ {test.__name__}")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        test_ingest_skips_boards_scraped_within_their_ttl(monkeypatch)
+    print("✅ test_ingest_skips_boards_scraped_within_their_ttl")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the TF-IDF resume to job matcher
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+import job_matcher
+from job_index import JobIndex
+from job_matcher import JobMatcher
+from job_recommendation import recommend_jobs
+
+JOBS = [
+    {'title': 'Python Developer', 'description': 'Django, REST APIs and PostgreSQL'},
+    {'title': 'Data Scientist', 'description': 'Python, pandas, machine learning'},
+    {'title': 'Android Developer', 'description': 'Kotlin and Java mobile apps'},
+    {'title': 'UI/UX Designer', 'description': 'Figma prototypes'},
+]
+
+
+def test_match_ranks_by_skills_and_text():
+    """Skills weigh more than free text and unrelated postings are left out"""
+    matcher = JobMatcher(JOBS)
+    ranked = [job['title'] for job, _ in matcher.match(['machine learning', 'pandas'], 'python', k=4)]
+    assert ranked[:2] == ['Data Scientist', 'Python Developer']
+    assert 'UI/UX Designer' not in ranked
+
+
+def test_match_many_agrees_with_match():
+    """The batched matrix product returns the same rankings as one-at-a-time queries"""
+    matcher = JobMatcher(JOBS)
+    profiles = [(['django'], ''), (['kotlin', 'java'], 'mobile'), ([], 'nothing relevant')]
+    batched = matcher.match_many(profiles, k=3)
+    for (skills, text), result in zip(profiles, batched):
+        single = matcher.match(skills, text, k=3)
+        assert [job['title'] for job, _ in result] == [job['title'] for job, _ in single]
+        assert np.allclose([score for _, score in result], [score for _, score in single])
+    assert batched[2] == []
+
+
+def test_dense_fallback_without_scipy(monkeypatch):
+    """Without SciPy the matcher uses a dense array and scores identically"""
+    sparse_scores = JobMatcher(JOBS).match(['python'], 'machine learning', k=4)
+    monkeypatch.setattr(job_matcher, 'sparse', None)
+    dense = JobMatcher(JOBS)
+    assert isinstance(dense.matrix, np.ndarray)
+    dense_scores = dense.match(['python'], 'machine learning', k=4)
+    assert [job['title'] for job, _ in dense_scores] == [job['title'] for job, _ in sparse_scores]
+    assert np.allclose([s for _, s in dense_scores], [s for _, s in sparse_scores])
+
+
+def test_recommend_jobs_uses_index_and_mock_catalog():
+    """Indexed postings are ranked together with the mock catalog"""
+    index = JobIndex(':memory:')
+    index.upsert([{'title': 'Rust Systems Engineer', 'company': 'Ferris Ltd', 'location': 'Remote',
+                   'description': 'Rust, tokio and embedded systems'}], source='test')
+    jobs = recommend_jobs(['rust', 'tokio'], k=5, index=index)
+    assert jobs[0]['title'] == 'Rust Systems Engineer'
+    assert jobs[0]['score'] > 0
+    assert len({job['title'] for job in jobs}) == len(jobs)
+    index.close()
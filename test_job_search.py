@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the BM25 inverted index behind get_mock_jobs
+"""
+
+import os
+import sys
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+from job_recommendation import get_mock_jobs
+from job_search import InvertedIndex, tokenize
+
+
+def test_tokenize_keeps_language_suffixes():
+    """c++ and c# are not reduced to a bare 'c'"""
+    assert tokenize('C++, C# and Node.js') == ['c++', 'c#', 'and', 'node', 'js']
+
+
+def test_index_ranks_by_relevance():
+    """Documents matching more (and rarer) query terms rank first, ties by order"""
+    index = InvertedIndex([
+        [('python developer', 1)],
+        [('java developer', 1)],
+        [('senior python developer', 1)],
+        [('designer', 1)],
+    ])
+    ranked = [doc_id for doc_id, _ in index.search('python developer', k=3)]
+    assert ranked == [0, 2, 1]
+    assert index.search('cobol') == []
+
+
+def test_mock_jobs_are_ranked_and_deterministic():
+    """Same query, same order; the best match comes first"""
+    first = get_mock_jobs('machine learning')
+    assert first == get_mock_jobs('machine learning')
+    assert first[0]['title'] == 'Machine Learning Engineer'
+    assert len(first) <= 5
+
+
+def test_mock_jobs_fall_back_to_software_developer():
+    """A query matching nothing still gets recommendations"""
+    titles = [job['title'] for job in get_mock_jobs('underwater basket weaving')]
+    assert titles[0] == 'Senior Software Developer'
+
+
+if __name__ == "__main__":
+    for test in [test_tokenize_keeps_language_suffixes, test_index_ranks_by_relevance,
+                 test_mock_jobs_are_ranked_and_deterministic, test_mock_jobs_fall_back_to_software_developer]:
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass keyword matcher used by ResumeScorer
+"""
+
+import os
+import sys
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+from keyword_matcher import KeywordMatcher
+
+
+def test_find_returns_hits_per_vocabulary_in_vocabulary_order():
+    """One scan reports every vocabulary, including terms shared between them"""
+    matcher = KeywordMatcher({
+        'verbs': ['developed', 'led', 'managed'],
+        'skills': ['python', 'machine learning', 'r'],
+        'data_science': ['r', 'python', 'statistics'],
+    })
+    hits = matcher.find('Managed a team and Developed Python and R models for machine learning.')
+    assert hits == {
+        'verbs': ['developed', 'managed'],
+        'skills': ['python', 'machine learning', 'r'],
+        'data_science': ['r', 'python'],
+    }
+
+
+def test_matches_respect_word_boundaries():
+    """Substrings inside longer words are not counted"""
+    matcher = KeywordMatcher({'terms': ['r', 'led', 'java', 'node.js', 'node']})
+    assert matcher.find('Skilled Docker user, javascript tooling')['terms'] == []
+    assert matcher.find('Built APIs in Node.js; R (stats)')['terms'] == ['r', 'node.js', 'node']
+
+
+def test_overlapping_and_nested_terms():
+    """Failure links find terms that end inside or overlap other terms"""
+    matcher = KeywordMatcher({'terms': ['data', 'data science', 'science', 'big data science']})
+    assert matcher.find('big data science team')['terms'] == ['data', 'data science', 'science', 'big data science']
+    assert matcher.find('data scientist')['terms'] == ['data']
+    assert matcher.find('')['terms'] == []
@@ -15,19 +15,20 @@ def test_spacy_model_loading():
     print("Testing spaCy model loading...")
     
     try:
-        # Import spacy and test model loading directly
-        import spacy
+        # Load the model through the pyresparser model registry
+        from pyresparser import models
         
         # Test loading the model
-        nlp1 = spacy.load('en_core_web_sm')
+        nlp1 = models.get_nlp()
         print("✅ spaCy model loaded successfully")
         
         # Test loading again to see if it's cached
-        nlp2 = spacy.load('en_core_web_sm')
+        nlp2 = models.get_nlp()
         if nlp1 is nlp2:
             print("✅ Model is reused (cached)")
         else:
-            print("⚠️  Model is not cached (this is normal for spaCy)")
+            print("❌ Model registry loaded the model twice")
+            return False
             
     except Exception as e:
         print(f"❌ Error during spaCy testing: {e}")
@@ -102,10 +103,10 @@ def main():
     if success:
         print("✅ All tests passed! Memory fix should work correctly.")
         print("\nKey improvements made:")
-        print("- spaCy model is loaded only once using singleton pattern")
+        print("- spaCy models are loaded only once per process by the pyresparser model registry")
         print("- Memory cleanup is performed after resume parsing")
         print("- Error handling for memory errors")
-        print("- Monkey-patched ResumeParser to reuse loaded model")
+        print("- ResumeParser reuses the registry models instead of reloading them")
     else:
         print("❌ Some tests failed. Please check the implementation.")
     
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared precompiled regular expressions
+"""
+
+import os
+import re
+import sys
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+import patterns
+
+
+def sequential_section(line):
+    """Section detection as it worked before the combined pattern"""
+    for name, pattern in patterns.SECTION_PATTERNS.items():
+        if re.search(pattern, line, re.IGNORECASE):
+            return name
+    return None
+
+
+def test_combined_section_pattern_keeps_priority_order():
+    """The first section in SECTION_PATTERNS mentioned in a line wins, not the leftmost word"""
+    lines = [
+        'WORK EXPERIENCE', 'Education and professional experience', 'Technical Skills',
+        'Hobbies and languages', 'Email: jane@example.com', 'Awards', 'Community service',
+        'Built a REST API in Flask', '', 'Volunteering at the local library, portfolio online',
+        'Language skills', 'Work samples and projects',
+    ]
+    for line in lines:
+        assert patterns.detect_section(line) == sequential_section(line), line
+    assert patterns.detect_section('Education and professional experience') == 'experience'
+    assert patterns.detect_section('Built a REST API in Flask') is None
+
+
+def test_headings_are_lines_that_only_name_a_section():
+    for line, section in [('EXPERIENCE', 'experience'), ('Professional Summary', 'summary'),
+                          ('Technical Skills:', 'skills'), ('Contact Information', 'contact'),
+                          ('Awards & Honors', 'achievements'), ('Language Skills', 'languages')]:
+        assert patterns.detect_heading(line) == section, line
+    for line in ['Email: jane@example.com', 'Phone: +1 555-123-4567', 'Location: Berlin',
+                 'Backend engineer with 6 years of experience', "Bachelor's degree in Computer Science, 2016"]:
+        assert patterns.detect_heading(line) is None, line
+
+
+def test_shared_patterns():
+    text = 'Reach me at jane.doe@example.com or +1 555-123-4567. Cut costs by 25% in 2 years.'
+    assert patterns.EMAIL.search(text).group() == 'jane.doe@example.com'
+    assert patterns.PHONE.search(text)
+    assert patterns.NUMBER.findall('Cut costs by 25% in 2.5 years') == ['25', '2.5']
+    assert patterns.HEADER.match('SKILLS') and not patterns.HEADER.match('Skills')
+    assert patterns.BULLET.match('• Led a team') and patterns.BULLET.match('- Led a team')
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for pyresparser's bulk parse_many(), using stub spaCy pipelines and
+extractors so only the batching and streaming are exercised
+"""
+
+import importlib
+import itertools
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+STUBBED = ('spacy', 'spacy.matcher', 'pyresparser.utils', 'pyresparser.models',
+           'pyresparser.document', 'pyresparser.resume_parser')
+
+
+class StubDoc:
+    def __init__(self, text):
+        self.text = text
+        self.noun_chunks = []
+
+
+class StubPipeline:
+    """Lazy like nlp.pipe: reads `batch_size` texts, yields their docs, then reads more"""
+    pipe_names = ['tagger', 'parser', 'ner']
+    vocab = None
+
+    def __call__(self, text, disable=()):
+        return StubDoc(text)
+
+    def pipe(self, texts, batch_size=32, n_process=1, disable=()):
+        texts = iter(texts)
+        while True:
+            batch = list(itertools.islice(texts, batch_size))
+            if not batch:
+                return
+            for text in batch:
+                yield StubDoc(text)
+
+
+def stub_utils(counters):
+    utils = types.ModuleType('pyresparser.utils')
+
+    def extract_text(path, ext):
+        counters['loaded'] += 1
+        counters['peak'] = max(counters['peak'], counters['loaded'] - counters['parsed'])
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    def extract_skills(nlp_doc, noun_chunks, skills_file=None):
+        counters['parsed'] += 1
+        return sorted(set(nlp_doc.text.lower().split()))
+
+    utils.extract_text = extract_text
+    utils.extract_skills = extract_skills
+    utils.extract_entities_wih_custom_model = lambda custom_doc: {'Name': custom_doc.text.split('\n')[:1]}
+    utils.extract_name = lambda nlp_doc, matcher=None: None
+    utils.extract_email = lambda text: next((word for word in text.split() if '@' in word), None)
+    utils.extract_mobile_number = lambda text, custom_regex=None: None
+    utils.extract_entity_sections_grad = lambda text: {}
+    return utils
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    import pyresparser
+    counters = {'loaded': 0, 'parsed': 0, 'peak': 0}
+    spacy = types.ModuleType('spacy')
+    matcher = types.ModuleType('spacy.matcher')
+    matcher.Matcher = lambda vocab: None
+    spacy.matcher = matcher
+    models = types.ModuleType('pyresparser.models')
+    base, custom = StubPipeline(), StubPipeline()
+    models.get_nlp = lambda: base
+    models.get_custom_nlp = lambda: custom
+    models.base_disabled = models.custom_disabled = lambda: []
+    utils = stub_utils(counters)
+
+    saved = {name: sys.modules.get(name) for name in STUBBED}
+    sys.modules.update({'spacy': spacy, 'spacy.matcher': matcher, 'pyresparser.utils': utils,
+                        'pyresparser.models': models})
+    sys.modules.pop('pyresparser.document', None)
+    sys.modules.pop('pyresparser.resume_parser', None)
+    monkeypatch.setattr(pyresparser, 'utils', utils, raising=False)
+    monkeypatch.setattr(pyresparser, 'models', models, raising=False)
+    try:
+        module = importlib.import_module('pyresparser.resume_parser')
+        yield module, counters
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+def write_resumes(directory, count):
+    paths = []
+    for i in range(count):
+        path = directory / f'resume{i}.txt'
+        path.write_text(f'Candidate {i}\nEmail candidate{i}@example.com\nPython SQL skill{i}\n', encoding='utf-8')
+        paths.append(str(path))
+    return paths
+
+
+def test_parse_many_matches_parsing_one_by_one(parser, tmp_path):
+    resume_parser, _ = parser
+    paths = write_resumes(tmp_path, 7)
+    batched = resume_parser.parse_many(paths, batch_size=3)
+    assert batched == [resume_parser.ResumeParser(path).get_extracted_data() for path in paths]
+    assert batched[5]['name'] == 'Candidate 5' and batched[5]['email'] == 'candidate5@example.com'
+
+
+def test_parse_many_streams_documents(parser, tmp_path):
+    """Only about one batch of documents is loaded ahead of the parser"""
+    resume_parser, counters = parser
+    paths = write_resumes(tmp_path, 40)
+    results = resume_parser.parse_many(iter(paths), batch_size=4)
+    assert len(results) == 40 and counters['loaded'] == 40
+    assert counters['peak'] <= 5
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Tests for ResumeScorer dependency loading and batch scoring
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'App')
+
+# Add the App directory to the path
+sys.path.append(APP_DIR)
+
+import resume_scorer
+
+
+def test_import_and_construction_load_no_nlp_libraries():
+    """Creating a scorer neither imports NLTK/spaCy nor downloads data"""
+    code = (
+        "import sys, resume_scorer; resume_scorer.ResumeScorer(); "
+        "print(sorted(m for m in ('nltk', 'spacy') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=APP_DIR,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'
+
+
+def test_missing_nltk_data_fails_fast(monkeypatch):
+    """Missing tokenizer data raises a LookupError naming the package"""
+    import nltk
+
+    def missing(path):
+        raise LookupError(path)
+
+    monkeypatch.setattr(nltk.data, 'find', missing)
+    monkeypatch.setattr(nltk, 'download', lambda *args, **kwargs: pytest.fail('downloaded NLTK data'))
+    monkeypatch.setattr(resume_scorer, '_resources', {})
+    with pytest.raises(LookupError, match='nltk.downloader punkt'):
+        resume_scorer.ResumeScorer().calculate_overall_score('Developed a Python service.')
+
+
+def test_resources_are_shared_between_scorers(monkeypatch):
+    """Each resource is loaded once per process"""
+    loads = []
+    monkeypatch.setattr(resume_scorer, '_resources', {})
+    monkeypatch.setattr(resume_scorer, '_load_stop_words', lambda: loads.append(1) or frozenset({'the'}))
+    assert resume_scorer.ResumeScorer().stop_words is resume_scorer.ResumeScorer().stop_words
+    assert loads == [1]
+
+
+def _simple_tokenizers(monkeypatch):
+    """Whitespace tokenizers standing in for the punkt data, which may not be installed"""
+    def sent_tokenize(text):
+        return [sentence.strip() for sentence in text.split('.') if sentence.strip()]
+
+    def word_tokenize(text):
+        return [word for sentence in sent_tokenize(text) for word in sentence.split()]
+
+    monkeypatch.setattr(resume_scorer, '_resources', {'tokenizers': (sent_tokenize, word_tokenize)})
+
+
+RESUMES = [
+    'Experience. Developed and deployed Python services. Led a team of 5 engineers.',
+    'Skills. Figma, prototyping, user research and wireframing. Certifications in design.',
+    'Managed SQL and pandas pipelines, increased throughput by 40%. Machine learning with R.',
+]
+
+
+def test_score_columns_holds_one_array_per_component(monkeypatch):
+    """Columns line up with the one-at-a-time results"""
+    _simple_tokenizers(monkeypatch)
+    scorer = resume_scorer.ResumeScorer()
+    columns = scorer.score_columns(RESUMES)
+    singles = [scorer.calculate_overall_score(text) for text in RESUMES]
+    assert len(columns) == 3
+    assert set(columns.components) == set(resume_scorer.COMPONENTS)
+    for name in resume_scorer.COMPONENTS:
+        assert columns.components[name].tolist() == [r['component_scores'][name] for r in singles]
+    assert columns.overall.tolist() == [r['overall_score'] for r in singles]
+    assert columns.grades == [r['grade'] for r in singles]
+    assert columns.details == [r['detailed_analysis'] for r in singles]
+
+
+def test_score_many_in_worker_processes_keeps_order_and_weights(monkeypatch):
+    """Workers use the caller's weights and results stream back in input order"""
+    import multiprocessing as mp
+    if mp.get_start_method() != 'fork':
+        pytest.skip('worker processes inherit the patched tokenizers via fork')
+    _simple_tokenizers(monkeypatch)
+    scorer = resume_scorer.ResumeScorer()
+    scorer.weights = dict.fromkeys(scorer.weights, 0.0)
+    scorer.weights['action_verbs'] = 1.0
+    texts = RESUMES * 4
+    results = list(scorer.score_many(texts, workers=2, chunksize=2))
+    assert [r['overall_score'] for r in results] == [r['overall_score'] for r in map(scorer.calculate_overall_score, texts)]
+    assert [r['overall_score'] for r in results] == [r['component_scores']['action_verbs'] for r in results]
+
+
+def test_reweight_matches_rescoring_and_survives_save_load(monkeypatch, tmp_path):
+    """Vectorized re-weighting of stored columns equals scoring again with the new weights"""
+    _simple_tokenizers(monkeypatch)
+    scorer = resume_scorer.ResumeScorer()
+    path = str(tmp_path / 'scores.npz')
+    scorer.score_columns(RESUMES).save(path)
+    columns = resume_scorer.ScoreColumns.load(path)
+
+    weights = dict(scorer.weights, skills_analysis=0.5, industry_specific=0.4, content_completeness=0.0)
+    reweighted = scorer.reweight(columns, weights)
+    scorer.weights = weights
+    expected = [scorer.calculate_overall_score(text) for text in RESUMES]
+
+    assert reweighted['overall_score'].tolist() == [r['overall_score'] for r in expected]
+    assert reweighted['grade'].tolist() == [r['grade'] for r in expected]
+    assert reweighted['grade_description'].tolist() == [r['grade_description'] for r in expected]
+    assert reweighted['recommendations'] == [r['recommendations'] for r in expected]
+    assert columns.details == [r['detailed_analysis'] for r in expected]
+
+
+def test_saved_details_take_their_own_length(tmp_path):
+    """Details are stored as variable-length bytes, not padded to the longest document"""
+    short, long = {'a': 1}, {'text': 'x' * 10000}
+    columns = resume_scorer.ScoreColumns(
+        {name: np.zeros(3) for name in resume_scorer.COMPONENTS}, np.zeros(3), ['D'] * 3, [short, long, short]
+    )
+    path = str(tmp_path / 'scores.npz')
+    columns.save(path)
+    with np.load(path) as data:
+        assert data['details'].dtype == np.uint8
+        assert data['details'].size == 2 * len('{"a": 1}') + len(json.dumps(long))
+    assert resume_scorer.ScoreColumns.load(path).details == [short, long, short]
+
+
+def test_grade_for_boundaries():
+    assert resume_scorer.grade_for(90) == ('A+', 'Excellent')
+    assert resume_scorer.grade_for(89.99) == ('A', 'Very Good')
+    assert resume_scorer.grade_for(0) == ('D', 'Needs Improvement')
+
+
+LAYOUT_RESUME = (
+    'Jane Doe\n'
+    'jane.doe@example.com | +1 555-123-4567\n'
+    '\n'
+    'EXPERIENCE\n'
+    '• Developed   Python services used by 2 teams.\n'
+    '• Led the migration to Docker and AWS.\n'
+    '\f'
+    'SKILLS\n'
+    'Python, SQL, Docker, leadership, communication\n'
+)
+
+
+def test_layout_preprocessing_keeps_lines(monkeypatch):
+    """Layout mode keeps case, blank lines, bullets and contact characters"""
+    scorer = resume_scorer.ResumeScorer()
+    processed = scorer.preprocess_text(LAYOUT_RESUME, keep_lines=True)
+    assert processed.split('\n')[:5] == [
+        'Jane Doe', 'jane.doe@example.com +1 555-123-4567',
+        '', 'EXPERIENCE', '• Developed Python services used by 2 teams.',
+    ]
+    assert 'SKILLS' in processed.split('\n')
+    # the default mode still flattens everything into one lowercase line
+    assert '\n' not in scorer.preprocess_text(LAYOUT_RESUME)
+
+
+def test_layout_mode_detects_sections_and_structure(monkeypatch):
+    """Sections, headers, bullets and contact details are found line by line"""
+    _simple_tokenizers(monkeypatch)
+    scorer = resume_scorer.ResumeScorer()
+    result = scorer.calculate_overall_score(LAYOUT_RESUME, keep_lines=True)
+    assert result['sections_found'] == ['general', 'experience', 'skills']
+    details = result['detailed_analysis']
+    assert details['structure']['headers_found'] == 2
+    assert details['structure']['bullets_found'] == 2
+    assert details['completeness']['has_email'] and details['completeness']['has_phone']
+    assert details['action_verbs']['action_verbs_found'] == ['developed', 'led']
+
+    flat = scorer.calculate_overall_score(LAYOUT_RESUME)
+    assert flat['detailed_analysis']['structure']['bullets_found'] == 0
+
+
+def test_long_lines_are_not_section_headers():
+    scorer = resume_scorer.ResumeScorer()
+    body = 'Worked on the education platform with a team of engineers for three years'
+    assert scorer.extract_sections('EDUCATION\n' + body, headings_only=True) == {'education': body}
+
+
+REALISTIC_RESUME = (
+    'Jane Doe\n'
+    'Email: jane.doe@example.com\n'
+    'Phone: +1 555-123-4567\n'
+    'Location: Berlin\n'
+    '\n'
+    'Professional Summary\n'
+    'Backend engineer with 6 years of experience in Python.\n'
+    '\n'
+    'Work Experience\n'
+    '• Developed payment services for the online education team.\n'
+    '\n'
+    'Education\n'
+    "Bachelor's degree in Computer Science, 2016\n"
+    '\n'
+    'Technical Skills:\n'
+    'Python, SQL, Docker\n'
+)
+
+
+def test_layout_mode_keeps_contact_lines_and_prose_with_section_words(monkeypatch):
+    """Only lines that are just a heading start a section, so their content is not lost"""
+    _simple_tokenizers(monkeypatch)
+    scorer = resume_scorer.ResumeScorer()
+    sections = scorer.analyze_text(REALISTIC_RESUME, keep_lines=True).sections
+    assert list(sections) == ['general', 'summary', 'experience', 'education', 'skills']
+    assert 'jane.doe@example.com' in sections['general'] and 'Location: Berlin' in sections['general']
+    assert sections['summary'] == 'Backend engineer with 6 years of experience in Python.'
+    # layout preprocessing drops the apostrophe
+    assert sections['education'] == 'Bachelors degree in Computer Science, 2016'
+    details = scorer.calculate_overall_score(REALISTIC_RESUME, keep_lines=True)['detailed_analysis']
+    assert details['completeness']['has_email'] and details['completeness']['has_phone']
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the paginated user_data browser and the chunked exports, using fake connections
+"""
+
+import csv
+import datetime
+import os
+import sys
+import tempfile
+from decimal import Decimal
+
+import pymysql
+import pytest
+
+# Add the App directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'App'))
+
+import db
+import user_browser
+from user_browser import UserFilter
+
+
+def make_row(row_id):
+    row = dict.fromkeys((column for column, _ in user_browser.COLUMNS), 'x')
+    row.update(ID=row_id, resume_score=Decimal('72.50'), Page_no=2,
+               Timestamp=datetime.datetime(2024, 5, 1, 12, 30))
+    return tuple(row.values())
+
+
+class StreamingConnection:
+    """Serves `rows` from an unbuffered cursor and records how they were fetched"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.cursor_classes = []
+        self.statements = []
+        self.fetches = []
+
+    def ping(self, reconnect=False):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def cursor(self, cursor_class=None):
+        conn = self
+        conn.cursor_classes.append(cursor_class)
+        position = [0]
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, sql, params=None):
+                conn.statements.append((sql, params))
+
+            def fetchmany(self, size):
+                rows = conn.rows[position[0]:position[0] + size]
+                position[0] += size
+                conn.fetches.append(len(rows))
+                return rows
+
+        return Cursor()
+
+
+def test_filters_become_indexed_conditions():
+    where, params = UserFilter(date_from=datetime.date(2024, 5, 1), date_to=datetime.date(2024, 5, 31),
+                               fields=['Data Science', 'NA'], min_score=50).where(before_id=100)
+    assert where == (" WHERE ID < %s AND Timestamp >= %s AND Timestamp < %s"
+                     " AND Predicted_Field IN (%s, %s) AND resume_score >= %s")
+    assert params == [100, datetime.datetime(2024, 5, 1), datetime.datetime(2024, 6, 1), 'Data Science', 'NA', 50]
+    assert UserFilter().where() == ('', [])
+
+
+def test_pages_are_fetched_by_keyset():
+    queries = []
+
+    def fetchall(sql, params=None):
+        queries.append((sql, params))
+        return [make_row(9), make_row(8)]
+
+    rows = user_browser.fetch_page(UserFilter(max_score=80), before_id=10, page_size=2, fetchall=fetchall)
+    assert [row[0] for row in rows] == [9, 8]
+    sql, params = queries[0]
+    assert sql.endswith(" FROM user_data WHERE ID < %s AND resume_score <= %s ORDER BY ID DESC LIMIT %s")
+    assert 'OFFSET' not in sql and params == [10, 80, 2]
+
+
+def test_count_uses_the_same_filters():
+    queries = []
+    total = user_browser.count(UserFilter(fields=['NA']),
+                               fetchall=lambda sql, params: queries.append((sql, params)) or [(3,)])
+    assert total == 3
+    assert queries == [("SELECT COUNT(*) FROM user_data WHERE Predicted_Field IN (%s)", ['NA'])]
+
+
+def test_csv_export_streams_from_a_server_side_cursor():
+    conn = StreamingConnection([make_row(i) for i in range(7, 0, -1)])
+    pool = db.ConnectionPool(lambda: conn)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'users.csv')
+        assert user_browser.export(UserFilter(), path, 'csv', chunk_size=3, pool=pool) == 7
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+    assert conn.cursor_classes == [pymysql.cursors.SSCursor]
+    assert conn.fetches == [3, 3, 1, 0]
+    assert rows[0] == user_browser.HEADERS and [row[0] for row in rows[1:]] == ['7', '6', '5', '4', '3', '2', '1']
+
+
+def test_parquet_export_writes_one_row_group_per_chunk():
+    pq = pytest.importorskip('pyarrow.parquet')
+    conn = StreamingConnection([make_row(i) for i in range(5, 0, -1)])
+    path, exported = user_browser.export_to_tempfile(UserFilter(), 'parquet', chunk_size=2,
+                                                     pool=db.ConnectionPool(lambda: conn))
+    try:
+        parquet = pq.ParquetFile(path)
+        assert exported == 5 and parquet.metadata.num_row_groups == 3
+        table = parquet.read()
+        assert table.column('ID').to_pylist() == [5, 4, 3, 2, 1]
+        assert table.column('Resume Score').to_pylist()[0] == Decimal('72.50')
+    finally:
+        os.remove(path)
+
+
+def test_unknown_export_format_is_rejected():
+    with pytest.raises(ValueError):
+        user_browser.export(UserFilter(), 'users.xlsx', 'xlsx', pool=db.ConnectionPool(lambda: None))